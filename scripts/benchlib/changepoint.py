@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import random
+import statistics
+
+
+def cusum_split(values: list[float]) -> tuple[int | None, float]:
+    """Return (split index, max |CUSUM|) for the most likely single mean shift."""
+    if len(values) < 2:
+        return None, 0.0
+    mean = statistics.fmean(values)
+    running = 0.0
+    best_index, best_stat = None, 0.0
+    for index, value in enumerate(values[:-1], start=1):
+        running += value - mean
+        if abs(running) > best_stat:
+            best_index, best_stat = index, abs(running)
+    return best_index, best_stat
+
+
+def split_p_value(values: list[float], statistic: float, permutations: int, rng: random.Random) -> float:
+    """Permutation p-value: how often shuffled data produces a CUSUM peak at least as large."""
+    shuffled = list(values)
+    exceed = 0
+    for _ in range(permutations):
+        rng.shuffle(shuffled)
+        if cusum_split(shuffled)[1] >= statistic:
+            exceed += 1
+    return (exceed + 1) / (permutations + 1)
+
+
+def detect_change_points(values: list[float], alpha: float = 0.05, permutations: int = 199,
+                         min_segment: int = 3, min_change_percent: float = 0.0, seed: int = 0) -> list[dict]:
+    """Binary segmentation with a CUSUM statistic and permutation significance test.
+
+    Each accepted split becomes a change point at the first index of the new segment;
+    the two halves are then searched recursively. The RNG is seeded so repeated
+    analysis of the same history yields the same change points.
+    """
+    rng = random.Random(seed)
+    found = []
+
+    def segment(start: int, end: int) -> None:
+        window = values[start:end]
+        if len(window) < 2 * min_segment:
+            return
+        split, statistic = cusum_split(window)
+        if split is None or split < min_segment or len(window) - split < min_segment:
+            return
+        p_value = split_p_value(window, statistic, permutations, rng)
+        if p_value > alpha:
+            return
+        before = statistics.fmean(window[:split])
+        after = statistics.fmean(window[split:])
+        change_percent = (after - before) / before * 100 if before else None
+        if change_percent is not None and abs(change_percent) < min_change_percent:
+            return
+        found.append(
+            {
+                "index": start + split,
+                "p_value": p_value,
+                "mean_before": before,
+                "mean_after": after,
+                "change_percent": change_percent,
+            }
+        )
+        segment(start, start + split)
+        segment(start + split, end)
+
+    segment(0, len(values))
+    return sorted(found, key=lambda item: item["index"])
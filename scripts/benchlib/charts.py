@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import math
+from html import escape
+
+
+# Colour-blind safe qualitative palette (Okabe-Ito), cycled per series.
+PALETTE = ("#0072B2", "#E69F00", "#009E73", "#D55E00", "#CC79A7", "#56B4E9", "#F0E442", "#000000")
+WIDTH = 640
+HEIGHT = 320
+MARGIN = {"left": 64, "right": 16, "top": 16, "bottom": 48}
+
+
+def colour(index: int) -> str:
+    return PALETTE[index % len(PALETTE)]
+
+
+def fmt(value: float) -> str:
+    """Compact tick label: no trailing zeros, thousands as k."""
+    if value == 0:
+        return "0"
+    if abs(value) >= 10_000:
+        return f"{value / 1000:g}k"
+    return f"{value:.3g}"
+
+
+def nice_ticks(low: float, high: float, count: int = 5) -> list[float]:
+    if high <= low:
+        high = low + (abs(low) or 1.0)
+    raw = (high - low) / count
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw)
+    first = math.floor(low / step)
+    last = math.ceil(high / step)
+    return [round(index * step, 12) for index in range(first, last + 1)]
+
+
+class Scale:
+    """Maps data values onto a pixel range, linearly or on log10."""
+
+    def __init__(self, low: float, high: float, start: float, end: float, log: bool = False):
+        self.log = log
+        self.low = math.log10(low) if log else low
+        self.high = math.log10(high) if log else high
+        if self.high <= self.low:
+            self.high = self.low + 1.0
+        self.start = start
+        self.end = end
+
+    def __call__(self, value: float) -> float:
+        value = math.log10(value) if self.log else value
+        return self.start + (value - self.low) / (self.high - self.low) * (self.end - self.start)
+
+
+def _frame(title: str, x_label: str, y_label: str, body: list[str]) -> str:
+    left, top = MARGIN["left"], MARGIN["top"]
+    bottom = HEIGHT - MARGIN["bottom"]
+    return "\n".join(
+        [
+            f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {WIDTH} {HEIGHT}" role="img" '
+            f'aria-label="{escape(title)}" class="chart">',
+            f"<title>{escape(title)}</title>",
+            *body,
+            f'<line x1="{left}" y1="{bottom}" x2="{WIDTH - MARGIN["right"]}" y2="{bottom}" class="axis"/>',
+            f'<line x1="{left}" y1="{top}" x2="{left}" y2="{bottom}" class="axis"/>',
+            f'<text x="{(left + WIDTH - MARGIN["right"]) / 2}" y="{HEIGHT - 8}" text-anchor="middle">'
+            f"{escape(x_label)}</text>",
+            f'<text x="14" y="{(top + bottom) / 2}" text-anchor="middle" '
+            f'transform="rotate(-90 14 {(top + bottom) / 2})">{escape(y_label)}</text>',
+            "</svg>",
+        ]
+    )
+
+
+def _grid(x: Scale, y: Scale, x_ticks, y_ticks) -> list[str]:
+    top, bottom = MARGIN["top"], HEIGHT - MARGIN["bottom"]
+    left, right = MARGIN["left"], WIDTH - MARGIN["right"]
+    lines = []
+    for value, label in x_ticks:
+        px = x(value)
+        lines.append(f'<line x1="{px:.1f}" y1="{top}" x2="{px:.1f}" y2="{bottom}" class="grid"/>')
+        lines.append(f'<text x="{px:.1f}" y="{bottom + 16}" text-anchor="middle">{escape(label)}</text>')
+    for value in y_ticks:
+        py = y(value)
+        lines.append(f'<line x1="{left}" y1="{py:.1f}" x2="{right}" y2="{py:.1f}" class="grid"/>')
+        lines.append(f'<text x="{left - 6}" y="{py + 4:.1f}" text-anchor="end">{fmt(value)}</text>')
+    return lines
+
+
+def _legend(labels: list[str]) -> list[str]:
+    items = []
+    for index, label in enumerate(labels):
+        y = MARGIN["top"] + 12 + index * 16
+        x = WIDTH - MARGIN["right"] - 150
+        items.append(f'<rect x="{x}" y="{y - 9}" width="10" height="10" fill="{colour(index)}"/>')
+        items.append(f'<text x="{x + 16}" y="{y}">{escape(label)}</text>')
+    return items
+
+
+def line_chart(title: str, series: list[tuple[str, list[tuple[float, float]]]], x_label: str, y_label: str,
+               x_log: bool = False, x_ticks: list[tuple[float, str]] | None = None, step: bool = False) -> str:
+    """Polyline per series. With x_log the x values must be positive; step draws a staircase (for CDFs)."""
+    points = [point for _, values in series for point in values]
+    if not points:
+        return ""
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+    y_ticks = nice_ticks(min(0.0, min(ys)), max(ys))
+    x_low, x_high = (min(xs), max(xs))
+    if x_ticks is None:
+        x_ticks = [(value, fmt(value)) for value in nice_ticks(x_low, x_high)]
+        x_low, x_high = x_ticks[0][0], x_ticks[-1][0]
+    else:
+        x_low = min(x_low, x_ticks[0][0])
+        x_high = max(x_high, x_ticks[-1][0])
+    x = Scale(x_low, x_high, MARGIN["left"], WIDTH - MARGIN["right"], log=x_log)
+    y = Scale(y_ticks[0], y_ticks[-1], HEIGHT - MARGIN["bottom"], MARGIN["top"])
+
+    body = _grid(x, y, x_ticks, y_ticks)
+    for index, (label, values) in enumerate(series):
+        coords = []
+        for position, (vx, vy) in enumerate(values):
+            if step and position:
+                coords.append(f"{x(vx):.1f},{y(values[position - 1][1]):.1f}")
+            coords.append(f"{x(vx):.1f},{y(vy):.1f}")
+        body.append(
+            f'<polyline points="{" ".join(coords)}" fill="none" stroke="{colour(index)}" stroke-width="1.5">'
+            f"<title>{escape(label)}</title></polyline>"
+        )
+    body.extend(_legend([label for label, _ in series]))
+    return _frame(title, x_label, y_label, body)
+
+
+def strip_chart(title: str, groups: list[tuple[str, list[tuple[float, bool]]]], y_label: str) -> str:
+    """One column of points per group; points flagged True are drawn as crosses (excluded runs)."""
+    values = [value for _, points in groups for value, _ in points]
+    if not values:
+        return ""
+    y_ticks = nice_ticks(min(values), max(values))
+    y = Scale(y_ticks[0], y_ticks[-1], HEIGHT - MARGIN["bottom"], MARGIN["top"])
+    x = Scale(-0.5, len(groups) - 0.5, MARGIN["left"], WIDTH - MARGIN["right"])
+
+    body = _grid(x, y, [(index, label) for index, (label, _) in enumerate(groups)], y_ticks)
+    for index, (label, points) in enumerate(groups):
+        for position, (value, excluded) in enumerate(points):
+            # Deterministic jitter keeps repeated values visible without randomness in the output.
+            px = x(index) + ((position % 7) - 3) * 4
+            py = y(value)
+            tooltip = f"<title>{escape(label)} run {position}: {value:.2f}{' (excluded)' if excluded else ''}</title>"
+            if excluded:
+                body.append(
+                    f'<path d="M{px - 4:.1f},{py - 4:.1f}L{px + 4:.1f},{py + 4:.1f}'
+                    f'M{px - 4:.1f},{py + 4:.1f}L{px + 4:.1f},{py - 4:.1f}" stroke="#D55E00" '
+                    f'stroke-width="2" class="excluded">{tooltip}</path>'
+                )
+            else:
+                body.append(f'<circle cx="{px:.1f}" cy="{py:.1f}" r="4" fill="{colour(index)}">{tooltip}</circle>')
+    return _frame(title, "", y_label, body)
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import statistics
+
+from benchlib.stats import DEFAULT_CONFIDENCE, hodges_lehmann, mann_whitney_u, minimum_attainable_p
+
+
+COMPARISON_METRICS = {
+    "ns_per_op": "lower_is_better",
+    "rps": "higher_is_better",
+    "latency_ms_p50": "lower_is_better",
+    "latency_ms_p95": "lower_is_better",
+    "latency_ms_p99": "lower_is_better",
+    "latency_ms_max": "lower_is_better",
+    "error_rate": "lower_is_better",
+    "cpu_ms_per_request": "lower_is_better",
+    "memory_peak_mb": "lower_is_better",
+}
+
+
+def effective_run_stats(row: dict) -> list[dict]:
+    bench = row.get("benchmark") or {}
+    run_stats = bench.get("run_stats") or []
+    excluded = {sample.get("run_index") for sample in (bench.get("quality") or {}).get("excluded_samples") or []}
+    return [run for idx, run in enumerate(run_stats) if idx not in excluded] or run_stats
+
+
+def metric_samples(row: dict, metric: str) -> list[float]:
+    values = []
+    for run in effective_run_stats(row):
+        if metric == "ns_per_op":
+            rps = run.get("rps")
+            if isinstance(rps, (int, float)) and rps > 0:
+                values.append(1_000_000_000.0 / rps)
+            continue
+        value = run.get(metric)
+        if isinstance(value, (int, float)):
+            values.append(float(value))
+    return values
+
+
+def compare_samples(baseline_values: list[float], candidate_values: list[float], direction: str, alpha: float,
+                    confidence: float = DEFAULT_CONFIDENCE) -> dict:
+    """Structured candidate-vs-baseline delta for one metric."""
+    test = mann_whitney_u(baseline_values, candidate_values)
+    delta, delta_lower, delta_upper = hodges_lehmann(baseline_values, candidate_values, confidence)
+    baseline_median = statistics.median(baseline_values)
+
+    def percent(value):
+        if value is None or baseline_median == 0:
+            return None
+        return value / baseline_median * 100
+
+    significant = test["p_value"] is not None and test["p_value"] < alpha
+    change = "no_significant_change"
+    if significant and delta:
+        worse = delta > 0 if direction == "lower_is_better" else delta < 0
+        change = "regressed" if worse else "improved"
+    return {
+        "direction": direction,
+        "baseline_median": baseline_median,
+        "candidate_median": statistics.median(candidate_values),
+        "baseline_samples": len(baseline_values),
+        "candidate_samples": len(candidate_values),
+        "delta": delta,
+        "delta_ci": [delta_lower, delta_upper],
+        "delta_percent": percent(delta),
+        "delta_percent_ci": [percent(delta_lower), percent(delta_upper)],
+        "u_statistic": test["u_statistic"],
+        "p_value": test["p_value"],
+        "test": test["test"],
+        "significant": significant,
+        "change": change,
+    }
+
+
+def baseline_deltas(samples: dict[str, dict[str, list[float]]], baseline_framework: str, metrics: list[str],
+                    alpha: float, confidence: float = DEFAULT_CONFIDENCE) -> dict:
+    """Compare each framework's per-run samples with the baseline framework's, metric by metric.
+
+    samples maps framework -> metric -> values from the non-excluded runs. A delta is
+    marked underpowered when the run counts cannot reach p < alpha at all.
+    """
+    result = {
+        "baseline_framework": baseline_framework,
+        "method": "mann-whitney-u+hodges-lehmann",
+        "alpha": alpha,
+        "confidence": confidence,
+        "status": "ok",
+        "comparisons": [],
+    }
+    baseline = samples.get(baseline_framework)
+    if not baseline:
+        result["status"] = "skipped"
+        result["reason"] = "baseline_missing"
+        return result
+    for framework, candidate in samples.items():
+        if framework == baseline_framework:
+            continue
+        deltas = {}
+        for metric in metrics:
+            reference, values = baseline.get(metric), candidate.get(metric)
+            if reference and values:
+                delta = compare_samples(reference, values, COMPARISON_METRICS[metric], alpha, confidence)
+                delta["underpowered"] = minimum_attainable_p(len(reference), len(values)) >= alpha
+                deltas[metric] = delta
+        result["comparisons"].append({"framework": framework, "metrics": deltas})
+    return result
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import time
+import urllib.request
+from pathlib import Path
+
+
+GENERATOR = "synthetic-users-v1"
+MIN_USERS = 10_000
+MAX_USERS = 10_000_000
+DEFAULT_SEED = 1
+CHUNK_USERS = 5_000
+# 2025-01-01T00:00:00Z; synthetic createdAt values fall in the five years after it.
+CREATED_AT_EPOCH = 1_735_689_600
+CREATED_AT_SPAN = 5 * 365 * 86_400
+FIRST_NAMES = ("Ada", "Ben", "Chloe", "Dev", "Elena", "Farid", "Grace", "Hugo", "Iris", "Jonas", "Kemi", "Liam",
+               "Maya", "Nils", "Olga", "Priya", "Quinn", "Rosa", "Sami", "Tara", "Umar", "Vera", "Wen", "Yusuf")
+LAST_NAMES = ("Adams", "Brandt", "Costa", "Dubois", "Eriksen", "Fischer", "Garcia", "Haddad", "Ito", "Jensen",
+              "Kowalski", "Larsen", "Moreau", "Novak", "Okafor", "Petrov", "Rossi", "Silva", "Tanaka", "Varga")
+MASK64 = (1 << 64) - 1
+USER_PATH = re.compile(r"/users/(\d+)")
+
+
+def check_dataset_size(size: int) -> int:
+    if isinstance(size, bool) or not isinstance(size, int) or not MIN_USERS <= size <= MAX_USERS:
+        raise SystemExit(f"Dataset size must be an integer between {MIN_USERS} and {MAX_USERS} users (got: {size!r})")
+    return size
+
+
+def mix64(value: int) -> int:
+    """splitmix64 finaliser: a cheap, well-distributed hash of one 64-bit integer."""
+    value = (value + 0x9E3779B97F4A7C15) & MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK64
+    return value ^ (value >> 31)
+
+
+def synthetic_user(user_id: int, seed: int) -> dict:
+    """User user_id of the dataset for seed; any id can be rebuilt without generating the others."""
+    bits = mix64((seed << 32) ^ user_id)
+    first = FIRST_NAMES[bits % len(FIRST_NAMES)]
+    last = LAST_NAMES[(bits >> 8) % len(LAST_NAMES)]
+    created = time.gmtime(CREATED_AT_EPOCH + (bits >> 16) % CREATED_AT_SPAN)
+    return {
+        "id": user_id,
+        "name": f"{first} {last}",
+        "email": f"{first.lower()}.{last.lower()}.{user_id}@example.com",
+        "createdAt": time.strftime("%Y-%m-%dT%H:%M:%S.000Z", created),
+    }
+
+
+def _synthetic_json(user_id: int, seed: int) -> str:
+    # Field values are ASCII without quotes or escapes, so formatting directly matches
+    # json.dumps(synthetic_user(...), separators=(",", ":")) at a fraction of the cost.
+    user = synthetic_user(user_id, seed)
+    return (
+        f'{{"id":{user_id},"name":"{user["name"]}","email":"{user["email"]}","createdAt":"{user["createdAt"]}"}}'
+    )
+
+
+def fixture_users(fixtures_dir: Path | None) -> list[dict]:
+    """Users from the parity seed; the dataset starts with them so parity expectations still hold."""
+    seed_file = fixtures_dir / "seed.json" if fixtures_dir is not None else None
+    if seed_file is None or not seed_file.exists():
+        return []
+    try:
+        return list(json.loads(seed_file.read_text(encoding="utf-8")).get("users") or [])
+    except ValueError as exc:
+        raise SystemExit(f"Invalid parity seed {seed_file}: {exc}") from exc
+
+
+def dataset_keeps_response(path: str, base_users: list[dict]) -> bool:
+    """Whether GET path answers as the parity fixtures expect once the dataset is seeded.
+
+    The fixture users keep their records, but the collection grows and ids the
+    fixtures expect to be missing now belong to synthetic users.
+    """
+    match = USER_PATH.fullmatch(path)
+    if match is not None:
+        return int(match.group(1)) in {int(user["id"]) for user in base_users}
+    return path.partition("?")[0].rstrip("/") != "/users"
+
+
+def synthetic_ids(size: int, base_users: list[dict]) -> range:
+    first_id = max((int(user["id"]) for user in base_users), default=0) + 1
+    return range(first_id, first_id + size - len(base_users))
+
+
+def iter_seed_body(size: int, seed: int, base_users: list[dict], chunk_users: int = CHUNK_USERS):
+    """Yield the {"users": [...]} seed document in chunks of chunk_users users.
+
+    Only one chunk is held in memory at a time, so 10M users stream in constant space.
+    """
+    yield b'{"users":['
+    separator = ""
+    chunk = [json.dumps(user, separators=(",", ":")) for user in base_users]
+    for user_id in synthetic_ids(size, base_users):
+        chunk.append(_synthetic_json(user_id, seed))
+        if len(chunk) == chunk_users:
+            yield (separator + ",".join(chunk)).encode("utf-8")
+            separator, chunk = ",", []
+    if chunk:
+        yield (separator + ",".join(chunk)).encode("utf-8")
+    yield b"]}"
+
+
+class _DigestingBody:
+    """Iterable request body that hashes and counts the bytes as urllib sends them."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.digest = hashlib.sha256()
+        self.bytes = 0
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            self.digest.update(chunk)
+            self.bytes += len(chunk)
+            yield chunk
+
+
+def seed_dataset(target: str, seed_endpoint: str, size: int, seed: int, fixtures_dir: Path | None,
+                 timeout: float = 600.0) -> dict:
+    """Stream a synthetic dataset to the target's seed endpoint as one chunked POST.
+
+    Returns the dataset record stored in raw artifacts; when the target rejects
+    the seed the record carries an error and the caller skips the measurement.
+    """
+    check_dataset_size(size)
+    base_users = fixture_users(fixtures_dir)
+    if size < len(base_users):
+        raise SystemExit(f"Dataset size {size} is smaller than the {len(base_users)} parity seed users")
+    body = _DigestingBody(iter_seed_body(size, seed, base_users))
+    request = urllib.request.Request(
+        target.rstrip("/") + seed_endpoint,
+        data=body,
+        headers={"Content-Type": "application/json", "Transfer-Encoding": "chunked"},
+        method="POST",
+    )
+    record = {"generator": GENERATOR, "users": size, "seed": seed, "fixture_users": len(base_users)}
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+    except Exception as exc:
+        record["error"] = f"POST {seed_endpoint} failed: {exc}"
+        return record
+    record.update(bytes=body.bytes, sha256=body.digest.hexdigest(), seed_seconds=time.perf_counter() - start)
+    return record
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import os
+import platform
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchlib.io_utils import read_json
+from benchlib.validation import read_payload
+
+
+def run_first_line(command: list[str]) -> str:
+    try:
+        completed = subprocess.run(
+            command,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError:
+        return "unavailable"
+    output = (completed.stdout or completed.stderr or "").strip()
+    if not output:
+        return "unavailable"
+    return output.splitlines()[0].strip()
+
+
+def git_metadata() -> dict:
+    return {
+        "commit": run_first_line(["git", "rev-parse", "HEAD"]),
+        "branch": run_first_line(["git", "rev-parse", "--abbrev-ref", "HEAD"]),
+    }
+
+
+def runtime_versions() -> dict:
+    docker_compose = run_first_line(["docker", "compose", "version", "--short"])
+    if docker_compose == "unavailable":
+        docker_compose = run_first_line(["docker-compose", "version", "--short"])
+
+    return {
+        "go": run_first_line(["go", "version"]),
+        "node": run_first_line(["node", "--version"]),
+        "npm": run_first_line(["npm", "--version"]),
+        "python": run_first_line(["python3", "--version"]),
+        "wrk": run_first_line(["wrk", "--version"]),
+        "docker": run_first_line(["docker", "--version"]),
+        "docker_compose": docker_compose,
+    }
+
+
+def build_fingerprint() -> dict:
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "versions": runtime_versions(),
+        "git": git_metadata(),
+    }
+
+
+def build_manifest(raw_dir: Path, fingerprint_path: Path) -> dict:
+    if not raw_dir.exists():
+        raise SystemExit(f"Raw results directory not found: {raw_dir}")
+    if not fingerprint_path.exists():
+        raise SystemExit(f"Fingerprint file not found: {fingerprint_path}")
+
+    rows = []
+    for path in sorted(raw_dir.glob("*.json")):
+        payload = read_payload(path)
+        rows.append(
+            {
+                "file": path.name,
+                "framework": payload.get("framework"),
+                "status": payload.get("status"),
+                "reason": payload.get("reason"),
+            }
+        )
+
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "runner": {
+            "user": os.environ.get("USER", "unknown"),
+            "hostname": platform.node() or "unknown",
+            "platform": platform.platform(),
+            "machine": platform.machine() or "unknown",
+        },
+        "artifacts": {
+            "raw_dir": str(raw_dir),
+            "fingerprint_file": str(fingerprint_path),
+            "targets": len(rows),
+        },
+        "fingerprint": read_json(fingerprint_path),
+        "targets": rows,
+    }
@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+import csv
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+from benchlib.history import target_metrics
+from benchlib.io_utils import read_json
+from benchlib.stats import median_ci
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - exercised in environments without dependency
+    pyarrow = None
+
+
+EXPORT_FORMATS = ("jsonl", "csv", "parquet")
+PARQUET_BATCH_ROWS = 1024
+
+# Column order is fixed so CSV headers and Parquet schemas can be written before the first row.
+TARGET_COLUMNS = {
+    "source": "string",
+    "generated_at": "string",
+    "git_commit": "string",
+    "git_branch": "string",
+    "framework": "string",
+    "cell_id": "string",
+    "status": "string",
+    "reason": "string",
+    "engine": "string",
+    "endpoint": "string",
+    "concurrency": "int",
+    "runs": "int",
+    "effective_runs": "int",
+    "excluded_runs": "int",
+    "requests_per_run": "int",
+    "outlier_method": "string",
+    "rps": "float",
+    "rps_ci_lower": "float",
+    "rps_ci_upper": "float",
+    "latency_ms_p50": "float",
+    "latency_ms_p95": "float",
+    "latency_ms_p99": "float",
+    "rps_cv": "float",
+    "latency_ms_p95_cv": "float",
+    "pooled_latency_ms_p50": "float",
+    "pooled_latency_ms_p99": "float",
+    "pooled_latency_ms_p99_9": "float",
+    "pooled_latency_ms_max": "float",
+    "error_rate": "float",
+    "cpu_ms_per_request": "float",
+    "memory_peak_mb": "float",
+    "gates_failed": "int",
+    "gates_underpowered": "int",
+}
+
+RUN_COLUMNS = {
+    "source": "string",
+    "generated_at": "string",
+    "git_commit": "string",
+    "framework": "string",
+    "cell_id": "string",
+    "run_index": "int",
+    "excluded": "bool",
+    "exclusion_reasons": "string",
+    "requests": "int",
+    "duration_seconds": "float",
+    "rps": "float",
+    "latency_ms_p50": "float",
+    "latency_ms_p95": "float",
+    "latency_ms_p99": "float",
+    "latency_ms_max": "float",
+    "errors": "int",
+    "error_rate": "float",
+    "cpu_ms_per_request": "float",
+    "memory_peak_mb": "float",
+    "hampel_flagged_requests": "int",
+}
+
+GATE_COLUMNS = {
+    "source": "string",
+    "generated_at": "string",
+    "git_commit": "string",
+    "framework": "string",
+    "against": "string",
+    "reference_run_id": "string",
+    "metric": "string",
+    "verdict": "string",
+    "alpha": "float",
+    "min_effect_percent": "float",
+    "min_effect_absolute": "float",
+    "regression": "float",
+    "regression_percent": "float",
+    "p_value": "float",
+}
+
+TABLES = {"targets": TARGET_COLUMNS, "runs": RUN_COLUMNS, "gates": GATE_COLUMNS}
+
+
+class ResultSource:
+    """One raw directory plus the manifest and quality summary written beside it."""
+
+    def __init__(self, raw_dir: Path):
+        if not raw_dir.is_dir():
+            raise SystemExit(f"Raw results directory not found: {raw_dir}")
+        self.raw_dir = raw_dir
+        manifest = self._companion("environment.manifest.json") or {}
+        git = (manifest.get("fingerprint") or {}).get("git") or {}
+        self.context = {
+            "source": str(raw_dir),
+            "generated_at": manifest.get("generated_at"),
+            "git_commit": git.get("commit"),
+            "git_branch": git.get("branch"),
+        }
+        self.quality = self._companion("benchmark-quality-summary.json") or {}
+
+    def _companion(self, name: str):
+        path = self.raw_dir.parent / name
+        if not path.exists():
+            return None
+        try:
+            return read_json(path)
+        except json.JSONDecodeError as exc:
+            raise SystemExit(f"Malformed {name} beside {self.raw_dir}: {exc.msg}") from exc
+
+    def payloads(self) -> Iterator[dict]:
+        """Yield raw artifacts one at a time so memory does not grow with the directory."""
+        for path in sorted(self.raw_dir.glob("*.json")):
+            try:
+                yield read_json(path)
+            except json.JSONDecodeError as exc:
+                raise SystemExit(f"Malformed raw artifact {path}: {exc.msg}") from exc
+
+    def gates(self) -> list[dict]:
+        return self.quality.get("regression_gates") or []
+
+
+def target_row(context: dict, payload: dict, gates: list[dict]) -> dict:
+    bench = payload.get("benchmark") or {}
+    quality = bench.get("quality") or {}
+    variance = quality.get("variance") or {}
+    pooled = bench.get("pooled_latency_ms") or {}
+    excluded = {sample.get("run_index") for sample in quality.get("excluded_samples") or []}
+    run_stats = bench.get("run_stats") or []
+    effective = [run["rps"] for idx, run in enumerate(run_stats) if idx not in excluded and "rps" in run]
+    rps_ci = median_ci(effective) if effective else (None, None)
+    metrics = target_metrics(payload) if payload.get("status") == "ok" else {}
+    framework_gates = [gate for gate in gates if gate.get("framework") == payload.get("framework")]
+    return {
+        **context,
+        "framework": payload.get("framework"),
+        "cell_id": (payload.get("sweep_cell") or {}).get("cell_id"),
+        "status": payload.get("status"),
+        "reason": payload.get("reason"),
+        "engine": payload.get("engine"),
+        "endpoint": bench.get("endpoint"),
+        "concurrency": bench.get("concurrency"),
+        "runs": bench.get("runs"),
+        "effective_runs": quality.get("effective_runs"),
+        "excluded_runs": len(excluded) if bench else None,
+        "requests_per_run": bench.get("requests_per_run"),
+        "outlier_method": (quality.get("policy") or {}).get("outlier_method"),
+        "rps": metrics.get("rps"),
+        "rps_ci_lower": rps_ci[0],
+        "rps_ci_upper": rps_ci[1],
+        "latency_ms_p50": metrics.get("latency_ms_p50"),
+        "latency_ms_p95": metrics.get("latency_ms_p95"),
+        "latency_ms_p99": metrics.get("latency_ms_p99"),
+        "rps_cv": variance.get("rps_cv"),
+        "latency_ms_p95_cv": variance.get("latency_ms_p95_cv"),
+        "pooled_latency_ms_p50": pooled.get("p50"),
+        "pooled_latency_ms_p99": pooled.get("p99"),
+        "pooled_latency_ms_p99_9": pooled.get("p99_9"),
+        "pooled_latency_ms_max": pooled.get("max"),
+        "error_rate": metrics.get("error_rate"),
+        "cpu_ms_per_request": metrics.get("cpu_ms_per_request"),
+        "memory_peak_mb": metrics.get("memory_peak_mb"),
+        "gates_failed": sum(gate.get("verdict") == "fail" for gate in framework_gates) if framework_gates else None,
+        "gates_underpowered": (
+            sum(gate.get("verdict") == "underpowered" for gate in framework_gates) if framework_gates else None
+        ),
+    }
+
+
+def run_rows(context: dict, payload: dict) -> Iterator[dict]:
+    bench = payload.get("benchmark") or {}
+    reasons = {
+        sample.get("run_index"): sample.get("reasons") or []
+        for sample in (bench.get("quality") or {}).get("excluded_samples") or []
+    }
+    for index, run in enumerate(bench.get("run_stats") or []):
+        row = {
+            **context,
+            "framework": payload.get("framework"),
+            "cell_id": (payload.get("sweep_cell") or {}).get("cell_id"),
+            "run_index": index,
+            "excluded": index in reasons,
+            "exclusion_reasons": ",".join(reasons.get(index, [])) or None,
+        }
+        for column in RUN_COLUMNS:
+            row.setdefault(column, run.get(column))
+        yield row
+
+
+def gate_rows(context: dict, gates: list[dict]) -> Iterator[dict]:
+    for gate in gates:
+        row = {**context, "reference_run_id": (gate.get("reference") or {}).get("run_id")}
+        for column in GATE_COLUMNS:
+            row.setdefault(column, gate.get(column))
+        yield row
+
+
+def iter_export_rows(raw_dirs: list[Path]) -> Iterator[tuple[str, dict]]:
+    """Yield (table, row) pairs across every raw directory, one artifact in memory at a time."""
+    for raw_dir in raw_dirs:
+        source = ResultSource(raw_dir)
+        gates = source.gates()
+        for payload in source.payloads():
+            yield "targets", target_row(source.context, payload, gates)
+            for row in run_rows(source.context, payload):
+                yield "runs", row
+        for row in gate_rows(source.context, gates):
+            yield "gates", row
+
+
+class JsonlSink:
+    suffix = ".jsonl"
+
+    def __init__(self, path: Path, columns: dict):
+        self.handle = path.open("w", encoding="utf-8")
+
+    def write(self, row: dict) -> None:
+        self.handle.write(json.dumps(row, separators=(",", ":")) + "\n")
+
+    def close(self) -> None:
+        self.handle.close()
+
+
+class CsvSink:
+    suffix = ".csv"
+
+    def __init__(self, path: Path, columns: dict):
+        self.handle = path.open("w", encoding="utf-8", newline="")
+        self.writer = csv.DictWriter(self.handle, fieldnames=list(columns))
+        self.writer.writeheader()
+
+    def write(self, row: dict) -> None:
+        self.writer.writerow(row)
+
+    def close(self) -> None:
+        self.handle.close()
+
+
+class ParquetSink:
+    suffix = ".parquet"
+    TYPES = {"string": "string", "int": "int64", "float": "float64", "bool": "bool_"}
+
+    def __init__(self, path: Path, columns: dict):
+        if pyarrow is None:
+            raise SystemExit("Parquet export requires pyarrow; install it or drop 'parquet' from --formats")
+        self.columns = list(columns)
+        self.schema = pyarrow.schema(
+            [(name, getattr(pyarrow, self.TYPES[kind])()) for name, kind in columns.items()]
+        )
+        self.writer = pyarrow.parquet.ParquetWriter(path, self.schema)
+        self.batch: list[dict] = []
+
+    def write(self, row: dict) -> None:
+        self.batch.append(row)
+        if len(self.batch) >= PARQUET_BATCH_ROWS:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self.batch:
+            self.writer.write_table(pyarrow.Table.from_pylist(self.batch, schema=self.schema))
+            self.batch = []
+
+    def close(self) -> None:
+        self._flush()
+        self.writer.close()
+
+
+SINKS = {"jsonl": JsonlSink, "csv": CsvSink, "parquet": ParquetSink}
+
+
+def export_results(raw_dirs: list[Path], out_dir: Path, formats: list[str]) -> dict:
+    """Stream every table into each requested format and return per-table row counts."""
+    unknown = [name for name in formats if name not in SINKS]
+    if unknown:
+        raise SystemExit(f"Unknown export format(s): {', '.join(unknown)}; expected {', '.join(EXPORT_FORMATS)}")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    sinks = {}
+    try:
+        for table, columns in TABLES.items():
+            sinks[table] = [SINKS[name](out_dir / f"{table}{SINKS[name].suffix}", columns) for name in formats]
+        counts = dict.fromkeys(TABLES, 0)
+        for table, row in iter_export_rows(raw_dirs):
+            row = {column: row.get(column) for column in TABLES[table]}
+            for sink in sinks[table]:
+                sink.write(row)
+            counts[table] += 1
+    finally:
+        for table_sinks in sinks.values():
+            for sink in table_sinks:
+                sink.close()
+    return counts
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import bisect
+from collections.abc import Sequence
+
+from benchlib.stats import POOLED_QUANTILES, order_statistic_rank
+
+
+SUB_BUCKET_BITS = 7
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+
+def bucket_index(value: int) -> int:
+    """Log-linear bucket: exact below 128 ns, then 64 linear sub-buckets per power of two.
+
+    Buckets are at most 1/64 of their value wide, so a midpoint is within 0.8% of any sample in it.
+    """
+    if value < SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return (shift << SUB_BUCKET_BITS) + (value >> shift)
+
+
+def bucket_bounds(index: int) -> tuple[int, int]:
+    if index < SUB_BUCKETS:
+        return index, index
+    shift = index >> SUB_BUCKET_BITS
+    mantissa = index & (SUB_BUCKETS - 1)
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Sparse, mergeable latency histogram in integer nanoseconds.
+
+    Histograms from separate runs merge by adding bucket counts, so pooled percentiles
+    over any subset of runs can be computed later without keeping every sample.
+    """
+
+    def __init__(self):
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.min_ns: int | None = None
+        self.max_ns: int | None = None
+        self._cumulative = None
+
+    @classmethod
+    def from_seconds(cls, durations) -> LatencyHistogram:
+        histogram = cls()
+        for duration in durations:
+            histogram.record(round(duration * 1_000_000_000))
+        return histogram
+
+    def record(self, value_ns: int, count: int = 1) -> None:
+        value_ns = max(0, int(value_ns))
+        index = bucket_index(value_ns)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.count += count
+        self.min_ns = value_ns if self.min_ns is None else min(self.min_ns, value_ns)
+        self.max_ns = value_ns if self.max_ns is None else max(self.max_ns, value_ns)
+        self._cumulative = None
+
+    def merge(self, other: LatencyHistogram) -> LatencyHistogram:
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        for bound in (other.min_ns, other.max_ns):
+            if bound is None:
+                continue
+            self.min_ns = bound if self.min_ns is None else min(self.min_ns, bound)
+            self.max_ns = bound if self.max_ns is None else max(self.max_ns, bound)
+        self._cumulative = None
+        return self
+
+    def to_dict(self) -> dict:
+        return {
+            "unit": "ns",
+            "sub_bucket_bits": SUB_BUCKET_BITS,
+            "count": self.count,
+            "min": self.min_ns,
+            "max": self.max_ns,
+            "buckets": [[index, self.counts[index]] for index in sorted(self.counts)],
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> LatencyHistogram:
+        if payload.get("sub_bucket_bits") != SUB_BUCKET_BITS or payload.get("unit") != "ns":
+            raise SystemExit("Unsupported latency histogram layout")
+        histogram = cls()
+        for index, count in payload.get("buckets") or []:
+            histogram.counts[int(index)] = histogram.counts.get(int(index), 0) + int(count)
+        histogram.count = sum(histogram.counts.values())
+        histogram.min_ns = payload.get("min")
+        histogram.max_ns = payload.get("max")
+        return histogram
+
+    def value_at_rank(self, rank: int) -> int:
+        """Representative value (bucket midpoint, clamped to the observed range) of the rank-th smallest sample."""
+        if self._cumulative is None:
+            indexes = sorted(self.counts)
+            running, totals = 0, []
+            for index in indexes:
+                running += self.counts[index]
+                totals.append(running)
+            self._cumulative = (indexes, totals)
+        indexes, totals = self._cumulative
+        position = bisect.bisect_left(totals, rank)
+        lower, upper = bucket_bounds(indexes[position])
+        value = (lower + upper) // 2
+        return min(max(value, self.min_ns or 0), self.max_ns if self.max_ns is not None else value)
+
+    def percentile_ns(self, q: float) -> int | None:
+        if self.count == 0:
+            return None
+        return self.value_at_rank(order_statistic_rank(self.count, q))
+
+    def sorted_ms(self) -> SortedHistogramValues:
+        return SortedHistogramValues(self)
+
+
+class SortedHistogramValues(Sequence):
+    """Read-only sorted view of a histogram's samples in milliseconds, without expanding them."""
+
+    def __init__(self, histogram: LatencyHistogram):
+        self.histogram = histogram
+
+    def __len__(self) -> int:
+        return self.histogram.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self.histogram.value_at_rank(index + 1) / 1_000_000
+
+
+def merge_run_histograms(run_stats) -> LatencyHistogram | None:
+    merged = None
+    for run in run_stats:
+        payload = run.get("latency_histogram")
+        if not payload:
+            continue
+        histogram = LatencyHistogram.from_dict(payload)
+        merged = histogram if merged is None else merged.merge(histogram)
+    return merged
+
+
+def pooled_percentiles_ms(histogram: LatencyHistogram | None) -> dict | None:
+    if histogram is None or histogram.count == 0:
+        return None
+    pooled = {"count": histogram.count}
+    for name, q in POOLED_QUANTILES.items():
+        pooled[name] = histogram.percentile_ns(q) / 1_000_000
+    pooled["max"] = histogram.max_ns / 1_000_000
+    return pooled
+
+
+# Evenly spaced for the CDF body, then log-spaced in 1/(1-q) (ten points per decade) for the tail.
+CURVE_QUANTILES = sorted(
+    {round(step / 20, 4) for step in range(1, 20)} | {round(1 - 10 ** (-step / 10), 6) for step in range(1, 61)}
+)
+
+
+def quantile_curve_ms(histogram: LatencyHistogram | None) -> list[list[float]]:
+    """[[q, latency_ms], ...] from min to max, limited to quantiles the sample count can resolve."""
+    if histogram is None or histogram.count == 0:
+        return []
+    curve = [[0.0, histogram.min_ns / 1_000_000]]
+    for q in CURVE_QUANTILES:
+        if 1 / (1 - q) > histogram.count:
+            break
+        curve.append([q, histogram.percentile_ns(q) / 1_000_000])
+    curve.append([1.0, histogram.max_ns / 1_000_000])
+    return curve
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import statistics
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchlib.environment import git_metadata
+from benchlib.io_utils import read_json
+
+
+HISTORY_METRICS = (
+    "rps",
+    "latency_ms_p50",
+    "latency_ms_p95",
+    "latency_ms_p99",
+    "error_rate",
+    "cpu_ms_per_request",
+    "memory_peak_mb",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    git_commit TEXT,
+    git_branch TEXT,
+    recorded_at TEXT NOT NULL,
+    ingested_at TEXT NOT NULL,
+    manifest TEXT,
+    summary TEXT,
+    accepted INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS targets (
+    run_id TEXT NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    framework TEXT NOT NULL,
+    status TEXT,
+    reason TEXT,
+    raw TEXT NOT NULL,
+    PRIMARY KEY (run_id, framework)
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id TEXT NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    framework TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (run_id, framework, metric)
+);
+CREATE INDEX IF NOT EXISTS metrics_series ON metrics (framework, metric);
+"""
+
+
+def target_metrics(payload: dict) -> dict:
+    """Scalar metrics stored per target: reported medians plus medians of optional run fields."""
+    bench = payload.get("benchmark") or {}
+    values = {
+        key: value
+        for key, value in (bench.get("median") or {}).items()
+        if isinstance(value, (int, float))
+    }
+    run_stats = bench.get("run_stats") or []
+    for key in HISTORY_METRICS:
+        if key in values:
+            continue
+        samples = [run[key] for run in run_stats if isinstance(run.get(key), (int, float))]
+        if samples:
+            values[key] = statistics.median(samples)
+    return values
+
+
+def _read_optional(path: Path | None):
+    if path is None or not path.exists():
+        return None
+    return read_json(path)
+
+
+class HistoryStore:
+    """SQLite store of benchmark runs keyed by git commit and timestamp."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+        columns = {row["name"] for row in self.connection.execute("PRAGMA table_info(runs)")}
+        if "accepted" not in columns:
+            self.connection.execute("ALTER TABLE runs ADD COLUMN accepted INTEGER NOT NULL DEFAULT 0")
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def ingest(self, raw_dir: Path, summary_path: Path | None = None, manifest_path: Path | None = None,
+               run_id: str | None = None) -> str:
+        if not raw_dir.exists():
+            raise SystemExit(f"Raw results directory not found: {raw_dir}")
+        payloads = []
+        for path in sorted(raw_dir.glob("*.json")):
+            try:
+                payloads.append(read_json(path))
+            except json.JSONDecodeError as exc:
+                raise SystemExit(f"Malformed raw artifact {path}: {exc.msg}") from exc
+        if not payloads:
+            raise SystemExit(f"No raw benchmark files found in: {raw_dir}")
+
+        manifest = _read_optional(manifest_path)
+        summary = _read_optional(summary_path)
+        git = ((manifest or {}).get("fingerprint") or {}).get("git") or git_metadata()
+        recorded_at = (
+            (manifest or {}).get("generated_at")
+            or (summary or {}).get("generated_at")
+            or datetime.now(timezone.utc).isoformat()
+        )
+        commit = git.get("commit") or "unavailable"
+        if run_id is None:
+            stamp = datetime.fromisoformat(recorded_at).strftime("%Y%m%dT%H%M%S")
+            run_id = f"{stamp}-{commit[:12]}"
+
+        with self.connection:
+            previous = self.connection.execute("SELECT accepted FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+            self.connection.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+            self.connection.execute(
+                "INSERT INTO runs "
+                "(run_id, git_commit, git_branch, recorded_at, ingested_at, manifest, summary, accepted) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    run_id,
+                    commit,
+                    git.get("branch"),
+                    recorded_at,
+                    datetime.now(timezone.utc).isoformat(),
+                    json.dumps(manifest) if manifest is not None else None,
+                    json.dumps(summary) if summary is not None else None,
+                    previous["accepted"] if previous else 0,
+                ),
+            )
+            for payload in payloads:
+                framework = payload.get("framework")
+                if not framework:
+                    continue
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO targets VALUES (?, ?, ?, ?, ?)",
+                    (run_id, framework, payload.get("status"), payload.get("reason"), json.dumps(payload)),
+                )
+                if payload.get("status") != "ok":
+                    continue
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO metrics VALUES (?, ?, ?, ?)",
+                    [(run_id, framework, metric, value) for metric, value in target_metrics(payload).items()],
+                )
+        return run_id
+
+    def runs(self, limit: int | None = None) -> list[dict]:
+        query = (
+            "SELECT r.run_id, r.git_commit, r.git_branch, r.recorded_at, r.accepted, "
+            "COUNT(t.framework) AS targets, SUM(t.status = 'ok') AS successful "
+            "FROM runs r LEFT JOIN targets t ON t.run_id = r.run_id "
+            "GROUP BY r.run_id ORDER BY r.recorded_at DESC, r.run_id DESC"
+        )
+        params = ()
+        if limit:
+            query += " LIMIT ?"
+            params = (limit,)
+        return [dict(row) for row in self.connection.execute(query, params)]
+
+    def series(self, framework: str, metric: str, limit: int | None = None) -> list[dict]:
+        """Chronological values of one metric for one framework across ingested runs."""
+        query = (
+            "SELECT r.run_id, r.git_commit, r.recorded_at, m.value FROM metrics m "
+            "JOIN runs r ON r.run_id = m.run_id WHERE m.framework = ? AND m.metric = ? "
+            "ORDER BY r.recorded_at DESC, r.run_id DESC"
+        )
+        params: tuple = (framework, metric)
+        if limit:
+            query += " LIMIT ?"
+            params += (limit,)
+        rows = [dict(row) for row in self.connection.execute(query, params)]
+        rows.reverse()
+        return rows
+
+    def frameworks(self) -> list[str]:
+        return [row[0] for row in self.connection.execute("SELECT DISTINCT framework FROM metrics ORDER BY 1")]
+
+    def target_payload(self, run_id: str, framework: str) -> dict | None:
+        row = self.connection.execute(
+            "SELECT raw FROM targets WHERE run_id = ? AND framework = ?", (run_id, framework)
+        ).fetchone()
+        return json.loads(row["raw"]) if row else None
+
+    def accept(self, run_id: str | None = None) -> str:
+        """Mark a run (default: the most recent) as an accepted reference for later runs."""
+        if run_id is None:
+            row = self.connection.execute(
+                "SELECT run_id FROM runs ORDER BY recorded_at DESC, run_id DESC LIMIT 1"
+            ).fetchone()
+            if row is None:
+                raise SystemExit("History store is empty; nothing to accept")
+            run_id = row["run_id"]
+        with self.connection:
+            updated = self.connection.execute("UPDATE runs SET accepted = 1 WHERE run_id = ?", (run_id,))
+        if updated.rowcount == 0:
+            raise SystemExit(f"Run not found in history: {run_id}")
+        return run_id
+
+    def latest_accepted_target(self, framework: str) -> tuple[dict, dict] | None:
+        """Return (run provenance, raw payload) of the newest accepted successful run of framework."""
+        row = self.connection.execute(
+            "SELECT r.run_id, r.git_commit, r.git_branch, r.recorded_at, t.raw FROM targets t "
+            "JOIN runs r ON r.run_id = t.run_id "
+            "WHERE r.accepted = 1 AND t.framework = ? AND t.status = 'ok' "
+            "ORDER BY r.recorded_at DESC, r.run_id DESC LIMIT 1",
+            (framework,),
+        ).fetchone()
+        if row is None:
+            return None
+        provenance = {key: row[key] for key in ("run_id", "git_commit", "git_branch", "recorded_at")}
+        return provenance, json.loads(row["raw"])
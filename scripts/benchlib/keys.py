@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import itertools
+import math
+import random
+from array import array
+from collections import Counter
+
+
+KEY_PLACEHOLDER = "{id}"
+DISTRIBUTIONS = {
+    "uniform": {"seed": 1},
+    "zipf": {"seed": 1, "s": 1.0},
+    "hotset": {"seed": 1, "hot_fraction": 0.01, "hot_share": 0.9},
+}
+DEFAULT_DISTRIBUTION = "uniform"
+
+
+def is_key_template(endpoint: str) -> bool:
+    return KEY_PLACEHOLDER in endpoint
+
+
+def parse_key_distribution(spec: str) -> dict:
+    """Parse 'name[:param=value,...]', e.g. 'zipf:s=1.2,seed=7' or 'hotset:hot_fraction=0.05'."""
+    name, _, raw_params = (spec or DEFAULT_DISTRIBUTION).strip().partition(":")
+    if name not in DISTRIBUTIONS:
+        raise SystemExit(f"Unknown key distribution {name!r}; expected one of {', '.join(DISTRIBUTIONS)}")
+    params = dict(DISTRIBUTIONS[name])
+    for item in filter(None, (part.strip() for part in raw_params.split(","))):
+        key, _, value = item.partition("=")
+        if key not in params:
+            raise SystemExit(f"Key distribution {name} has no parameter {key!r}; expected {', '.join(params)}")
+        try:
+            params[key] = int(value) if key == "seed" else float(value)
+        except ValueError as exc:
+            raise SystemExit(f"Key distribution parameter {key} must be numeric (got: {value!r})") from exc
+    if name == "zipf" and params["s"] <= 0:
+        raise SystemExit(f"Zipf exponent s must be > 0 (got: {params['s']})")
+    if name == "hotset" and not (0 < params["hot_fraction"] < 1 and 0 <= params["hot_share"] <= 1):
+        raise SystemExit("hotset needs 0 < hot_fraction < 1 and 0 <= hot_share <= 1")
+    return {"name": name, "params": params}
+
+
+class ZipfSampler:
+    """Zipf ranks in [1, n] by rejection-inversion (Hörmann & Derflinger, 1996).
+
+    Constant memory and O(1) expected time per draw, so 10M-key populations need no CDF table.
+    """
+
+    def __init__(self, n: int, s: float, rng: random.Random):
+        self.n = n
+        self.s = s
+        self.rng = rng
+        self.h_integral_x1 = self._h_integral(1.5) - 1.0
+        self.h_integral_n = self._h_integral(n + 0.5)
+        self.threshold = 2.0 - self._h_integral_inverse(self._h_integral(2.5) - self._h(2.0))
+
+    @staticmethod
+    def _helper1(x: float) -> float:
+        return math.log1p(x) / x if abs(x) > 1e-8 else 1.0 - x * (0.5 - x * (1.0 / 3.0 - 0.25 * x))
+
+    @staticmethod
+    def _helper2(x: float) -> float:
+        return math.expm1(x) / x if abs(x) > 1e-8 else 1.0 + x * 0.5 * (1.0 + x / 3.0 * (1.0 + 0.25 * x))
+
+    def _h(self, x: float) -> float:
+        return math.exp(-self.s * math.log(x))
+
+    def _h_integral(self, x: float) -> float:
+        log_x = math.log(x)
+        return self._helper2((1.0 - self.s) * log_x) * log_x
+
+    def _h_integral_inverse(self, x: float) -> float:
+        t = max(x * (1.0 - self.s), -1.0)
+        return math.exp(self._helper1(t) * x)
+
+    def __call__(self) -> int:
+        while True:
+            u = self.h_integral_n + self.rng.random() * (self.h_integral_x1 - self.h_integral_n)
+            x = self._h_integral_inverse(u)
+            k = min(max(int(x + 0.5), 1), self.n)
+            if k - x <= self.threshold or u >= self._h_integral(k + 0.5) - self._h(k):
+                return k
+
+
+def _rank_sampler(distribution: dict, key_count: int, rng: random.Random):
+    """Return a callable drawing 0-based popularity ranks (0 is the hottest key)."""
+    params = distribution["params"]
+    if distribution["name"] == "zipf":
+        zipf = ZipfSampler(key_count, params["s"], rng)
+        return lambda: zipf() - 1
+    if distribution["name"] == "hotset":
+        hot_keys = max(1, round(key_count * params["hot_fraction"]))
+        cold_keys = key_count - hot_keys
+        share = params["hot_share"] if cold_keys else 1.0
+        return lambda: rng.randrange(hot_keys) if rng.random() < share else hot_keys + rng.randrange(cold_keys)
+    return lambda: rng.randrange(key_count)
+
+
+def _rank_permutation(key_count: int, rng: random.Random) -> tuple[int, int]:
+    """Seeded affine bijection rank -> key offset, so hot ranks are spread over the id space."""
+    multiplier = rng.randrange(1, key_count) if key_count > 1 else 1
+    while math.gcd(multiplier, key_count) != 1:
+        multiplier += 1
+    return multiplier, rng.randrange(key_count)
+
+
+def key_sequence(distribution: dict, key_count: int, length: int, first_id: int = 1) -> array:
+    """Precompute length key ids in [first_id, first_id + key_count) as a compact unsigned array."""
+    if key_count < 1:
+        raise SystemExit(f"Key distributions need at least one key (got: {key_count})")
+    rng = random.Random(distribution["params"]["seed"])
+    draw = _rank_sampler(distribution, key_count, rng)
+    multiplier, offset = _rank_permutation(key_count, rng)
+    keys = array("L")
+    keys.extend(first_id + (multiplier * draw() + offset) % key_count for _ in range(length))
+    return keys
+
+
+class KeyedEndpoint:
+    """Expands an endpoint template such as /users/{id} from a precomputed key sequence.
+
+    The sequence wraps around when more requests are issued than it holds. next_url
+    only indexes the array and concatenates strings, so it is cheap enough for the
+    request loop and safe to call from the concurrent engine's worker threads.
+    """
+
+    def __init__(self, base_url: str, template: str, distribution: dict, key_count: int, length: int,
+                 first_id: int = 1):
+        if template.count(KEY_PLACEHOLDER) != 1:
+            raise SystemExit(f"Endpoint template must contain {KEY_PLACEHOLDER} exactly once: {template}")
+        prefix, _, suffix = template.partition(KEY_PLACEHOLDER)
+        self.prefix = base_url.rstrip("/") + prefix
+        self.suffix = suffix
+        self.template = template
+        self.distribution = distribution
+        self.key_count = key_count
+        self.first_id = first_id
+        self.keys = key_sequence(distribution, key_count, max(1, length), first_id)
+        self._positions = itertools.count()
+
+    def next_url(self) -> str:
+        return f"{self.prefix}{self.keys[next(self._positions) % len(self.keys)]}{self.suffix}"
+
+    def describe(self) -> dict:
+        counts = Counter(self.keys)
+        hottest_key, hottest_count = counts.most_common(1)[0]
+        return {
+            "template": self.template,
+            "distribution": self.distribution["name"],
+            "params": dict(self.distribution["params"]),
+            "key_count": self.key_count,
+            "first_id": self.first_id,
+            "sequence_length": len(self.keys),
+            "distinct_keys": len(counts),
+            "hottest_key": hottest_key,
+            "hottest_key_share": hottest_count / len(self.keys),
+        }
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchlib.parity import check_health
+
+
+DROP_CACHES_PATH = Path("/proc/sys/vm/drop_caches")
+
+
+def utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def compose_command() -> list[str]:
+    if shutil.which("docker") is not None:
+        completed = subprocess.run(
+            ["docker", "compose", "version"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if completed.returncode == 0:
+            return ["docker", "compose"]
+    if shutil.which("docker-compose") is not None:
+        return ["docker-compose"]
+    raise SystemExit("Container lifecycle management requires docker compose or docker-compose")
+
+
+def wait_for_health(target: str, timeout_seconds: float, initial_delay: float = 0.1,
+                    max_delay: float = 2.0, sleep=time.sleep, clock=time.monotonic) -> tuple[bool, int]:
+    """Poll /health with exponential back-off until it answers or the timeout elapses."""
+    deadline = clock() + timeout_seconds
+    delay = initial_delay
+    attempts = 0
+    while True:
+        attempts += 1
+        if check_health(target):
+            return True, attempts
+        remaining = deadline - clock()
+        if remaining <= 0:
+            return False, attempts
+        sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
+
+
+def drop_page_caches() -> bool:
+    try:
+        os.sync()
+        DROP_CACHES_PATH.write_text("3\n", encoding="utf-8")
+        return True
+    except OSError:
+        pass
+    if shutil.which("sudo") is None:
+        return False
+    completed = subprocess.run(
+        ["sudo", "-n", "sh", "-c", f"sync; echo 3 > {DROP_CACHES_PATH}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return completed.returncode == 0
+
+
+class ContainerLifecycle:
+    """Starts one compose service at a time so idle targets do not compete for host CPU."""
+
+    def __init__(self, repo_root: Path, compose_file: Path, ready_timeout: float = 60.0,
+                 drop_caches: bool = False, env: dict | None = None):
+        self.repo_root = repo_root
+        self.compose_file = compose_file
+        self.ready_timeout = ready_timeout
+        self.drop_caches = drop_caches
+        self.env = env
+        self.base_command = compose_command() + ["-f", str(compose_file)]
+
+    def _compose(self, *args: str) -> subprocess.CompletedProcess:
+        env = None
+        if self.env:
+            env = dict(os.environ)
+            env.update(self.env)
+        return subprocess.run(
+            self.base_command + list(args),
+            cwd=self.repo_root,
+            capture_output=True,
+            text=True,
+            check=False,
+            env=env,
+        )
+
+    def stop_all(self) -> None:
+        self._compose("stop")
+
+    def start(self, service: str, target: str) -> dict:
+        record = {
+            "managed": True,
+            "service": service,
+            "container_started_at": None,
+            "ready_at": None,
+            "ready": False,
+            "ready_attempts": 0,
+            "container_stopped_at": None,
+            "page_cache_dropped": None,
+        }
+        completed = self._compose("up", "-d", service)
+        record["container_started_at"] = utc_now()
+        if completed.returncode != 0:
+            record["error"] = completed.stderr.strip() or completed.stdout.strip() or "compose up failed"
+            return record
+
+        ready, attempts = wait_for_health(target, self.ready_timeout)
+        record["ready"] = ready
+        record["ready_attempts"] = attempts
+        if ready:
+            record["ready_at"] = utc_now()
+        return record
+
+    def stop(self, record: dict) -> dict:
+        self._compose("stop", record["service"])
+        record["container_stopped_at"] = utc_now()
+        if self.drop_caches:
+            record["page_cache_dropped"] = drop_page_caches()
+        return record
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import itertools
+import json
+import re
+import sys
+import threading
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+
+
+# Python port of the matcher semantics in cmd/parity-test/main.go; keep the two in step.
+MATCHER_TOKENS = re.compile(r"@any_number|@is_iso8601")
+NUMBER_STRING = re.compile(r"^-?\d+(\.\d+)?$")
+RFC3339 = re.compile(r"^\d{4}-\d{2}-\d{2}[Tt]\d{2}:\d{2}:\d{2}(\.\d+)?([Zz]|[+-]\d{2}:\d{2})$")
+DEFAULT_SAMPLE_FRACTION = 0.01
+DEFAULT_MAX_MISMATCH_RATE = 0.0
+DEFAULT_MAX_EXAMPLES = 5
+SKIP_REASON = "parity failed under load"
+
+
+def is_number(value) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, (int, float)):
+        return True
+    return isinstance(value, str) and bool(NUMBER_STRING.match(value))
+
+
+def is_iso8601(value) -> bool:
+    if not isinstance(value, str) or not RFC3339.match(value):
+        return False
+    try:
+        datetime.fromisoformat(value.upper().replace("Z", "+00:00"))
+    except ValueError:
+        return False
+    return True
+
+
+def match_string(expected: str, actual) -> bool:
+    if expected == "@any_number":
+        return is_number(actual)
+    if expected == "@is_iso8601":
+        return is_iso8601(actual)
+    if not isinstance(actual, str):
+        return False
+    tokens = MATCHER_TOKENS.findall(expected)
+    if not tokens:
+        return expected == actual
+    parts = MATCHER_TOKENS.split(expected)
+    pattern = []
+    for index, part in enumerate(parts):
+        pattern.append(re.escape(part))
+        if index < len(tokens):
+            pattern.append(r"(-?\d+(?:\.\d+)?)" if tokens[index] == "@any_number" else r"(.+)")
+    match = re.match("^" + "".join(pattern) + "$", actual)
+    if match is None:
+        return False
+    checks = [is_number if token == "@any_number" else is_iso8601 for token in tokens]
+    return all(check(value) for check, value in zip(checks, match.groups()))
+
+
+def compare_value(expected, actual) -> str | None:
+    """Return None when actual satisfies expected, otherwise a short mismatch description."""
+    if isinstance(expected, dict):
+        if not isinstance(actual, dict):
+            return f"expected object, got {type(actual).__name__}"
+        for key, value in expected.items():
+            if key not in actual:
+                return f"missing key {key}"
+            problem = compare_value(value, actual[key])
+            if problem is not None:
+                return f"{key}.{problem}"
+        return None
+    if isinstance(expected, list):
+        if not isinstance(actual, list):
+            return f"expected array, got {type(actual).__name__}"
+        if len(actual) != len(expected):
+            return f"array length {len(actual)} != {len(expected)}"
+        for index, (item, got) in enumerate(zip(expected, actual)):
+            problem = compare_value(item, got)
+            if problem is not None:
+                return f"[{index}]{problem}"
+        return None
+    if isinstance(expected, str):
+        return None if match_string(expected, actual) else f"string mismatch: expected {expected}"
+    if isinstance(expected, bool) or expected is None or isinstance(actual, bool):
+        return None if expected is actual else f"value {actual!r} != {expected!r}"
+    if is_number(expected) and is_number(actual) and not isinstance(actual, str) and expected == actual:
+        return None
+    return f"value {actual!r} != {expected!r}"
+
+
+def check_response(expectation: dict, status: int, headers, body: bytes) -> str | None:
+    """Check one response against a scenario's response block, as cmd/parity-test does."""
+    if status != expectation.get("status"):
+        return f"status {status} != {expectation.get('status')}"
+    for key, expected in (expectation.get("headers") or {}).items():
+        got = headers.get(key) if headers is not None else None
+        if not got:
+            return f"missing header {key}"
+        if not match_string(expected, got):
+            return f"header {key} mismatch: want {expected}, got {got}"
+    actual = None
+    if body:
+        try:
+            actual = json.loads(body)
+        except ValueError:
+            return "invalid response JSON"
+    problem = compare_value(expectation.get("body"), actual)
+    return None if problem is None else f"body mismatch: {problem}"
+
+
+def find_expectation(fixtures_dir: Path, endpoint: str) -> dict | None:
+    """Return the GET scenario whose path is the measured endpoint, or None.
+
+    Only bodiless GET scenarios qualify: the load engines replay one idempotent
+    request, so anything that mutates state has no stable expectation under load.
+    """
+    for path in sorted((fixtures_dir / "scenarios").glob("*.json")):
+        try:
+            scenarios = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            raise SystemExit(f"Invalid parity fixture {path}: {exc}") from exc
+        for scenario in scenarios:
+            request = scenario.get("request") or {}
+            if (request.get("method") or "GET").upper() != "GET" or request.get("body") is not None:
+                continue
+            if request.get("path") == endpoint:
+                return {"name": scenario.get("name"), "source": path.name, "response": scenario.get("response") or {}}
+    return None
+
+
+def seed_target(target: str, fixtures_dir: Path, seed_endpoint: str, timeout: float = 5.0) -> None:
+    """Re-post the parity seed so expectations hold after the mutating parity scenarios ran."""
+    seed_file = fixtures_dir / "seed.json"
+    if not seed_endpoint or not seed_file.exists():
+        return
+    request = urllib.request.Request(
+        target.rstrip("/") + seed_endpoint,
+        data=seed_file.read_bytes(),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+    except Exception as exc:
+        print(f"seed warning: {exc}", file=sys.stderr)
+
+
+def resolve_load_parity_policy(quality_policy: dict) -> dict:
+    configured = quality_policy.get("parity_under_load") or {}
+    return {
+        "sample_fraction": float(configured.get("sample_fraction", DEFAULT_SAMPLE_FRACTION)),
+        "max_mismatch_rate": float(configured.get("max_mismatch_rate", DEFAULT_MAX_MISMATCH_RATE)),
+        "max_examples": int(configured.get("max_examples", DEFAULT_MAX_EXAMPLES)),
+    }
+
+
+class LoadParitySampler:
+    """Checks a deterministic fraction of measured responses against one parity scenario.
+
+    Every 1/fraction-th request (by issue order across all runs) is checked, so
+    the same workload always samples the same request positions. Thread-safe:
+    the concurrent engine shares one sampler between its workers.
+    """
+
+    def __init__(self, expectation: dict, sample_fraction: float, max_examples: int = DEFAULT_MAX_EXAMPLES):
+        if not 0 < sample_fraction <= 1:
+            raise SystemExit(f"parity_under_load.sample_fraction must be in (0, 1] (got: {sample_fraction})")
+        self.expectation = expectation
+        self.sample_fraction = sample_fraction
+        self.max_examples = max_examples
+        self._positions = itertools.count()
+        self._lock = threading.Lock()
+        self.checked = 0
+        self.mismatches = 0
+        self.examples: list[dict] = []
+
+    def wants(self) -> bool:
+        position = next(self._positions)
+        return int((position + 1) * self.sample_fraction) > int(position * self.sample_fraction)
+
+    def check(self, status: int, headers, body: bytes) -> None:
+        problem = check_response(self.expectation["response"], status, headers, body)
+        with self._lock:
+            self.checked += 1
+            if problem is None:
+                return
+            self.mismatches += 1
+            if len(self.examples) < self.max_examples:
+                self.examples.append({"check_index": self.checked - 1, "status": status, "problem": problem})
+
+    def summary(self) -> dict:
+        return {
+            "scenario": self.expectation["name"],
+            "fixture": self.expectation["source"],
+            "sample_fraction": self.sample_fraction,
+            "checked": self.checked,
+            "mismatches": self.mismatches,
+            "mismatch_rate": self.mismatches / self.checked if self.checked else 0.0,
+            "examples": self.examples,
+        }
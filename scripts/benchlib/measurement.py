@@ -0,0 +1,745 @@
+from __future__ import annotations
+
+import json
+import re
+import shlex
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from benchlib.dataset import (
+    DEFAULT_SEED as DEFAULT_DATASET_SEED,
+    dataset_keeps_response,
+    fixture_users,
+    seed_dataset,
+)
+from benchlib.histogram import LatencyHistogram, merge_run_histograms, pooled_percentiles_ms
+from benchlib.io_utils import load_json_policy
+from benchlib.keys import KeyedEndpoint, is_key_template, parse_key_distribution
+from benchlib.load_parity import (
+    SKIP_REASON as LOAD_PARITY_SKIP_REASON,
+    LoadParitySampler,
+    find_expectation,
+    resolve_load_parity_policy,
+    seed_target,
+)
+from benchlib.outliers import hampel_outliers, resolve_outlier_policy, select_outliers, tukey_outliers
+from benchlib.payloads import CONTENT_TYPE, resolve_payload
+from benchlib.samples import SampleWriter, is_failure
+from benchlib.sessions import (
+    VirtualUserResult,
+    load_session_script,
+    run_session,
+    session_run,
+    session_run_stats,
+    summarize_sessions,
+)
+
+
+UNIT_TO_MB = {
+    "b": 1 / (1024 * 1024),
+    "kb": 1 / 1000,
+    "kib": 1 / 1024,
+    "mb": 1,
+    "mib": 1,
+    "gb": 1000,
+    "gib": 1024,
+    "tb": 1000 * 1000,
+    "tib": 1024 * 1024,
+}
+
+METRIC_UNITS = {
+    "throughput": "requests_per_second",
+    "latency": "milliseconds",
+    "memory": "mb",
+    "cpu": "percent",
+    "startup": "milliseconds",
+}
+
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+# Per-run byte rates recorded when requests carry a body (payload-size workloads).
+THROUGHPUT_BYTE_FIELDS = ("request_bytes_per_second", "response_bytes_per_second")
+
+DEFAULT_VARIANCE_THRESHOLDS = {
+    "rps": 0.10,
+    "latency_ms_p95": 0.20,
+    "latency_ms_p99": 0.25,
+}
+
+
+def parse_mem_to_mb(value):
+    if not value:
+        return None
+    head = str(value).split("/", 1)[0].strip()
+    match = re.match(r"^([0-9]+(?:\.[0-9]+)?)\s*([a-zA-Z]+)$", head)
+    if not match:
+        return None
+    amount = float(match.group(1))
+    unit = match.group(2).lower()
+    factor = UNIT_TO_MB.get(unit)
+    if factor is None:
+        return None
+    return amount * factor
+
+
+def parse_cpu_percent(value):
+    if not value:
+        return None
+    raw = str(value).strip().removesuffix("%")
+    try:
+        return float(raw)
+    except ValueError:
+        return None
+
+
+def coefficient_of_variation(values):
+    if len(values) < 2:
+        return 0.0
+    mean = statistics.fmean(values)
+    if mean == 0:
+        return 0.0
+    return statistics.stdev(values) / mean
+
+
+def detect_iqr_outlier_indexes(values):
+    return tukey_outliers(values, k=1.5)
+
+
+def build_request(url, method="GET", body=None):
+    if method == "GET" and body is None:
+        return url
+    return urllib.request.Request(url, data=body, method=method, headers={"Content-Type": CONTENT_TYPE})
+
+
+def request_once(url, method="GET", body=None):
+    start = time.perf_counter()
+    with urllib.request.urlopen(build_request(url, method, body), timeout=5) as response:
+        response.read()
+    return time.perf_counter() - start
+
+
+def request_sample(url, sampler=None, method="GET", body=None):
+    """Issue one request and return (send epoch ns, seconds, HTTP status or 0, response bytes).
+
+    When the sampler selects this request its response is checked against the
+    parity expectation after the clock stops, so checking never adds to latency.
+    """
+    checked = sampler is not None and sampler.wants()
+    request = build_request(url, method, body)
+    send_ns = time.time_ns()
+    start = time.perf_counter()
+    status, size, headers, content, error = 0, 0, None, b"", None
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            content = response.read()
+            size = len(content)
+            status = response.status
+            headers = response.headers
+    except urllib.error.HTTPError as exc:
+        status, headers, error = exc.code, exc.headers, exc
+    except Exception:
+        pass
+    elapsed = time.perf_counter() - start
+    if checked and status:
+        if error is not None:
+            try:
+                content = error.read()
+            except Exception:
+                content = b""
+        sampler.check(status, headers, content)
+    return send_ns, elapsed, status, size
+
+
+def timed_batch(url, requests, concurrency, samples=None, sampler=None, keys=None, method="GET", bodies=None):
+    """Issue requests and return (successful latencies, wall-clock seconds, failed requests, successful response bytes).
+
+    When samples is a list, every attempt's request_sample tuple is appended to it in issue order.
+    With keys (a KeyedEndpoint) each request takes the next URL from its precomputed sequence.
+    With bodies (a UserBodies) each request sends the next body, which differs only in its email.
+    """
+    next_url = keys.next_url if keys is not None else lambda: url
+    next_body = bodies.next_body if bodies is not None else lambda: None
+    if concurrency <= 1:
+        results = [request_sample(next_url(), sampler, method, next_body()) for _ in range(requests)]
+        durations = [result[1] for result in results if not is_failure(result[2])]
+        wall = sum(durations)
+    else:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(
+                pool.map(lambda _: request_sample(next_url(), sampler, method, next_body()), range(requests))
+            )
+        wall = time.perf_counter() - start
+        durations = [result[1] for result in results if not is_failure(result[2])]
+    if samples is not None:
+        samples.extend(results)
+    response_bytes = sum(result[3] for result in results if not is_failure(result[2]))
+    return durations, wall, requests - len(durations), response_bytes
+
+
+def find_container_id(framework):
+    try:
+        completed = subprocess.run(
+            ["docker", "ps", "--no-trunc", "--format", "{{.ID}}|{{.Names}}"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError:
+        return None
+    for line in completed.stdout.splitlines():
+        container_id, _, name = line.partition("|")
+        if name == framework or name.startswith(framework + "-") or name.endswith("-" + framework):
+            return container_id
+    return None
+
+
+class ResourceProbe:
+    """Reads a container's cgroup v2 CPU and memory counters around each run.
+
+    Counters are read directly from the cgroup filesystem, so a run's CPU time is the
+    exact delta rather than a `docker stats` snapshot. When the cgroup cannot be found
+    (no Docker, cgroup v1, remote daemon) every sample is None.
+    """
+
+    def __init__(self, framework, cgroup_root=CGROUP_ROOT, container_id=None):
+        self.cgroup_dir = None
+        self.peak_handle = None
+        container_id = container_id or find_container_id(framework)
+        if not container_id:
+            return
+        for candidate in (
+            cgroup_root / "system.slice" / f"docker-{container_id}.scope",
+            cgroup_root / "docker" / container_id,
+        ):
+            if (candidate / "cpu.stat").exists():
+                self.cgroup_dir = candidate
+                break
+
+    def sample(self):
+        """CPU time now, and the memory of the interval since the previous sample.
+
+        memory.peak is a lifetime high-water mark, so later runs would inherit earlier
+        runs' peaks. Kernels from 6.12 reset it for reads through the descriptor that
+        wrote to it; that descriptor is kept open until the next sample, so each run
+        reports its own peak. Where the reset is unavailable, the anonymous memory at
+        the end of the interval is recorded instead, and memory_source says which.
+        """
+        if self.cgroup_dir is None:
+            return None
+        try:
+            cpu_usec = None
+            for line in (self.cgroup_dir / "cpu.stat").read_text(encoding="utf-8").splitlines():
+                key, _, value = line.partition(" ")
+                if key == "usage_usec":
+                    cpu_usec = int(value)
+        except (OSError, ValueError):
+            return None
+        memory_bytes, memory_source = self._read_peak(), "cgroup_peak_reset"
+        if memory_bytes is None:
+            memory_bytes, memory_source = self.anon_memory_bytes(), "cgroup_anon"
+        self.peak_handle = self._reset_peak()
+        return {"cpu_usec": cpu_usec, "memory_bytes": memory_bytes, "memory_source": memory_source}
+
+    def _reset_peak(self):
+        try:
+            handle = open(self.cgroup_dir / "memory.peak", "r+", encoding="utf-8")
+        except OSError:
+            return None
+        try:
+            handle.write("reset\n")
+            handle.flush()
+        except OSError:
+            handle.close()
+            return None
+        return handle
+
+    def _read_peak(self):
+        handle, self.peak_handle = self.peak_handle, None
+        if handle is None:
+            return None
+        try:
+            handle.seek(0)
+            return int(handle.read().strip())
+        except (OSError, ValueError):
+            return None
+        finally:
+            handle.close()
+
+    def anon_memory_bytes(self):
+        """Anonymous memory from memory.stat: heap and stacks, without the page cache memory.current counts."""
+        if self.cgroup_dir is None:
+            return None
+        try:
+            for line in (self.cgroup_dir / "memory.stat").read_text(encoding="utf-8").splitlines():
+                key, _, value = line.partition(" ")
+                if key == "anon":
+                    return int(value)
+        except (OSError, ValueError):
+            return None
+        return None
+
+
+def resource_fields(before, after, completed_requests):
+    if not before or not after:
+        return {}
+    fields = {}
+    if after["memory_bytes"] is not None:
+        fields["memory_peak_mb"] = after["memory_bytes"] / (1024 * 1024)
+        fields["memory_source"] = after["memory_source"]
+    if completed_requests and before["cpu_usec"] is not None and after["cpu_usec"] is not None:
+        fields["cpu_ms_per_request"] = (after["cpu_usec"] - before["cpu_usec"]) / 1000 / completed_requests
+    return fields
+
+
+def measure_legacy(url, warmup, requests, runs, concurrency=1, probe=None, hampel=None, sample_writer=None,
+                   sampler=None, keys=None, method="GET", bodies=None):
+    warmup_first_success = None
+    for _ in range(warmup):
+        try:
+            body = bodies.next_body() if bodies is not None else None
+            duration = request_once(keys.next_url() if keys is not None else url, method, body)
+            if warmup_first_success is None:
+                warmup_first_success = duration
+        except Exception:
+            continue
+
+    run_stats = []
+    for _ in range(runs):
+        before = probe.sample() if probe else None
+        attempts = [] if sample_writer is not None else None
+        client_cpu_start = time.process_time()
+        durations, total, errors, response_bytes = timed_batch(
+            url, requests, concurrency, samples=attempts, sampler=sampler, keys=keys, method=method, bodies=bodies
+        )
+        client_cpu_seconds = time.process_time() - client_cpu_start
+        after = probe.sample() if probe else None
+        if not durations:
+            continue
+        for send_ns, seconds, status, size in attempts or []:
+            sample_writer.append(len(run_stats), send_ns, round(seconds * 1_000_000_000), status, size)
+        run = {
+            "requests": requests,
+            "duration_seconds": total,
+            "rps": requests / total if total > 0 else 0.0,
+            "latency_ms_p50": statistics.median(durations) * 1000,
+            "latency_ms_p95": statistics.quantiles(durations, n=20)[18] * 1000,
+            "latency_ms_p99": statistics.quantiles(durations, n=100)[98] * 1000,
+            "latency_ms_max": max(durations) * 1000,
+            "errors": errors,
+            "error_rate": errors / requests if requests else 0.0,
+            "latency_histogram": LatencyHistogram.from_seconds(durations).to_dict(),
+            # CPU cores the load generator itself used; the GIL holds it near one core at most.
+            "client_cpu_utilisation": client_cpu_seconds / total if total > 0 else 0.0,
+        }
+        if hampel and hampel.get("enabled"):
+            latencies_ns = [round(duration * 1_000_000_000) for duration in durations]
+            run["hampel_flagged_requests"] = len(
+                hampel_outliers(latencies_ns, int(hampel["half_window"]), float(hampel["threshold"]))
+            )
+        if bodies is not None:
+            run["request_bytes_per_second"] = len(durations) * len(bodies) / total if total > 0 else 0.0
+            run["response_bytes_per_second"] = response_bytes / total if total > 0 else 0.0
+        run.update(resource_fields(before, after, len(durations)))
+        run_stats.append(run)
+
+    return run_stats, warmup_first_success
+
+
+def measure_sessions(target, script, warmup, sessions, runs, virtual_users=1, probe=None):
+    """Run scripted sessions: warmup sequentially, then each run spread over virtual_users workers.
+
+    Session indexes keep counting across warmup and runs, so {iteration} never repeats
+    within a measurement and scripts can derive unique emails from it.
+    """
+    base_url = target.rstrip("/")
+    names = [step["name"] for step in script["steps"]]
+    warmup_first_success = None
+    for iteration in range(warmup):
+        latency = run_session(base_url, script, {"vu": 0, "iteration": iteration}, VirtualUserResult(names))
+        if warmup_first_success is None:
+            warmup_first_success = latency
+
+    run_stats = []
+    for index in range(runs):
+        before = probe.sample() if probe else None
+        result = session_run(base_url, script, sessions, max(1, virtual_users), warmup + index * sessions)
+        after = probe.sample() if probe else None
+        run = session_run_stats(result)
+        if run is None:
+            continue
+        run.update(resource_fields(before, after, run["requests"] - run["errors"]))
+        run_stats.append(run)
+
+    return run_stats, warmup_first_success
+
+
+def measure_hyperfine(repo_root, url, requests, runs):
+    if shutil.which("hyperfine") is None:
+        raise SystemExit("BENCH_ENGINE=hyperfine requires hyperfine installed")
+
+    with tempfile.TemporaryDirectory(prefix="hyperfine-", dir=repo_root / "results") as temp_dir:
+        export_file = Path(temp_dir) / "hyperfine.json"
+        batch_command = (
+            f"python3 scripts/http-batch.py --url {shlex.quote(url)} "
+            f"--requests {int(requests)} --timeout 5"
+        )
+        completed = subprocess.run(
+            [
+                "hyperfine",
+                "--shell",
+                "sh",
+                "--runs",
+                str(runs),
+                "--warmup",
+                "1",
+                "--export-json",
+                str(export_file),
+                batch_command,
+            ],
+            cwd=repo_root,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if completed.returncode != 0:
+            raise SystemExit(f"hyperfine failed: {completed.stderr.strip() or completed.stdout.strip()}")
+
+        payload = json.loads(export_file.read_text(encoding="utf-8"))
+        results = payload.get("results") or []
+        if not results:
+            raise SystemExit("hyperfine produced no results")
+
+        times = results[0].get("times") or []
+        if not times:
+            raise SystemExit("hyperfine produced no timing samples")
+
+    run_stats = []
+    for duration in times:
+        run_seconds = float(duration)
+        if run_seconds <= 0:
+            continue
+        latency_ms = (run_seconds * 1000) / requests
+        run_stats.append(
+            {
+                "requests": requests,
+                "duration_seconds": run_seconds,
+                "rps": requests / run_seconds,
+                "latency_ms_p50": latency_ms,
+                "latency_ms_p95": latency_ms,
+                "latency_ms_p99": latency_ms,
+                "latency_ms_max": latency_ms,
+            }
+        )
+
+    return run_stats, None
+
+
+def load_policy(repo_root):
+    policy_file = repo_root / "stats-policy.json"
+    if not policy_file.exists():
+        policy_file = repo_root / "stats-policy.yaml"
+    return load_json_policy(policy_file, default_on_missing={})
+
+
+def collect_docker_stats(framework):
+    docker_stats = {}
+    try:
+        completed = subprocess.run(
+            ["docker", "stats", "--no-stream", "--format", "{{.Name}}|{{.MemUsage}}|{{.CPUPerc}}"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        for line in completed.stdout.splitlines():
+            if not line.strip():
+                continue
+            parts = line.split("|", 2)
+            if len(parts) == 3 and (
+                parts[0] == framework
+                or parts[0].startswith(framework + "-")
+                or parts[0].endswith("-" + framework)
+            ):
+                docker_stats = {"container": parts[0], "memory": parts[1], "cpu": parts[2]}
+                break
+    except Exception:
+        pass
+    return docker_stats
+
+
+def build_skip_payload(framework, target, reason, **extra):
+    payload = {
+        "schema_version": "raw-v1",
+        "framework": framework,
+        "target": target,
+        "status": "skipped",
+        "reason": reason,
+    }
+    payload.update(extra)
+    return payload
+
+
+def build_result_payload(framework, target, endpoint, warmup_requests, benchmark_requests, runs, run_stats,
+                         warmup_first_success, parity_result, engine, policy, concurrency=1):
+    quality_policy = (policy.get("quality") or {})
+    variance_thresholds = quality_policy.get("variance_thresholds_cv") or DEFAULT_VARIANCE_THRESHOLDS
+
+    outlier_policy = resolve_outlier_policy(quality_policy)
+    selection = select_outliers(run_stats, outlier_policy)
+    excluded_samples = [
+        {"run_index": idx, "reasons": reasons, "run": run_stats[idx]}
+        for idx, reasons in selection["excluded"].items()
+    ]
+    excluded_indexes = set(selection["excluded"])
+    suspected_samples = [{"run_index": idx, "reasons": reasons} for idx, reasons in selection["suspected"].items()]
+
+    filtered_run_stats = [r for idx, r in enumerate(run_stats) if idx not in excluded_indexes]
+    if not filtered_run_stats:
+        filtered_run_stats = run_stats
+
+    filtered_rps = [r["rps"] for r in filtered_run_stats]
+    filtered_p50 = [r["latency_ms_p50"] for r in filtered_run_stats]
+    filtered_p95 = [r["latency_ms_p95"] for r in filtered_run_stats]
+    filtered_p99 = [r["latency_ms_p99"] for r in filtered_run_stats]
+
+    docker_stats = collect_docker_stats(framework)
+    pooled_latency = pooled_percentiles_ms(merge_run_histograms(filtered_run_stats))
+
+    payload = {
+        "schema_version": "raw-v1",
+        "framework": framework,
+        "target": target,
+        "status": "ok",
+        "parity": parity_result,
+        "engine": engine,
+        "metric_units": dict(METRIC_UNITS),
+        "benchmark": {
+            "endpoint": endpoint,
+            "warmup_requests": warmup_requests,
+            "requests_per_run": benchmark_requests,
+            "runs": runs,
+            "concurrency": concurrency,
+            "run_stats": run_stats,
+            "quality": {
+                "policy": {
+                    "outlier_method": selection["method"],
+                    "outlier_thresholds": selection["thresholds"],
+                    "outliers": outlier_policy,
+                    "variance_thresholds_cv": variance_thresholds,
+                },
+                "excluded_samples": excluded_samples,
+                "suspected_outliers": suspected_samples,
+                "effective_runs": len(filtered_run_stats),
+                "variance": {
+                    "rps_cv": coefficient_of_variation(filtered_rps),
+                    "latency_ms_p95_cv": coefficient_of_variation(filtered_p95),
+                    "latency_ms_p99_cv": coefficient_of_variation(filtered_p99),
+                },
+            },
+            "median": {
+                "rps": statistics.median(filtered_rps),
+                "latency_ms_p50": statistics.median(filtered_p50),
+                "latency_ms_p95": statistics.median(filtered_p95),
+                "latency_ms_p99": statistics.median(filtered_p99),
+                **{
+                    field: statistics.median(r[field] for r in filtered_run_stats)
+                    for field in THROUGHPUT_BYTE_FIELDS
+                    if all(field in r for r in filtered_run_stats)
+                },
+            },
+        },
+        "docker": docker_stats,
+        "resources_normalized": {
+            "memory_mb": parse_mem_to_mb(docker_stats.get("memory")),
+            "cpu_percent": parse_cpu_percent(docker_stats.get("cpu")),
+            "startup_ms": (warmup_first_success * 1000) if warmup_first_success is not None else None,
+        },
+    }
+    if pooled_latency:
+        payload["benchmark"]["pooled_latency_ms"] = pooled_latency
+    return payload
+
+
+def load_parity_sampler(fixtures_dir, endpoint, engine, policy, dataset=False):
+    """Build the under-load parity sampler, or None when sampling is off or nothing describes the endpoint.
+
+    With a seeded dataset only endpoints whose fixture response the dataset keeps are sampled.
+    """
+    settings = resolve_load_parity_policy(policy.get("quality") or {})
+    if engine == "hyperfine" or fixtures_dir is None or settings["sample_fraction"] <= 0:
+        return None, settings
+    if dataset and not dataset_keeps_response(endpoint, fixture_users(fixtures_dir)):
+        return None, settings
+    expectation = find_expectation(fixtures_dir, endpoint)
+    if expectation is None:
+        return None, settings
+    return LoadParitySampler(expectation, settings["sample_fraction"], settings["max_examples"]), settings
+
+
+def measure_target(repo_root, framework, target, endpoint, warmup_requests, benchmark_requests, runs,
+                   parity_result, engine, policy=None, concurrency=1, samples_file=None,
+                   parity_fixtures="test/fixtures/parity", seed_endpoint="/debug/parity/seed",
+                   dataset_size=None, dataset_seed=DEFAULT_DATASET_SEED, key_distribution=None, key_count=None,
+                   method="GET", payload_size=None, session_script=None):
+    if policy is None:
+        policy = load_policy(repo_root)
+
+    url = target.rstrip("/") + endpoint
+    session = load_session_script(repo_root / session_script) if session_script else None
+    if session is not None:
+        if engine == "hyperfine":
+            raise SystemExit("BENCH_ENGINE=hyperfine does not support session workloads")
+        if payload_size or method.upper() != "GET" or is_key_template(endpoint):
+            raise SystemExit("Session scripts define their own requests; drop the method, payload size and template")
+        # Sessions are recorded under their script name; the endpoint only serves the health check.
+        endpoint = f"session:{session['name']}"
+    samples_reference = None
+    fixtures_dir = repo_root / parity_fixtures if parity_fixtures is not None else None
+    method, bodies = resolve_payload(method, payload_size)
+    if engine == "hyperfine" and bodies is not None:
+        raise SystemExit(f"BENCH_ENGINE=hyperfine only issues GET requests (got: {method})")
+    # Parity scenarios are keyed by path, and only GET scenarios describe a replayable request.
+    sampler, load_parity_settings = load_parity_sampler(
+        fixtures_dir if method == "GET" and session is None else None, endpoint, engine, policy, bool(dataset_size)
+    )
+
+    keys = None
+    if is_key_template(endpoint):
+        if engine == "hyperfine":
+            raise SystemExit(f"BENCH_ENGINE=hyperfine does not support endpoint templates: {endpoint}")
+        # Ids 1..N exist on the target: the fixture users, extended by the synthetic dataset when seeded.
+        keys = KeyedEndpoint(
+            target,
+            endpoint,
+            parse_key_distribution(key_distribution),
+            key_count or dataset_size or len(fixture_users(fixtures_dir)),
+            warmup_requests + benchmark_requests * runs,
+        )
+
+    # Parity scenarios mutate the target, so state is reset before warmup: either to the
+    # synthetic dataset (which keeps the fixture users) or to the fixture seed itself.
+    dataset = None
+    if dataset_size:
+        dataset = seed_dataset(target, seed_endpoint, dataset_size, dataset_seed, fixtures_dir)
+        if "error" in dataset:
+            return build_skip_payload(
+                framework, target, "dataset seeding failed", parity=parity_result, engine=engine, dataset=dataset
+            )
+    elif sampler is not None or (session is not None and fixtures_dir is not None):
+        seed_target(target, fixtures_dir, seed_endpoint)
+
+    if session is not None:
+        run_stats, warmup_first_success = measure_sessions(
+            target,
+            session,
+            warmup_requests,
+            benchmark_requests,
+            runs,
+            virtual_users=concurrency,
+            probe=ResourceProbe(framework),
+        )
+    elif engine == "hyperfine":
+        if concurrency > 1:
+            raise SystemExit("BENCH_ENGINE=hyperfine does not support concurrency > 1")
+        run_stats, warmup_first_success = measure_hyperfine(repo_root, url, benchmark_requests, runs)
+    else:
+        sample_writer = SampleWriter(samples_file) if samples_file is not None else None
+        try:
+            run_stats, warmup_first_success = measure_legacy(
+                url,
+                warmup_requests,
+                benchmark_requests,
+                runs,
+                concurrency=concurrency,
+                probe=ResourceProbe(framework),
+                hampel=resolve_outlier_policy(policy.get("quality") or {})["hampel"],
+                sample_writer=sample_writer,
+                sampler=sampler,
+                keys=keys,
+                method=method,
+                bodies=bodies,
+            )
+        finally:
+            if sample_writer is not None:
+                samples_reference = sample_writer.close()
+
+    load_parity = None
+    if sampler is not None:
+        load_parity = {**sampler.summary(), "max_mismatch_rate": load_parity_settings["max_mismatch_rate"]}
+
+    if not run_stats:
+        if samples_file is not None:
+            samples_file.unlink(missing_ok=True)
+        return build_skip_payload(
+            framework,
+            target,
+            "benchmark requests failed",
+            parity=parity_result,
+            engine=engine,
+        )
+
+    if load_parity is not None and load_parity["mismatch_rate"] > load_parity["max_mismatch_rate"]:
+        if samples_file is not None:
+            samples_file.unlink(missing_ok=True)
+        payload = build_skip_payload(
+            framework,
+            target,
+            LOAD_PARITY_SKIP_REASON,
+            parity=parity_result,
+            engine=engine,
+            parity_under_load=load_parity,
+        )
+    else:
+        payload = build_result_payload(
+            framework,
+            target,
+            endpoint,
+            warmup_requests,
+            benchmark_requests,
+            runs,
+            run_stats,
+            warmup_first_success,
+            parity_result,
+            engine,
+            policy,
+            concurrency=concurrency,
+        )
+        if samples_reference is not None:
+            payload["benchmark"]["samples"] = samples_reference
+        if keys is not None:
+            payload["benchmark"]["key_distribution"] = keys.describe()
+        if bodies is not None:
+            payload["benchmark"]["payload"] = {"method": method, "bytes": len(bodies), "content_type": CONTENT_TYPE}
+        if session is not None:
+            excluded = {sample["run_index"] for sample in payload["benchmark"]["quality"]["excluded_samples"]}
+            kept = [run for idx, run in enumerate(run_stats) if idx not in excluded] or run_stats
+            payload["benchmark"]["sessions"] = summarize_sessions(session, concurrency, kept, session_script)
+        if load_parity is not None:
+            payload["parity_under_load"] = load_parity
+    if dataset is not None:
+        payload["dataset"] = dataset
+    return payload
+
+
+def write_raw_payload(path, payload):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+def describe_payload(payload):
+    if payload.get("status") != "ok":
+        return f"SKIP {payload['framework']}: {payload.get('reason')}"
+    median = payload["benchmark"]["median"]
+    return (
+        f"OK {payload['framework']}: median_rps={median['rps']:.2f} "
+        f"p50={median['latency_ms_p50']:.2f}ms "
+        f"p95={median['latency_ms_p95']:.2f}ms "
+        f"p99={median['latency_ms_p99']:.2f}ms"
+    )
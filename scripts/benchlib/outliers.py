@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import statistics
+
+
+MAD_TO_SIGMA = 1.4826
+MEAN_AD_TO_SIGMA = 1.253314
+
+DEFAULT_OUTLIER_POLICY = {
+    "method": "auto",
+    "metrics": ["rps", "latency_ms_p95"],
+    "modified_z_threshold": 3.5,
+    "tukey_k": 1.5,
+    "tukey_min_samples": 8,
+    # Below this many runs the spread estimate is too unstable to drop runs on; flagged runs are only reported.
+    "min_exclusion_samples": 5,
+    "hampel": {
+        "enabled": True,
+        "half_window": 5,
+        "threshold": 3.0,
+        "max_flagged_fraction": 0.10,
+    },
+}
+
+METRIC_REASONS = {
+    "rps": "rps_outlier",
+    "latency_ms_p95": "latency_p95_outlier",
+}
+
+
+def robust_scale(values: list[float]) -> float:
+    """Sigma estimate from the MAD, falling back to the mean absolute deviation when MAD is 0."""
+    center = statistics.median(values)
+    deviations = [abs(value - center) for value in values]
+    mad = statistics.median(deviations)
+    if mad > 0:
+        return mad * MAD_TO_SIGMA
+    return statistics.fmean(deviations) * MEAN_AD_TO_SIGMA
+
+
+def modified_z_outliers(values: list[float], threshold: float = 3.5):
+    """Iglewicz-Hoaglin modified z-score; works from 3 samples, unlike quartile fences."""
+    if len(values) < 3:
+        return set(), None, None
+    center = statistics.median(values)
+    scale = robust_scale(values)
+    if scale <= 0:
+        return set(), center, center
+    lower = center - threshold * scale
+    upper = center + threshold * scale
+    return {idx for idx, value in enumerate(values) if value < lower or value > upper}, lower, upper
+
+
+def tukey_outliers(values: list[float], k: float = 1.5, min_samples: int = 4):
+    if len(values) < max(4, min_samples):
+        return set(), None, None
+    q1, _, q3 = statistics.quantiles(values, n=4, method="inclusive")
+    iqr = q3 - q1
+    if iqr <= 0:
+        return set(), q1, q3
+    lower = q1 - k * iqr
+    upper = q3 + k * iqr
+    return {idx for idx, value in enumerate(values) if value < lower or value > upper}, lower, upper
+
+
+def hampel_outliers(series: list[float], half_window: int = 5, threshold: float = 3.0) -> list[int]:
+    """Indexes whose value deviates from the centred rolling median by more than threshold robust sigmas."""
+    flagged = []
+    for index, value in enumerate(series):
+        window = series[max(0, index - half_window): index + half_window + 1]
+        if len(window) < 3:
+            continue
+        center = statistics.median(window)
+        sigma = MAD_TO_SIGMA * statistics.median(abs(item - center) for item in window)
+        if sigma > 0 and abs(value - center) > threshold * sigma:
+            flagged.append(index)
+    return flagged
+
+
+def resolve_outlier_policy(quality_policy: dict) -> dict:
+    configured = quality_policy.get("outliers") or {}
+    return {
+        **DEFAULT_OUTLIER_POLICY,
+        **configured,
+        "hampel": {**DEFAULT_OUTLIER_POLICY["hampel"], **(configured.get("hampel") or {})},
+    }
+
+
+def method_for(policy: dict, n: int) -> str:
+    method = policy["method"]
+    if method == "auto":
+        return "tukey" if n >= policy["tukey_min_samples"] else "modified_z"
+    if method not in ("tukey", "iqr", "modified_z", "none"):
+        raise SystemExit(f"Unknown outlier method in stats policy: {method!r}")
+    return method
+
+
+def method_label(policy: dict, method: str) -> str:
+    if method == "modified_z":
+        return f"modified_z_{policy['modified_z_threshold']}"
+    if method in ("tukey", "iqr"):
+        return f"iqr_{policy['tukey_k']}"
+    return method
+
+
+def select_outliers(run_stats: list[dict], policy: dict) -> dict:
+    """Decide which runs to exclude, using only values stored in run_stats.
+
+    The result depends on nothing but run_stats and the resolved policy, so
+    re-analysing the same raw artifact always reproduces the same exclusions.
+    With fewer than min_exclusion_samples runs, metric outliers are returned as
+    suspected and kept; Hampel spike bursts rest on the run's own requests and
+    are excluded at any run count.
+    """
+    method = method_for(policy, len(run_stats))
+    reasons: dict[int, list[str]] = {}
+    suspected: dict[int, list[str]] = {}
+    metric_reasons = reasons if len(run_stats) >= policy["min_exclusion_samples"] else suspected
+    thresholds = {}
+    for metric in policy["metrics"]:
+        values = [run.get(metric) for run in run_stats]
+        if not values or not all(isinstance(value, (int, float)) for value in values):
+            continue
+        if method == "modified_z":
+            indexes, lower, upper = modified_z_outliers(values, policy["modified_z_threshold"])
+        elif method in ("tukey", "iqr"):
+            indexes, lower, upper = tukey_outliers(values, policy["tukey_k"], min_samples=4)
+        else:
+            indexes, lower, upper = set(), None, None
+        thresholds[metric] = {"lower": lower, "upper": upper}
+        for idx in indexes:
+            metric_reasons.setdefault(idx, []).append(METRIC_REASONS.get(metric, f"{metric}_outlier"))
+
+    hampel = policy["hampel"]
+    if hampel.get("enabled"):
+        for idx, run in enumerate(run_stats):
+            flagged = run.get("hampel_flagged_requests")
+            total = run.get("requests")
+            if isinstance(flagged, int) and total and flagged / total > hampel["max_flagged_fraction"]:
+                reasons.setdefault(idx, []).append("hampel_spike_burst")
+
+    return {
+        "method": method_label(policy, method),
+        "thresholds": thresholds,
+        "excluded": {idx: reasons[idx] for idx in sorted(reasons)},
+        "suspected": {idx: suspected[idx] for idx in sorted(suspected)},
+    }
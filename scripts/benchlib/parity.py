@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import subprocess
+import urllib.request
+from pathlib import Path
+
+
+PARITY_SOURCES = ("cmd/parity-test/*.go", "go.mod", "go.sum")
+
+
+def parity_source_hash(repo_root: Path) -> str:
+    digest = hashlib.sha256()
+    for pattern in PARITY_SOURCES:
+        for path in sorted(repo_root.glob(pattern)):
+            if path.name.endswith("_test.go"):
+                continue
+            digest.update(str(path.relative_to(repo_root)).encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def build_parity_binary(repo_root: Path, cache_dir: Path) -> Path:
+    """Build cmd/parity-test once per source revision and reuse the binary."""
+    source_hash = parity_source_hash(repo_root)
+    binary = cache_dir / source_hash[:16] / "parity-test"
+    if binary.exists() and os.access(binary, os.X_OK):
+        return binary
+
+    binary.parent.mkdir(parents=True, exist_ok=True)
+    staging = binary.with_name(f"parity-test.{os.getpid()}.tmp")
+    completed = subprocess.run(
+        ["go", "build", "-o", str(staging), "./cmd/parity-test"],
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if completed.returncode != 0:
+        staging.unlink(missing_ok=True)
+        raise SystemExit(f"parity-test build failed: {completed.stderr.strip() or completed.stdout.strip()}")
+    os.replace(staging, binary)
+    return binary
+
+
+def run_parity(binary: Path, repo_root: Path, target: str, fixtures: str = "test/fixtures/parity",
+               seed_endpoint: str = "/debug/parity/seed", timeout: str = "5s") -> bool:
+    completed = subprocess.run(
+        [
+            str(binary),
+            "-target",
+            target,
+            "-fixtures",
+            fixtures,
+            "-seed-endpoint",
+            seed_endpoint,
+            "-timeout",
+            timeout,
+        ],
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return completed.returncode == 0
+
+
+def check_health(target: str, timeout: float = 5.0) -> bool:
+    try:
+        with urllib.request.urlopen(target.rstrip("/") + "/health", timeout=timeout) as response:
+            response.read()
+            return 200 <= response.status < 300
+    except Exception:
+        return False
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import itertools
+import json
+import re
+
+
+BODY_METHODS = ("POST", "PUT")
+MAX_PAYLOAD_BYTES = 1024 * 1024
+CONTENT_TYPE = "application/json"
+SIZE_UNITS = {"": 1, "b": 1, "kb": 1024, "kib": 1024, "mb": 1024 * 1024, "mib": 1024 * 1024}
+# The users-create/users-update fixture shape; padding goes into name so the body stays a valid user.
+# The zeros are replaced by a per-request sequence number, see UserBodies.
+EMAIL_DIGITS = 10
+EMAIL_INDEX = b"." + b"0" * EMAIL_DIGITS + b"@"
+BASE_USER = {"name": "Payload User", "email": f"payload.user.{'0' * EMAIL_DIGITS}@example.com"}
+
+
+def parse_payload_size(value) -> int:
+    """Body size in bytes from an int or a string such as '100B', '1KB' or '256KB' (binary units)."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        size = value
+    else:
+        match = re.fullmatch(r"\s*([0-9]+)\s*([A-Za-z]*)\s*", str(value))
+        if not match or match.group(2).lower() not in SIZE_UNITS:
+            raise SystemExit(f"Payload size must be bytes or a size like 1KB/256KB (got: {value!r})")
+        size = int(match.group(1)) * SIZE_UNITS[match.group(2).lower()]
+    minimum = len(user_body(None))
+    if not minimum <= size <= MAX_PAYLOAD_BYTES:
+        raise SystemExit(f"Payload size must be between {minimum} and {MAX_PAYLOAD_BYTES} bytes (got: {size})")
+    return size
+
+
+def user_body(size: int | None) -> bytes:
+    """JSON user body of exactly size bytes; None returns the unpadded fixture-sized body."""
+    base = json.dumps(BASE_USER, separators=(",", ":")).encode("utf-8")
+    if size is None or size == len(base):
+        return base
+    padding = size - len(base) - 1
+    if padding < 0:
+        raise SystemExit(f"Payload size {size} is below the {len(base)}-byte minimum user body")
+    user = dict(BASE_USER, name=BASE_USER["name"] + " " + "x" * padding)
+    return json.dumps(user, separators=(",", ":")).encode("utf-8")
+
+
+class UserBodies:
+    """User bodies of one fixed size, each with its own email address.
+
+    Targets that enforce unique emails reject a repeated create, so every body carries the
+    next number of a sequence in its email. The number is zero-padded to a fixed width, so
+    all bodies have the same length. next_body only splices bytes, so it is cheap enough
+    for the request loop and safe to call from the concurrent engine's worker threads.
+    """
+
+    def __init__(self, size: int | None = None):
+        template = user_body(size)
+        self.prefix, _, self.suffix = template.partition(EMAIL_INDEX)
+        self.size = len(template)
+        self._positions = itertools.count()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def next_body(self) -> bytes:
+        index = next(self._positions) % 10**EMAIL_DIGITS
+        return b"%s.%0*d@%s" % (self.prefix, EMAIL_DIGITS, index, self.suffix)
+
+
+def check_method(method: str) -> str:
+    method = (method or "GET").upper()
+    if method not in ("GET", *BODY_METHODS):
+        raise SystemExit(f"Benchmark method must be GET, POST or PUT (got: {method})")
+    return method
+
+
+def resolve_payload(method: str, payload_size) -> tuple[str, UserBodies | None]:
+    """Return (method, bodies): GET sends no body, POST/PUT send user bodies of the requested size."""
+    method = check_method(method)
+    if method == "GET":
+        if payload_size:
+            raise SystemExit("A payload size needs BENCHMARK_METHOD=POST or PUT")
+        return method, None
+    return method, UserBodies(parse_payload_size(payload_size) if payload_size else None)
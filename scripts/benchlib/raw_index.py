@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+from benchlib.io_utils import read_json
+from benchlib.result_cache import file_hash
+from benchlib.validation import raw_files, read_payload, validate_raw_files
+
+
+# Bump when an extractor's output changes shape so stale indexes are rebuilt.
+INDEX_VERSION = 1
+
+
+def index_path_for(raw_dir: Path) -> Path:
+    return raw_dir.parent / f"{raw_dir.name}-index.json"
+
+
+def slim_payload(payload: dict) -> dict:
+    """Raw payload without per-run histograms, which no aggregate check reads."""
+    bench = payload.get("benchmark")
+    if not isinstance(bench, dict):
+        return payload
+    quality = dict(bench.get("quality") or {})
+    if quality.get("excluded_samples"):
+        quality["excluded_samples"] = [
+            {key: value for key, value in sample.items() if key != "run"} for sample in quality["excluded_samples"]
+        ]
+    slim_bench = {
+        **bench,
+        "run_stats": [
+            {key: value for key, value in run.items() if key != "latency_histogram"}
+            for run in bench.get("run_stats") or []
+        ],
+    }
+    if "quality" in bench:
+        slim_bench["quality"] = quality
+    return {**payload, "benchmark": slim_bench}
+
+
+def _stat(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _dependencies(path: Path, payload: dict) -> list[list]:
+    """Files outside the artifact that feed its extracts (the request-sample sidecar)."""
+    reference = (payload.get("benchmark") or {}).get("samples") or {}
+    sidecar = path.parent / reference["path"] if reference.get("path") else None
+    if sidecar is None or not sidecar.exists():
+        return []
+    return [[sidecar.name, *_stat(sidecar)]]
+
+
+class RawIndex:
+    """Incremental index of a raw directory: file stat, sha256, and cached per-file extracts.
+
+    Each refresh re-parses (and, when asked, re-validates) only artifacts whose
+    size, mtime, or content changed since the last refresh; everything else is
+    served from the index file, which is far smaller than the raw artifacts.
+    """
+
+    def __init__(self, raw_dir: Path, schema_path: Path | None = None, path: Path | None = None):
+        self.raw_dir = raw_dir
+        self.schema_path = schema_path
+        self.schema_sha256 = file_hash(schema_path) if schema_path is not None else None
+        self.path = path or index_path_for(raw_dir)
+        self.entries: dict[str, dict] = {}
+        self.stats = {"reused": 0, "parsed": 0, "removed": 0}
+        try:
+            data = read_json(self.path)
+        except (OSError, json.JSONDecodeError):
+            return
+        if data.get("index_version") == INDEX_VERSION:
+            self.entries = data.get("files") or {}
+
+    def _current(self, path: Path) -> dict | None:
+        entry = self.entries.get(path.name)
+        if entry is None:
+            return None
+        mtime_ns, size = _stat(path)
+        if (entry["mtime_ns"], entry["size"]) != (mtime_ns, size):
+            if entry["size"] != size or file_hash(path) != entry["sha256"]:
+                return None
+            entry["mtime_ns"] = mtime_ns
+        for name, dep_mtime, dep_size in entry.get("depends") or []:
+            dependency = self.raw_dir / name
+            if not dependency.exists() or list(_stat(dependency)) != [dep_mtime, dep_size]:
+                return None
+        return entry
+
+    def refresh(self, extractors: dict[str, Callable[[Path, dict], object]], validate: bool = False):
+        """Return [(path, extracts)] for every raw file, computing only what is missing or stale."""
+        files = raw_files(self.raw_dir)
+        names = {path.name for path in files}
+        for name in [name for name in self.entries if name not in names]:
+            del self.entries[name]
+            self.stats["removed"] += 1
+
+        stale = []
+        for path in files:
+            entry = self._current(path)
+            if (
+                entry is None
+                or (validate and entry.get("validated_schema") != self.schema_sha256)
+                or any(name not in entry["extracts"] for name in extractors)
+            ):
+                stale.append(path)
+
+        if validate:
+            parsed = validate_raw_files(stale, self.schema_path)
+        else:
+            parsed = [(path, read_payload(path)) for path in stale]
+        for path, payload in parsed:
+            previous = self._current(path)
+            mtime_ns, size = _stat(path)
+            entry = {
+                "mtime_ns": mtime_ns,
+                "size": size,
+                "sha256": previous["sha256"] if previous else file_hash(path),
+                "validated_schema": self.schema_sha256 if validate else (previous or {}).get("validated_schema"),
+                "depends": _dependencies(path, payload),
+                "extracts": dict(previous["extracts"]) if previous else {},
+            }
+            for name, extract in extractors.items():
+                if name not in entry["extracts"]:
+                    entry["extracts"][name] = extract(path, payload)
+            self.entries[path.name] = entry
+
+        self.stats["parsed"] += len(parsed)
+        self.stats["reused"] += len(files) - len(parsed)
+        self.save()
+        return [(path, self.entries[path.name]["extracts"]) for path in files]
+
+    def save(self) -> None:
+        payload = {"index_version": INDEX_VERSION, "raw_dir": str(self.raw_dir), "files": self.entries}
+        staging = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        try:
+            staging.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(staging, self.path)
+        except OSError:
+            # A read-only reference directory still works; it just is not indexed.
+            staging.unlink(missing_ok=True)
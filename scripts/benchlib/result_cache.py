@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import platform
+import re
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchlib.io_utils import read_json, write_json
+
+
+def canonical_hash(payload) -> str:
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def file_hash(path: Path) -> str | None:
+    if not path.exists():
+        return None
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def tree_hash(root: Path, pattern: str = "**/*.json") -> str:
+    digest = hashlib.sha256()
+    for path in sorted(root.glob(pattern)):
+        digest.update(str(path.relative_to(root)).encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def compose_project_name(repo_root: Path) -> str:
+    name = os.environ.get("COMPOSE_PROJECT_NAME") or repo_root.name
+    return re.sub(r"[^a-z0-9_-]", "", name.lower())
+
+
+def image_digest(repo_root: Path, service: str) -> str | None:
+    """Return the local image ID compose uses for a service, or None when it cannot be resolved."""
+    image = os.environ.get(f"BENCHMARK_IMAGE_{service.upper()}") or f"{compose_project_name(repo_root)}-{service}"
+    try:
+        completed = subprocess.run(
+            ["docker", "image", "inspect", "--format", "{{.Id}}", image],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError:
+        return None
+    digest = completed.stdout.strip()
+    if completed.returncode != 0 or not digest:
+        return None
+    return digest
+
+
+def environment_key(fingerprint: dict) -> dict:
+    # generated_at and the harness git commit change on every run; app changes are covered by the image digest.
+    return {
+        "versions": fingerprint.get("versions") or {},
+        "host": {
+            "hostname": platform.node() or "unknown",
+            "machine": platform.machine() or "unknown",
+            "platform": platform.platform(),
+        },
+    }
+
+
+class ResultCache:
+    """Stores ok raw-v1 payloads keyed by everything that can change a measurement."""
+
+    def __init__(self, cache_dir: Path, policy_file: Path, fingerprint: dict, digest_fn=image_digest):
+        self.cache_dir = cache_dir
+        self.policy_hash = file_hash(policy_file)
+        self.environment = environment_key(fingerprint)
+        self.digest_fn = digest_fn
+
+    def key_for(self, repo_root: Path, framework: str, workload: dict) -> str | None:
+        digest = self.digest_fn(repo_root, framework)
+        if digest is None:
+            return None
+        return canonical_hash(
+            {
+                "framework": framework,
+                "image_digest": digest,
+                "workload": workload,
+                "policy_sha256": self.policy_hash,
+                "environment": self.environment,
+            }
+        )
+
+    def entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def load(self, key: str) -> dict | None:
+        path = self.entry_path(key)
+        if not path.exists():
+            return None
+        try:
+            entry = read_json(path)
+        except json.JSONDecodeError:
+            return None
+        payload = copy.deepcopy(entry.get("payload"))
+        if not isinstance(payload, dict):
+            return None
+        payload["provenance"] = {
+            "cached": True,
+            "cache_key": key,
+            "measured_at": entry.get("measured_at"),
+            "reused_at": datetime.now(timezone.utc).isoformat(),
+        }
+        return payload
+
+    def store(self, key: str, payload: dict) -> dict:
+        measured_at = datetime.now(timezone.utc).isoformat()
+        payload["provenance"] = {"cached": False, "cache_key": key, "measured_at": measured_at}
+        if payload.get("status") == "ok":
+            stored = copy.deepcopy(payload)
+            stored.pop("provenance", None)
+            stored.pop("lifecycle", None)
+            write_json(self.entry_path(key), {"cache_key": key, "measured_at": measured_at, "payload": stored})
+        return payload
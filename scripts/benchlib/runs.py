@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import json
+import os
+import platform
+import re
+import secrets
+import shutil
+import sys
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchlib.io_utils import ensure_under_root, read_json
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - exercised on platforms without POSIX locks
+    fcntl = None
+
+
+RUN_ID_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]{0,63}$")
+RUN_STATUSES = ("running", "complete", "failed")
+INDEX_NAME = "index.json"
+LOCK_NAME = ".index.lock"
+# Environment knobs recorded as a run's config when it is started from the shell scripts.
+CONFIG_ENV = (
+    "BENCHMARK_FRAMEWORKS",
+    "BENCHMARK_ENDPOINT",
+    "BENCHMARK_REQUESTS",
+    "BENCHMARK_RUNS",
+    "BENCHMARK_CONCURRENCY",
+    "BENCHMARK_CPU_LIMIT",
+    "BENCHMARK_MEMORY_LIMIT",
+    "BENCHMARK_DATASET_SIZE",
+    "BENCHMARK_DATASET_SEED",
+    "BENCHMARK_KEY_DISTRIBUTION",
+    "BENCHMARK_KEY_COUNT",
+    "BENCHMARK_METHOD",
+    "BENCHMARK_PAYLOAD_SIZE",
+    "BENCHMARK_SESSION_SCRIPT",
+    "WARMUP_REQUESTS",
+    "BENCH_ENGINE",
+)
+
+
+def utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def new_run_id() -> str:
+    return f"{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}-{secrets.token_hex(3)}"
+
+
+def check_run_id(run_id: str) -> str:
+    if not isinstance(run_id, str) or not RUN_ID_PATTERN.match(run_id):
+        raise SystemExit(
+            f"Invalid run id {run_id!r}: use up to 64 letters, digits, '.', '_' or '-', starting with a letter or digit"
+        )
+    return run_id
+
+
+def runs_root_for(results_root: Path) -> Path:
+    return results_root / "runs"
+
+
+def run_dir(results_root: Path, run_id: str) -> Path:
+    runs_root = runs_root_for(results_root)
+    return ensure_under_root(runs_root / check_run_id(run_id), runs_root, "Run directory")
+
+
+def config_from_env(entrypoint: str) -> dict:
+    return {"entrypoint": entrypoint, **{name: os.environ[name] for name in CONFIG_ENV if os.environ.get(name)}}
+
+
+@contextmanager
+def _locked(runs_root: Path):
+    """Serialise index updates from concurrent sessions on the same results tree."""
+    runs_root.mkdir(parents=True, exist_ok=True)
+    with (runs_root / LOCK_NAME).open("a") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def read_index(results_root: Path) -> dict:
+    path = runs_root_for(results_root) / INDEX_NAME
+    if not path.exists():
+        return {"latest": None, "runs": []}
+    try:
+        return read_json(path)
+    except json.JSONDecodeError as exc:
+        raise SystemExit(f"Malformed run index {path}: {exc.msg}") from exc
+
+
+def _write_index(results_root: Path, index: dict) -> None:
+    path = runs_root_for(results_root) / INDEX_NAME
+    staging = path.with_name(f".{INDEX_NAME}.{os.getpid()}.tmp")
+    staging.write_text(json.dumps(index, indent=2) + "\n", encoding="utf-8")
+    os.replace(staging, path)
+
+
+def _update(results_root: Path, run_id: str, create: bool, **fields) -> dict:
+    check_run_id(run_id)
+    with _locked(runs_root_for(results_root)):
+        index = read_index(results_root)
+        entry = next((run for run in index["runs"] if run["run_id"] == run_id), None)
+        if entry is None:
+            if not create:
+                raise SystemExit(f"Run {run_id} is not in the run index")
+            entry = {"run_id": run_id, "path": f"runs/{run_id}", "created_at": utc_now()}
+            index["runs"].append(entry)
+        entry.update(fields, updated_at=utc_now())
+        if fields.get("promoted_at"):
+            index["latest"] = run_id
+        _write_index(results_root, index)
+    return entry
+
+
+def start_run(results_root: Path, run_id: str, config: dict) -> dict:
+    """Register (or re-open) a run as running; its directory is created under results/runs."""
+    run_dir(results_root, run_id).mkdir(parents=True, exist_ok=True)
+    return _update(
+        results_root,
+        run_id,
+        create=True,
+        status="running",
+        config=config,
+        host=platform.node() or "unknown",
+        pid=os.getpid(),
+        finished_at=None,
+    )
+
+
+def finish_run(results_root: Path, run_id: str, status: str) -> dict:
+    if status not in RUN_STATUSES[1:]:
+        raise SystemExit(f"Run status must be one of {', '.join(RUN_STATUSES[1:])} (got: {status})")
+    return _update(results_root, run_id, create=False, status=status, finished_at=utc_now())
+
+
+def _retire_latest_dir(results_root: Path, latest: Path) -> None:
+    """Move a pre-existing results/latest directory into the run index so promotion can replace it."""
+    stamp = datetime.fromtimestamp(latest.stat().st_mtime, timezone.utc)
+    legacy_id = f"legacy-{stamp:%Y%m%dT%H%M%SZ}"
+    suffix = 1
+    while run_dir(results_root, legacy_id).exists():
+        suffix += 1
+        legacy_id = f"legacy-{stamp:%Y%m%dT%H%M%SZ}-{suffix}"
+    os.replace(latest, run_dir(results_root, legacy_id))
+    print(f"Moved the existing results/latest directory to runs/{legacy_id} (recorded as run {legacy_id})",
+          file=sys.stderr)
+    _update(
+        results_root,
+        legacy_id,
+        create=True,
+        status="complete",
+        config={"entrypoint": "results/latest"},
+        finished_at=stamp.isoformat(),
+    )
+
+
+def _is_within(path: Path, root: Path) -> bool:
+    path, root = Path(os.path.abspath(path)), Path(os.path.abspath(root))
+    return path == root or root in path.parents
+
+
+def detach_latest(results_root: Path, paths=None) -> str | None:
+    """Give a session that is not run-scoped its own results/latest directory.
+
+    After promotion latest is a symlink into runs/, and writing through it would change
+    an archived run behind the index's back. The promoted run is copied into a fresh
+    real latest directory instead, and the index stops naming it as latest. With paths,
+    nothing happens unless one of them lies under results/latest. Returns the detached
+    run id, or None when latest was not a symlink.
+    """
+    latest = results_root / "latest"
+    if paths is not None and not any(_is_within(path, latest) for path in paths):
+        return None
+    with _locked(runs_root_for(results_root)):
+        if not latest.is_symlink():
+            return None
+        source = latest.resolve()
+        staging = results_root / f".latest.{os.getpid()}.tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+        if source.is_dir():
+            shutil.copytree(source, staging, symlinks=True)
+        else:
+            staging.mkdir()
+        latest.unlink()
+        os.replace(staging, latest)
+        index = read_index(results_root)
+        if index.get("latest") == source.name:
+            index["latest"] = None
+            _write_index(results_root, index)
+    print(
+        f"results/latest pointed at run {source.name}; replaced it with a copy so that run stays unchanged",
+        file=sys.stderr,
+    )
+    return source.name
+
+
+def promote_run(results_root: Path, run_id: str, force: bool = False) -> Path:
+    """Point results/latest at a finished run.
+
+    latest is a relative symlink swapped in with a single rename, so readers see
+    either the previous run or the new one, never a partially copied directory.
+    """
+    target = run_dir(results_root, run_id)
+    entry = next((run for run in read_index(results_root)["runs"] if run["run_id"] == run_id), None)
+    if entry is None or not (target / "raw").is_dir():
+        raise SystemExit(f"Run {run_id} has no raw results to promote under {target}")
+    if entry["status"] != "complete" and not force:
+        raise SystemExit(f"Run {run_id} is {entry['status']}; only complete runs are promoted (use --force to override)")
+
+    latest = results_root / "latest"
+    if latest.is_dir() and not latest.is_symlink():
+        _retire_latest_dir(results_root, latest)
+    staging = results_root / f".latest.{os.getpid()}.tmp"
+    staging.unlink(missing_ok=True)
+    staging.symlink_to(Path("runs") / run_id, target_is_directory=True)
+    os.replace(staging, latest)
+    _update(results_root, run_id, create=False, promoted_at=utc_now())
+    return latest
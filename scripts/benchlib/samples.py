@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import hashlib
+import mmap
+import struct
+import sys
+from pathlib import Path
+
+from benchlib.outliers import hampel_outliers
+
+
+SAMPLES_FORMAT = "request-samples-v1"
+MAGIC = b"BRSV"
+VERSION = 1
+# magic, version, record size, reserved, base epoch ns, record count; padded so records stay 8-byte aligned
+HEADER = struct.Struct("<4sHHIqQ4x")
+# send offset ns (from base), latency ns, run index, HTTP status (0 = transport failure), response bytes
+RECORD = struct.Struct("<QQHHI")
+WORDS_PER_RECORD = RECORD.size // 8
+FLUSH_RECORDS = 4096
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_failure(status: int) -> bool:
+    return status == 0 or status >= 400
+
+
+class SampleWriter:
+    """Appends fixed-width per-request records to a sidecar file.
+
+    The header's record count is written on close, so a truncated file from an
+    interrupted run fails validation instead of being read as complete.
+    """
+
+    def __init__(self, path: Path, base_ns: int | None = None):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.base_ns = base_ns
+        self.count = 0
+        self._buffer = bytearray()
+        self._handle = path.open("wb")
+        self._handle.write(HEADER.pack(MAGIC, VERSION, RECORD.size, 0, 0, 0))
+
+    def append(self, run_index: int, send_ns: int, latency_ns: int, status: int, nbytes: int) -> None:
+        if self.base_ns is None:
+            self.base_ns = send_ns
+        self._buffer += RECORD.pack(
+            max(0, send_ns - self.base_ns), max(0, latency_ns), run_index, status, min(nbytes, 0xFFFFFFFF)
+        )
+        self.count += 1
+        if len(self._buffer) >= FLUSH_RECORDS * RECORD.size:
+            self._flush()
+
+    def _flush(self) -> None:
+        self._handle.write(self._buffer)
+        self._buffer.clear()
+
+    def close(self) -> dict:
+        """Finish the file and return the reference stored in the raw artifact."""
+        self._flush()
+        self._handle.seek(0)
+        self._handle.write(HEADER.pack(MAGIC, VERSION, RECORD.size, 0, self.base_ns or 0, self.count))
+        self._handle.close()
+        return {
+            "format": SAMPLES_FORMAT,
+            "path": self.path.name,
+            "sha256": file_sha256(self.path),
+            "records": self.count,
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        if not self._handle.closed:
+            self.close()
+
+
+class SampleFile:
+    """Memory-mapped, read-only view of a sidecar.
+
+    Columns are strided memoryviews over the mapping, so nothing is copied into
+    Python objects until it is iterated. Views handed out are released on close.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        if path.stat().st_size < HEADER.size:
+            raise SystemExit(f"Request sample file is truncated: {path}")
+        self._handle = path.open("rb")
+        self._mmap = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._exports: list[memoryview] = []
+        magic, version, record_size, _, self.base_ns, self.count = HEADER.unpack_from(self._mmap, 0)
+        expected = HEADER.size + self.count * RECORD.size
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size or len(self._mmap) != expected:
+            self.close()
+            raise SystemExit(f"Unsupported or incomplete request sample file: {path}")
+        self._view = self._export(memoryview(self._mmap)[HEADER.size:])
+        self._words = self._export(self._view.cast("Q")) if sys.byteorder == "little" else None
+
+    def _export(self, view: memoryview) -> memoryview:
+        self._exports.append(view)
+        return view
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _column(self, word: int):
+        if self._words is not None:
+            return self._export(self._words[word::WORDS_PER_RECORD])
+        return [fields[word] for fields in RECORD.iter_unpack(self._view)]
+
+    def send_offsets_ns(self):
+        return self._column(0)
+
+    def latencies_ns(self):
+        return self._column(1)
+
+    def record(self, index: int) -> dict:
+        send_offset, latency, run_index, status, nbytes = RECORD.unpack_from(self._view, index * RECORD.size)
+        return {
+            "index": index,
+            "run_index": run_index,
+            "send_offset_ns": send_offset,
+            "latency_ns": latency,
+            "status": status,
+            "bytes": nbytes,
+        }
+
+    def iter_meta(self):
+        """Yield (run_index, status, bytes) per record without materialising whole records."""
+        if self._words is None:
+            for _, _, run_index, status, nbytes in RECORD.iter_unpack(self._view):
+                yield run_index, status, nbytes
+            return
+        for packed in self._column(2):
+            yield packed & 0xFFFF, (packed >> 16) & 0xFFFF, packed >> 32
+
+    def close(self) -> None:
+        for view in reversed(self._exports):
+            view.release()
+        self._exports.clear()
+        self._mmap.close()
+        self._handle.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def sidecar_matches(raw_path: Path, reference: dict) -> bool:
+    path = raw_path.parent / reference.get("path", "")
+    return path.is_file() and file_sha256(path) == reference.get("sha256")
+
+
+def resolve_sidecar(raw_path: Path, reference: dict | None) -> Path | None:
+    """Return the sidecar path referenced by a raw artifact once its hash has been verified."""
+    if not reference:
+        return None
+    if reference.get("format") != SAMPLES_FORMAT:
+        raise SystemExit(f"Unsupported request sample format in {raw_path}: {reference.get('format')}")
+    path = raw_path.parent / reference["path"]
+    if not path.exists():
+        raise SystemExit(f"Request sample file referenced by {raw_path} not found: {path}")
+    if file_sha256(path) != reference.get("sha256"):
+        raise SystemExit(f"Request sample file {path} does not match the sha256 recorded in {raw_path}")
+    return path
+
+
+def summarize_samples(samples: SampleFile) -> dict:
+    latencies = samples.latencies_ns()
+    failed = 0
+    total_bytes = 0
+    for _, status, nbytes in samples.iter_meta():
+        failed += is_failure(status)
+        total_bytes += nbytes
+    summary = {"records": len(samples), "failed": failed, "bytes": total_bytes}
+    if len(samples):
+        slowest = samples.record(max(range(len(samples)), key=latencies.__getitem__))
+        summary["slowest"] = {
+            "run_index": slowest["run_index"],
+            "send_offset_ms": slowest["send_offset_ns"] / 1_000_000,
+            "latency_ms": slowest["latency_ns"] / 1_000_000,
+            "status": slowest["status"],
+        }
+    return summary
+
+
+def hampel_flagged_by_run(samples: SampleFile, half_window: int, threshold: float) -> dict[int, int]:
+    """Recompute per-run Hampel counts from stored requests, in issue order, excluding failures."""
+    series: dict[int, list[int]] = {}
+    latencies = samples.latencies_ns()
+    for index, (run_index, status, _) in enumerate(samples.iter_meta()):
+        if not is_failure(status):
+            series.setdefault(run_index, []).append(latencies[index])
+    return {run: len(hampel_outliers(values, half_window, threshold)) for run, values in sorted(series.items())}
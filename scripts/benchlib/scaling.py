@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import math
+import os
+
+# The load generator is one Python process whose request threads share the GIL, so it
+# cannot use much more than one core; at 0.9 of a core it is the bottleneck, not the target.
+DEFAULT_CLIENT_SATURATION = 0.9
+
+
+def parse_cpu_steps(value: str, cpu_count: int | None = None) -> list[int]:
+    """Parse a list like "1,2,4,N" where N is the host CPU count."""
+    host_cpus = cpu_count or os.cpu_count() or 1
+    steps = []
+    for item in value.split(","):
+        token = item.strip()
+        if not token:
+            continue
+        if token.upper() == "N":
+            cpus = host_cpus
+        else:
+            try:
+                cpus = int(token)
+            except ValueError as exc:
+                raise SystemExit(f"Invalid CPU step: {token!r}") from exc
+        if cpus < 1:
+            raise SystemExit(f"CPU steps must be >= 1: {cpus}")
+        if cpus not in steps:
+            steps.append(cpus)
+    if 1 not in steps:
+        raise SystemExit("CPU steps must include 1 to compute speedup")
+    return sorted(steps)
+
+
+def parse_cpu_set(value: str) -> set[int]:
+    """Parse a cpuset list like "0-1,6" into CPU ids."""
+    cpus = set()
+    for item in value.split(","):
+        token = item.strip()
+        if not token:
+            continue
+        first, _, last = token.partition("-")
+        try:
+            start, end = int(first), int(last or first)
+        except ValueError as exc:
+            raise SystemExit(f"Invalid CPU list entry: {token!r}") from exc
+        if start < 0 or end < start:
+            raise SystemExit(f"Invalid CPU list entry: {token!r}")
+        cpus.update(range(start, end + 1))
+    if not cpus:
+        raise SystemExit(f"CPU list is empty: {value!r}")
+    return cpus
+
+
+def fit_amdahl(points: list[tuple[int, float]]) -> dict | None:
+    """Fit N/C(N) - 1 = sigma * (N - 1) through the origin."""
+    rows = [(n - 1, n / c - 1) for n, c in points if n > 1 and c > 0]
+    denominator = sum(a * a for a, _ in rows)
+    if not rows or denominator == 0:
+        return None
+    sigma = max(0.0, sum(a * y for a, y in rows) / denominator)
+    return {"sigma": sigma, "r_squared": r_squared(points, sigma, 0.0)}
+
+
+def fit_usl(points: list[tuple[int, float]]) -> dict | None:
+    """Least-squares fit of the Universal Scalability Law on normalised capacity C(N) = X(N) / X(1).
+
+    N/C(N) - 1 = sigma * (N - 1) + kappa * N * (N - 1), solved as a two-regressor
+    linear model without intercept; a negative coefficient is clamped to zero and the
+    other one refitted alone.
+    """
+    rows = [(n - 1, n * (n - 1), n / c - 1) for n, c in points if n > 1 and c > 0]
+    if len(rows) < 2:
+        return None
+    saa = sum(a * a for a, _, _ in rows)
+    sbb = sum(b * b for _, b, _ in rows)
+    sab = sum(a * b for a, b, _ in rows)
+    say = sum(a * y for a, _, y in rows)
+    sby = sum(b * y for _, b, y in rows)
+    determinant = saa * sbb - sab * sab
+    if determinant == 0:
+        return None
+    sigma = (say * sbb - sby * sab) / determinant
+    kappa = (saa * sby - sab * say) / determinant
+    if kappa < 0:
+        kappa = 0.0
+        sigma = max(0.0, say / saa)
+    elif sigma < 0:
+        sigma = 0.0
+        kappa = max(0.0, sby / sbb)
+
+    peak = None
+    if kappa > 0 and sigma < 1:
+        peak = math.sqrt((1 - sigma) / kappa)
+    return {
+        "sigma": sigma,
+        "kappa": kappa,
+        "peak_cpus": peak,
+        "r_squared": r_squared(points, sigma, kappa),
+    }
+
+
+def usl_capacity(n: int, sigma: float, kappa: float) -> float:
+    return n / (1 + sigma * (n - 1) + kappa * n * (n - 1))
+
+
+def r_squared(points: list[tuple[int, float]], sigma: float, kappa: float) -> float | None:
+    observed = [c for _, c in points]
+    if len(observed) < 2:
+        return None
+    mean = sum(observed) / len(observed)
+    total = sum((c - mean) ** 2 for c in observed)
+    if total == 0:
+        return None
+    residual = sum((c - usl_capacity(n, sigma, kappa)) ** 2 for n, c in points)
+    return 1 - residual / total
+
+
+def analyze_scaling(
+    measurements: dict[int, float],
+    client_utilisation: dict[int, float] | None = None,
+    client_saturation: float = DEFAULT_CLIENT_SATURATION,
+) -> dict | None:
+    """Compute speedup, parallel efficiency, and Amdahl/USL fits from {cpus: rps}.
+
+    When the load generator's CPU use per step is given, steps where it reached
+    client_saturation cores are marked client_bound and left out of the fits: their
+    throughput is the client's limit, not the target's. A client-bound single-CPU step
+    leaves no valid baseline, so both fits are None.
+    """
+    base = measurements.get(1)
+    if not base:
+        return None
+    steps = []
+    points = []
+    for cpus in sorted(measurements):
+        rps = measurements[cpus]
+        speedup = rps / base
+        step = {"cpus": cpus, "rps": rps, "speedup": speedup, "efficiency": speedup / cpus}
+        if client_utilisation is not None and cpus in client_utilisation:
+            step["client_cpu_utilisation"] = client_utilisation[cpus]
+            step["client_bound"] = client_utilisation[cpus] >= client_saturation
+        steps.append(step)
+        if not step.get("client_bound"):
+            points.append((cpus, speedup))
+    if any(step.get("client_bound") for step in steps if step["cpus"] == 1):
+        points = []
+    return {
+        "steps": steps,
+        "amdahl": fit_amdahl(points),
+        "usl": fit_usl(points),
+    }
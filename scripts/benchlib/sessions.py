@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import itertools
+import json
+import re
+import statistics
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from benchlib.histogram import LatencyHistogram, pooled_percentiles_ms
+from benchlib.payloads import CONTENT_TYPE
+
+
+SESSION_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE")
+CAPTURE_SOURCES = ("body", "header")
+# Variables every session has before its first step: the virtual user and the session's global index.
+BUILTIN_VARIABLES = ("vu", "iteration")
+PLACEHOLDER = re.compile(r"\{(\w+)\}")
+MAX_EXAMPLES = 5
+
+
+def placeholders(value) -> set[str]:
+    if isinstance(value, str):
+        return set(PLACEHOLDER.findall(value))
+    if isinstance(value, dict):
+        return set().union(*(placeholders(item) for item in value.values()))
+    if isinstance(value, list):
+        return set().union(*(placeholders(item) for item in value))
+    return set()
+
+
+def render(value, variables: dict):
+    """Substitute {name} placeholders in strings, recursively through JSON objects and arrays."""
+    if isinstance(value, str):
+        return PLACEHOLDER.sub(lambda match: str(variables[match.group(1)]), value)
+    if isinstance(value, dict):
+        return {key: render(item, variables) for key, item in value.items()}
+    if isinstance(value, list):
+        return [render(item, variables) for item in value]
+    return value
+
+
+def normalize_session_script(script: dict, source: str = "session script") -> dict:
+    """Validate a session script and check that every placeholder is bound by an earlier step."""
+    if not isinstance(script, dict) or not isinstance(script.get("steps"), list) or not script["steps"]:
+        raise SystemExit(f"{source} must be an object with a non-empty steps list")
+    bound = set(BUILTIN_VARIABLES)
+    steps = []
+    for index, step in enumerate(script["steps"]):
+        name = step.get("name") or f"step{index + 1}"
+        method = str(step.get("method") or "GET").upper()
+        if method not in SESSION_METHODS:
+            raise SystemExit(f"{source}: step {name} method must be one of {', '.join(SESSION_METHODS)}")
+        path = step.get("path")
+        if not isinstance(path, str) or not path.startswith(("/", "{")):
+            raise SystemExit(f"{source}: step {name} path must start with / or a captured variable")
+        unbound = placeholders([path, step.get("body")]) - bound
+        if unbound:
+            raise SystemExit(f"{source}: step {name} uses {', '.join(sorted(unbound))} before any step captures it")
+        capture = dict(step.get("capture") or {})
+        for variable, location in capture.items():
+            kind, _, field = str(location).partition(".")
+            if kind not in CAPTURE_SOURCES or not field:
+                raise SystemExit(f"{source}: step {name} capture {variable} must be body.<field> or header.<Name>")
+        expect_status = step.get("expect_status")
+        if isinstance(expect_status, bool) or not isinstance(expect_status, int):
+            raise SystemExit(f"{source}: step {name} needs an integer expect_status")
+        steps.append({
+            "name": name,
+            "method": method,
+            "path": path,
+            "body": step.get("body"),
+            "expect_status": expect_status,
+            "capture": capture,
+        })
+        bound.update(capture)
+    names = [step["name"] for step in steps]
+    if len(names) != len(set(names)):
+        raise SystemExit(f"{source}: step names must be unique")
+    return {"name": script.get("name") or "session", "steps": steps}
+
+
+def load_session_script(path: Path) -> dict:
+    try:
+        script = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        raise SystemExit(f"Invalid session script {path}: {exc}") from exc
+    return normalize_session_script(script, str(path))
+
+
+def capture_value(location: str, headers, document):
+    kind, _, field = location.partition(".")
+    if kind == "header":
+        return headers.get(field) if headers is not None else None
+    value = document
+    for key in field.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def send(url: str, method: str, body: bytes | None):
+    """Issue one request and return (status or 0, headers, response body)."""
+    headers = {"Content-Type": CONTENT_TYPE} if body is not None else {}
+    request = urllib.request.Request(url, data=body, method=method, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as exc:
+        try:
+            content = exc.read()
+        except Exception:
+            content = b""
+        return exc.code, exc.headers, content
+    except Exception:
+        return 0, None, b""
+
+
+class VirtualUserResult:
+    """Latencies and failures collected by one virtual user; merged after the run so workers share no state."""
+
+    def __init__(self, step_names):
+        self.step_latencies = {name: [] for name in step_names}
+        self.step_failures = dict.fromkeys(step_names, 0)
+        self.session_latencies = []
+        self.sessions = 0
+        self.examples = []
+        self.wall = 0.0
+
+
+def latency_fields(durations) -> dict:
+    """p50/p95/p99/max in ms, computed as measure_legacy does for single-request runs."""
+    if len(durations) < 2:
+        value = durations[0] * 1000 if durations else 0.0
+        return {"latency_ms_p50": value, "latency_ms_p95": value, "latency_ms_p99": value, "latency_ms_max": value}
+    return {
+        "latency_ms_p50": statistics.median(durations) * 1000,
+        "latency_ms_p95": statistics.quantiles(durations, n=20)[18] * 1000,
+        "latency_ms_p99": statistics.quantiles(durations, n=100)[98] * 1000,
+        "latency_ms_max": max(durations) * 1000,
+    }
+
+
+def run_session(base_url: str, script: dict, variables: dict, result: VirtualUserResult) -> float | None:
+    """Run the script once; return the first step's latency, or None when the first step failed.
+
+    Each step is timed from send to fully read response. Rendering the request happens
+    before the clock starts and capturing happens after it stops, so only the session
+    total includes the harness's own work between steps.
+    """
+    result.sessions += 1
+    first_latency = None
+    session_start = time.perf_counter()
+    for step in script["steps"]:
+        path = render(step["path"], variables)
+        url = path if path.startswith(("http://", "https://")) else base_url + path
+        body = None if step["body"] is None else json.dumps(render(step["body"], variables)).encode("utf-8")
+        start = time.perf_counter()
+        status, headers, content = send(url, step["method"], body)
+        elapsed = time.perf_counter() - start
+        problem = None
+        if status != step["expect_status"]:
+            problem = f"status {status} != {step['expect_status']}"
+        elif step["capture"]:
+            try:
+                document = json.loads(content) if content else None
+            except ValueError:
+                document = None
+            for variable, location in step["capture"].items():
+                value = capture_value(location, headers, document)
+                if value is None:
+                    problem = f"capture {variable} from {location} missing"
+                    break
+                variables[variable] = value
+        if problem is not None:
+            result.step_failures[step["name"]] += 1
+            if len(result.examples) < MAX_EXAMPLES:
+                result.examples.append({"iteration": variables["iteration"], "step": step["name"], "problem": problem})
+            return first_latency
+        result.step_latencies[step["name"]].append(elapsed)
+        if first_latency is None:
+            first_latency = elapsed
+    result.session_latencies.append(time.perf_counter() - session_start)
+    return first_latency
+
+
+def run_virtual_user(base_url: str, script: dict, vu: int, iterations, sessions: int) -> VirtualUserResult:
+    result = VirtualUserResult([step["name"] for step in script["steps"]])
+    for iteration in iterations:
+        if iteration >= sessions:
+            break
+        run_session(base_url, script, {"vu": vu, "iteration": iteration}, result)
+    return result
+
+
+def session_run(base_url: str, script: dict, sessions: int, virtual_users: int, first_iteration: int = 0) -> dict:
+    """Run sessions scripted sessions spread over virtual_users concurrent workers.
+
+    Workers pull session indexes from a shared counter, so a slow virtual user
+    does not hold back the others and every index runs exactly once.
+    """
+    iterations = itertools.count(first_iteration)
+    last = first_iteration + sessions
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=virtual_users) as pool:
+        results = list(pool.map(
+            lambda vu: run_virtual_user(base_url, script, vu, iterations, last), range(virtual_users)
+        ))
+    wall = time.perf_counter() - start
+    names = [step["name"] for step in script["steps"]]
+    merged = VirtualUserResult(names)
+    for result in results:
+        for name in names:
+            merged.step_latencies[name].extend(result.step_latencies[name])
+            merged.step_failures[name] += result.step_failures[name]
+        merged.session_latencies.extend(result.session_latencies)
+        merged.sessions += result.sessions
+        merged.examples.extend(result.examples)
+    merged.examples = merged.examples[:MAX_EXAMPLES]
+    merged.wall = wall
+    return merged
+
+
+def session_run_stats(result: VirtualUserResult) -> dict | None:
+    """Run record in the measure_legacy shape plus session fields; request fields cover every step."""
+    durations = [latency for latencies in result.step_latencies.values() for latency in latencies]
+    if not result.session_latencies:
+        return None
+    wall = result.wall
+    errors = sum(result.step_failures.values())
+    requests = len(durations) + errors
+    run = {
+        "requests": requests,
+        "duration_seconds": wall,
+        "rps": requests / wall if wall > 0 else 0.0,
+        **latency_fields(durations),
+        "errors": errors,
+        "error_rate": errors / requests if requests else 0.0,
+        "latency_histogram": LatencyHistogram.from_seconds(durations).to_dict(),
+        "sessions": result.sessions,
+        "sessions_completed": len(result.session_latencies),
+        "sessions_per_second": len(result.session_latencies) / wall if wall > 0 else 0.0,
+        "session_failure_rate": 1 - len(result.session_latencies) / result.sessions,
+        **{f"session_{key}": value for key, value in latency_fields(result.session_latencies).items()},
+        "session_histograms": {
+            "session": LatencyHistogram.from_seconds(result.session_latencies).to_dict(),
+            "steps": {
+                name: LatencyHistogram.from_seconds(latencies).to_dict()
+                for name, latencies in result.step_latencies.items()
+            },
+        },
+        "session_failures": dict(result.step_failures),
+    }
+    if result.examples:
+        run["session_failure_examples"] = result.examples
+    return run
+
+
+def summarize_sessions(script: dict, virtual_users: int, run_stats, script_path: str | None = None) -> dict:
+    """Pool per-step and end-to-end session percentiles over the given (non-excluded) runs."""
+
+    def pooled(key):
+        merged = None
+        for run in run_stats:
+            payload = run["session_histograms"]["session"] if key is None else run["session_histograms"]["steps"][key]
+            histogram = LatencyHistogram.from_dict(payload)
+            merged = histogram if merged is None else merged.merge(histogram)
+        return pooled_percentiles_ms(merged)
+
+    steps = []
+    for step in script["steps"]:
+        failures = sum(run["session_failures"][step["name"]] for run in run_stats)
+        latency = pooled(step["name"])
+        steps.append({
+            "name": step["name"],
+            "method": step["method"],
+            "path": step["path"],
+            "requests": (latency or {}).get("count", 0) + failures,
+            "failures": failures,
+            "latency_ms": latency,
+        })
+    sessions = sum(run["sessions"] for run in run_stats)
+    completed = sum(run["sessions_completed"] for run in run_stats)
+    summary = {
+        "script": script["name"],
+        "virtual_users": virtual_users,
+        "steps": steps,
+        "session": {
+            "sessions": sessions,
+            "completed": completed,
+            "failures": sessions - completed,
+            "latency_ms": pooled(None),
+        },
+    }
+    if script_path:
+        summary["script_file"] = script_path
+    return summary
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import json
+import statistics
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchlib.measurement import ResourceProbe, collect_docker_stats, parse_mem_to_mb, request_once
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float | None:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize_window(index: int, elapsed: float, window_seconds: float, latencies: list[float], errors: int,
+                     memory_mb: float | None) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "type": "window",
+        "index": index,
+        "elapsed_seconds": elapsed,
+        "window_seconds": window_seconds,
+        "requests": len(ordered),
+        "errors": errors,
+        "rps": len(ordered) / window_seconds if window_seconds > 0 else 0.0,
+        "latency_ms_p50": _ms(percentile(ordered, 0.50)),
+        "latency_ms_p95": _ms(percentile(ordered, 0.95)),
+        "latency_ms_p99": _ms(percentile(ordered, 0.99)),
+        "latency_ms_max": _ms(ordered[-1] if ordered else None),
+        "memory_mb": memory_mb,
+    }
+
+
+def _ms(seconds: float | None) -> float | None:
+    return None if seconds is None else seconds * 1000
+
+
+def _mb(value: int | None) -> float | None:
+    return None if value is None else value / (1024 * 1024)
+
+
+class WindowCollector:
+    """Thread-safe sample buffer that is swapped out at each window boundary."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = []
+        self.errors = 0
+
+    def record(self, latency: float | None) -> None:
+        with self.lock:
+            if latency is None:
+                self.errors += 1
+            else:
+                self.latencies.append(latency)
+
+    def drain(self) -> tuple[list[float], int]:
+        with self.lock:
+            latencies, errors = self.latencies, self.errors
+            self.latencies, self.errors = [], 0
+        return latencies, errors
+
+
+def memory_sampler(framework: str, probe: ResourceProbe | None = None):
+    """Return (source, read_mb) for the soak memory series.
+
+    The container's anonymous cgroup memory is a file read, so it is cheap enough to take
+    at every window boundary. Without a readable cgroup the series falls back to
+    `docker stats`, which reports cgroup usage including page cache and blocks for a second or two.
+    """
+    probe = probe or ResourceProbe(framework)
+    if probe.anon_memory_bytes() is not None:
+        return "cgroup_anon", lambda: _mb(probe.anon_memory_bytes())
+    return "docker_stats_usage", lambda: parse_mem_to_mb(collect_docker_stats(framework).get("memory"))
+
+
+def run_soak(url: str, framework: str, out_path: Path, duration_seconds: float, window_seconds: float,
+             concurrency: int, header: dict | None = None, probe: ResourceProbe | None = None) -> list[dict]:
+    """Hold steady closed-loop load and stream one JSON line per window to out_path."""
+    collector = WindowCollector()
+    stop = threading.Event()
+    memory_source, read_memory_mb = memory_sampler(framework, probe)
+
+    def worker():
+        while not stop.is_set():
+            try:
+                collector.record(request_once(url))
+            except Exception:
+                collector.record(None)
+
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    windows = []
+    with out_path.open("w", encoding="utf-8") as handle:
+        meta = {
+            "type": "header",
+            "schema_version": "soak-v1",
+            "framework": framework,
+            "url": url,
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "duration_seconds": duration_seconds,
+            "window_seconds": window_seconds,
+            "concurrency": concurrency,
+            "memory_source": memory_source,
+        }
+        meta.update(header or {})
+        handle.write(json.dumps(meta) + "\n")
+        handle.flush()
+
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(max(1, concurrency))]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        try:
+            index = 0
+            window_start = start
+            while window_start - start < duration_seconds:
+                boundary = min(window_start + window_seconds, start + duration_seconds)
+                time.sleep(max(0.0, boundary - time.monotonic()))
+                latencies, errors = collector.drain()
+                now = time.monotonic()
+                # The next window opens at the drain, so requests that complete while memory
+                # is read are counted in it rather than dropped.
+                memory_mb = read_memory_mb()
+                row = summarize_window(index, now - start, now - window_start, latencies, errors, memory_mb)
+                handle.write(json.dumps(row) + "\n")
+                handle.flush()
+                windows.append(row)
+                index += 1
+                window_start = now
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join(timeout=10)
+    return windows
+
+
+def load_soak_windows(path: Path) -> tuple[dict, list[dict]]:
+    header = {}
+    windows = []
+    with path.open("r", encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise SystemExit(f"Malformed soak record in {path}:{line_number}: {exc.msg}") from exc
+            if row.get("type") == "header":
+                header = row
+            elif row.get("type") == "window":
+                windows.append(row)
+    return header, windows
+
+
+def slope_per_hour(windows: list[dict], key: str) -> tuple[float | None, float | None]:
+    """Return (OLS slope per hour, fitted value at t=0) for a windowed series."""
+    points = [
+        (row["elapsed_seconds"] / 3600.0, row[key])
+        for row in windows
+        if isinstance(row.get(key), (int, float)) and isinstance(row.get("elapsed_seconds"), (int, float))
+    ]
+    if len(points) < 2 or len({x for x, _ in points}) < 2:
+        return None, None
+    slope, intercept = statistics.linear_regression([x for x, _ in points], [y for _, y in points])
+    return slope, intercept
+
+
+def relative_drift(slope: float | None, intercept: float | None) -> float | None:
+    if slope is None or not intercept:
+        return None
+    return slope / intercept * 100
+
+
+def analyze_soak(windows: list[dict], warmup_windows: int = 0) -> dict:
+    """Fit memory, latency and throughput trends over the windows after the first warmup_windows.
+
+    Startup windows (allocator growth, JIT, connection pools filling) would otherwise read as
+    a leak or a drift. The error rate still covers every window.
+    """
+    total_requests = sum(row.get("requests") or 0 for row in windows)
+    total_errors = sum(row.get("errors") or 0 for row in windows)
+    excluded = min(max(0, warmup_windows), len(windows))
+    windows = windows[excluded:]
+    memory_slope, _ = slope_per_hour(windows, "memory_mb")
+    p95_slope, p95_intercept = slope_per_hour(windows, "latency_ms_p95")
+    p99_slope, p99_intercept = slope_per_hour(windows, "latency_ms_p99")
+    rps_slope, rps_intercept = slope_per_hour(windows, "rps")
+    return {
+        "windows": len(windows),
+        "warmup_windows_excluded": excluded,
+        "memory_growth_mb_per_hour": memory_slope,
+        "latency_ms_p95_drift_percent_per_hour": relative_drift(p95_slope, p95_intercept),
+        "latency_ms_p99_drift_percent_per_hour": relative_drift(p99_slope, p99_intercept),
+        "rps_drift_percent_per_hour": relative_drift(rps_slope, rps_intercept),
+        "error_rate": (total_errors / (total_requests + total_errors)) if (total_requests + total_errors) else None,
+    }
@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+from statistics import NormalDist, median
+
+
+DEFAULT_CONFIDENCE = 0.95
+
+
+def _beta_continued_fraction(a: float, b: float, x: float) -> float:
+    # Modified Lentz evaluation of the incomplete beta continued fraction.
+    tiny = 1e-300
+    qab = a + b
+    qap = a + 1.0
+    qam = a - 1.0
+    c = 1.0
+    d = 1.0 - qab * x / qap
+    if abs(d) < tiny:
+        d = tiny
+    d = 1.0 / d
+    h = d
+    for m in range(1, 10_000):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1.0 + aa * d
+        if abs(d) < tiny:
+            d = tiny
+        c = 1.0 + aa / c
+        if abs(c) < tiny:
+            c = tiny
+        d = 1.0 / d
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1.0 + aa * d
+        if abs(d) < tiny:
+            d = tiny
+        c = 1.0 + aa / c
+        if abs(c) < tiny:
+            c = tiny
+        d = 1.0 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < 1e-14:
+            break
+    return h
+
+
+def regularized_incomplete_beta(a: float, b: float, x: float) -> float:
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    log_front = (
+        math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log1p(-x)
+    )
+    front = math.exp(log_front)
+    if x < (a + 1.0) / (a + b + 2.0):
+        return front * _beta_continued_fraction(a, b, x) / a
+    return 1.0 - front * _beta_continued_fraction(b, a, 1.0 - x) / b
+
+
+def binomial_upper_tail(n: int, p: float, k: int) -> float:
+    """P(Binomial(n, p) >= k)."""
+    if k <= 0:
+        return 1.0
+    if k > n:
+        return 0.0
+    return regularized_incomplete_beta(k, n - k + 1, p)
+
+
+def order_statistic_rank(n: int, q: float) -> int:
+    """1-based rank of the order statistic used as the q-quantile of n values."""
+    return min(n, max(1, math.ceil(q * n)))
+
+
+def bootstrap_quantile_ci(sorted_values, q: float, confidence: float = DEFAULT_CONFIDENCE):
+    """Exact percentile-bootstrap CI for the q-quantile of sorted_values.
+
+    The bootstrap distribution of the k-th order statistic of a resample is known in
+    closed form: P(X*_(k) <= x_(j)) = P(Binomial(n, j/n) >= k). Searching that CDF for
+    the alpha/2 and 1-alpha/2 levels gives the limit of infinitely many resamples in
+    O(log n) evaluations, so the cost stays flat with thousands of runs or millions of
+    per-request samples once the input is sorted.
+    """
+    n = len(sorted_values)
+    if n == 0:
+        return None, None
+    k = order_statistic_rank(n, q)
+    alpha = 1.0 - confidence
+
+    def first_rank_reaching(level):
+        low, high = 1, n
+        while low < high:
+            mid = (low + high) // 2
+            if binomial_upper_tail(n, mid / n, k) >= level:
+                high = mid
+            else:
+                low = mid + 1
+        return low
+
+    lower = sorted_values[first_rank_reaching(alpha / 2) - 1]
+    upper = sorted_values[first_rank_reaching(1.0 - alpha / 2) - 1]
+    return lower, upper
+
+
+def median_ci(values, confidence: float = DEFAULT_CONFIDENCE):
+    return bootstrap_quantile_ci(sorted(values), 0.5, confidence)
+
+
+SUMMARY_METRICS = ("rps", "latency_ms_p50", "latency_ms_p95", "latency_ms_p99")
+
+POOLED_QUANTILES = {
+    "p50": 0.50,
+    "p90": 0.90,
+    "p95": 0.95,
+    "p99": 0.99,
+    "p99_9": 0.999,
+    "p99_99": 0.9999,
+}
+
+
+def summarize_confidence_intervals(run_stats, sorted_latency_ms=None, confidence: float = DEFAULT_CONFIDENCE):
+    """CIs for the reported medians of runs, plus pooled percentiles when per-request samples exist.
+
+    sorted_latency_ms may be any sorted sequence (for example a histogram view); it is
+    indexed by rank, never copied.
+    """
+    metrics = {}
+    for key in SUMMARY_METRICS:
+        values = sorted(run[key] for run in run_stats if isinstance(run.get(key), (int, float)))
+        if not values:
+            continue
+        lower, upper = bootstrap_quantile_ci(values, 0.5, confidence)
+        metrics[key] = {"lower": lower, "upper": upper, "basis": "run_medians", "samples": len(values)}
+    if sorted_latency_ms:
+        for name, q in POOLED_QUANTILES.items():
+            lower, upper = bootstrap_quantile_ci(sorted_latency_ms, q, confidence)
+            metrics[f"pooled_latency_ms_{name}"] = {
+                "lower": lower,
+                "upper": upper,
+                "basis": "request_samples",
+                "samples": len(sorted_latency_ms),
+            }
+    return {
+        "method": "exact_percentile_bootstrap",
+        "confidence": confidence,
+        "metrics": metrics,
+    }
+
+
+EXACT_U_MAX_SAMPLES = 30
+
+
+def average_ranks(values):
+    """1-based ranks with ties sharing their average rank, plus the tie group sizes."""
+    order = sorted(range(len(values)), key=lambda idx: values[idx])
+    ranks = [0.0] * len(values)
+    ties = []
+    start = 0
+    while start < len(order):
+        end = start
+        while end + 1 < len(order) and values[order[end + 1]] == values[order[start]]:
+            end += 1
+        rank = (start + end) / 2 + 1
+        for position in range(start, end + 1):
+            ranks[order[position]] = rank
+        if end > start:
+            ties.append(end - start + 1)
+        start = end + 1
+    return ranks, ties
+
+
+@lru_cache(maxsize=None)
+def _u_counts(m: int, n: int) -> tuple:
+    # Number of orderings of m baseline and n candidate values giving each U in 0..m*n.
+    if m == 0 or n == 0:
+        return (1,)
+    without_last_baseline = _u_counts(m - 1, n)
+    without_last_candidate = _u_counts(m, n - 1)
+    counts = [0] * (m * n + 1)
+    for u, count in enumerate(without_last_candidate):
+        counts[u] += count
+    for u, count in enumerate(without_last_baseline):
+        counts[u + n] += count
+    return tuple(counts)
+
+
+def exact_u_cdf(m: int, n: int, u: float) -> float:
+    counts = _u_counts(m, n)
+    return sum(counts[: math.floor(u) + 1]) / math.comb(m + n, m)
+
+
+def use_exact_u(m: int, n: int, ties) -> bool:
+    return not ties and m <= EXACT_U_MAX_SAMPLES and n <= EXACT_U_MAX_SAMPLES
+
+
+def mann_whitney_u(baseline, candidate):
+    """Two-sided Mann-Whitney U test.
+
+    U counts candidate/baseline pairs where the candidate is larger (ties count half).
+    Small tie-free samples use the exact null distribution; otherwise the normal
+    approximation with tie and continuity corrections is used.
+    """
+    m, n = len(baseline), len(candidate)
+    if m == 0 or n == 0:
+        return {"u_statistic": None, "p_value": None, "test": None}
+    ranks, ties = average_ranks(list(baseline) + list(candidate))
+    u = sum(ranks[m:]) - n * (n + 1) / 2
+    if use_exact_u(m, n, ties):
+        lower_tail = exact_u_cdf(m, n, u)
+        upper_tail = 1.0 - exact_u_cdf(m, n, u - 1)
+        p_value = min(1.0, 2 * min(lower_tail, upper_tail))
+        return {"u_statistic": u, "p_value": p_value, "test": "exact"}
+
+    total = m + n
+    tie_term = sum(t ** 3 - t for t in ties) / (total * (total - 1))
+    variance = m * n / 12 * ((total + 1) - tie_term)
+    if variance <= 0:
+        return {"u_statistic": u, "p_value": 1.0, "test": "normal"}
+    z = max(0.0, abs(u - m * n / 2) - 0.5) / math.sqrt(variance)
+    return {"u_statistic": u, "p_value": min(1.0, 2 * (1 - NormalDist().cdf(z))), "test": "normal"}
+
+
+def minimum_attainable_p(m: int, n: int) -> float:
+    """Smallest two-sided exact U p-value for sample sizes m and n (complete separation)."""
+    if m == 0 or n == 0:
+        return 1.0
+    return min(1.0, 2 / math.comb(m + n, m))
+
+
+def hodges_lehmann(baseline, candidate, confidence: float = DEFAULT_CONFIDENCE):
+    """Hodges-Lehmann shift (candidate - baseline) with a distribution-free CI.
+
+    The interval is read off the sorted pairwise differences at the ranks given by the
+    U critical value (Moses' method). When the samples are too small to reach the
+    requested confidence the bounds are None.
+    """
+    m, n = len(baseline), len(candidate)
+    if m == 0 or n == 0:
+        return None, None, None
+    differences = sorted(y - x for x in baseline for y in candidate)
+    estimate = median(differences)
+    alpha = 1.0 - confidence
+    _, ties = average_ranks(list(baseline) + list(candidate))
+    if use_exact_u(m, n, ties):
+        critical = -1
+        while exact_u_cdf(m, n, critical + 1) <= alpha / 2:
+            critical += 1
+    else:
+        z = NormalDist().inv_cdf(1 - alpha / 2)
+        critical = math.floor(m * n / 2 - z * math.sqrt(m * n * (m + n + 1) / 12))
+    if critical < 0:
+        return estimate, None, None
+    return estimate, differences[critical], differences[len(differences) - critical - 1]
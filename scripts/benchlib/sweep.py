@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchlib.dataset import check_dataset_size
+from benchlib.io_utils import read_json, write_json
+from benchlib.keys import parse_key_distribution
+from benchlib.payloads import check_method, parse_payload_size
+from benchlib.result_cache import canonical_hash
+from benchlib.targets import parse_framework_list
+
+
+DIMENSIONS = ("frameworks", "endpoints", "concurrency", "dataset_sizes", "payload_sizes", "cpu_limits", "memory_limits")
+
+DEFAULT_WORKLOAD = {
+    "warmup_requests": 100,
+    "benchmark_requests": 300,
+    "runs": 3,
+    "engine": "legacy",
+}
+
+DEFAULT_LIMITS = {
+    "cpu_limits": ["1.00"],
+    "memory_limits": ["1024m"],
+}
+
+
+def load_sweep_spec(path: Path) -> dict:
+    if not path.exists():
+        raise SystemExit(f"Sweep spec not found: {path}")
+    try:
+        spec = read_json(path)
+    except json.JSONDecodeError as exc:
+        raise SystemExit(f"Malformed sweep spec {path}: {exc.msg} at line {exc.lineno}") from exc
+    return normalize_sweep_spec(spec, default_name=path.stem)
+
+
+def normalize_dataset_size(value):
+    """None keeps the parity fixture seed; an integer streams a synthetic dataset of that many users."""
+    return None if value is None else check_dataset_size(value)
+
+
+def normalize_payload_size(value):
+    """None sends the workload without a padded body; sizes such as "16KB" become byte counts."""
+    return None if value is None else parse_payload_size(value)
+
+
+def normalize_sweep_spec(spec: dict, default_name: str = "sweep") -> dict:
+    if not isinstance(spec, dict):
+        raise SystemExit("Sweep spec must be a JSON object")
+
+    name = spec.get("name") or default_name
+    if not re.fullmatch(r"[A-Za-z0-9][A-Za-z0-9_.-]*", str(name)):
+        raise SystemExit(f"Sweep name must be a simple path segment: {name!r}")
+
+    frameworks = spec.get("frameworks")
+    normalized = {
+        "name": str(name),
+        "frameworks": parse_framework_list(",".join(frameworks) if frameworks else ""),
+        "endpoints": list(spec.get("endpoints") or ["/health"]),
+        "concurrency": [int(value) for value in spec.get("concurrency") or [1]],
+        "dataset_sizes": [normalize_dataset_size(value) for value in spec.get("dataset_sizes") or [None]],
+        "payload_sizes": [normalize_payload_size(value) for value in spec.get("payload_sizes") or [None]],
+        "cpu_limits": [str(value) for value in spec.get("cpu_limits") or DEFAULT_LIMITS["cpu_limits"]],
+        "memory_limits": [str(value) for value in spec.get("memory_limits") or DEFAULT_LIMITS["memory_limits"]],
+        "workload": {**DEFAULT_WORKLOAD, **(spec.get("workload") or {})},
+    }
+
+    for endpoint in normalized["endpoints"]:
+        if not isinstance(endpoint, str) or not endpoint.startswith("/"):
+            raise SystemExit(f"Sweep endpoints must be absolute paths: {endpoint!r}")
+    for value in normalized["concurrency"]:
+        if value < 1:
+            raise SystemExit(f"Sweep concurrency values must be >= 1: {value}")
+    if normalized["workload"].get("key_distribution"):
+        parse_key_distribution(normalized["workload"]["key_distribution"])
+    method = check_method(normalized["workload"].get("method"))
+    if method == "GET" and normalized["payload_sizes"] != [None]:
+        raise SystemExit("Sweep payload_sizes need workload.method POST or PUT")
+    for dimension in DIMENSIONS:
+        values = normalized[dimension]
+        if len(values) != len(set(values)):
+            raise SystemExit(f"Sweep dimension {dimension} contains duplicate values")
+    return normalized
+
+
+def slug(value: str) -> str:
+    cleaned = re.sub(r"[^A-Za-z0-9]+", "-", value).strip("-")
+    return cleaned or "root"
+
+
+def cell_id(cell: dict) -> str:
+    parts = [cell["framework"], slug(cell["endpoint"]), f"c{cell['concurrency']}"]
+    # Cells on the fixture seed keep the ids they had before dataset sizes became a dimension.
+    if cell.get("dataset_size") is not None:
+        parts.append(f"n{cell['dataset_size']}")
+    if cell.get("payload_size") is not None:
+        parts.append(f"p{cell['payload_size']}")
+    parts.extend([f"cpu{slug(cell['cpu_limit'])}", f"mem{slug(cell['memory_limit'])}"])
+    return "__".join(parts)
+
+
+def iter_cells(spec: dict):
+    """Yield cells grouped so each (limits, framework) container is started once.
+
+    Cells carry a hash of the shared workload, so a resumed sweep re-measures cells
+    whose artifacts were recorded with other run or request counts.
+    """
+    workload_sha256 = canonical_hash(spec["workload"])
+    for cpu_limit, memory_limit, framework in itertools.product(
+        spec["cpu_limits"], spec["memory_limits"], spec["frameworks"]
+    ):
+        for dataset_size, endpoint, payload_size, concurrency in itertools.product(
+            spec["dataset_sizes"], spec["endpoints"], spec["payload_sizes"], spec["concurrency"]
+        ):
+            cell = {
+                "framework": framework,
+                "endpoint": endpoint,
+                "concurrency": concurrency,
+                "dataset_size": dataset_size,
+                "payload_size": payload_size,
+                "cpu_limit": cpu_limit,
+                "memory_limit": memory_limit,
+                "workload_sha256": workload_sha256,
+            }
+            cell["cell_id"] = cell_id(cell)
+            yield cell
+
+
+def cell_artifact_path(sweep_dir: Path, cell: dict) -> Path:
+    return sweep_dir / "cells" / f"{cell['cell_id']}.json"
+
+
+def load_cell_artifact(sweep_dir: Path, cell: dict) -> dict | None:
+    path = cell_artifact_path(sweep_dir, cell)
+    if not path.exists():
+        return None
+    try:
+        payload = read_json(path)
+    except json.JSONDecodeError:
+        return None
+    recorded = payload.get("sweep_cell") or {}
+    if recorded.get("cell_id") != cell["cell_id"] or recorded.get("workload_sha256") != cell["workload_sha256"]:
+        return None
+    return payload
+
+
+def is_cell_complete(sweep_dir: Path, cell: dict) -> bool:
+    """Only measured cells are final; skipped cells are retried when a sweep resumes."""
+    payload = load_cell_artifact(sweep_dir, cell)
+    return payload is not None and payload.get("status") == "ok"
+
+
+def write_cell_artifact(sweep_dir: Path, cell: dict, payload: dict) -> Path:
+    path = cell_artifact_path(sweep_dir, cell)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload["sweep_cell"] = dict(cell)
+    staging = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    staging.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    os.replace(staging, path)
+    return path
+
+
+def matrix_row(cell: dict, payload: dict | None) -> dict:
+    row = dict(cell)
+    if payload is None:
+        row["status"] = "pending"
+        return row
+    row["status"] = payload.get("status")
+    row["reason"] = payload.get("reason")
+    median = (payload.get("benchmark") or {}).get("median") or {}
+    for key in ("rps", "latency_ms_p50", "latency_ms_p95", "latency_ms_p99"):
+        row[key] = median.get(key)
+    if row.get("payload_size") is not None:
+        row["request_bytes_per_second"] = median.get("request_bytes_per_second")
+        row["response_bytes_per_second"] = median.get("response_bytes_per_second")
+    return row
+
+
+def build_matrix_summary(sweep_dir: Path, spec: dict) -> dict:
+    rows = []
+    for cell in iter_cells(spec):
+        rows.append(matrix_row(cell, load_cell_artifact(sweep_dir, cell)))
+    return {
+        "schema_version": "sweep-matrix-v1",
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "name": spec["name"],
+        "dimensions": {dimension: spec[dimension] for dimension in DIMENSIONS},
+        "workload": spec["workload"],
+        "total_cells": len(rows),
+        "completed_cells": sum(1 for row in rows if row["status"] == "ok"),
+        "skipped_cells": sum(1 for row in rows if row["status"] == "skipped"),
+        "cells": rows,
+    }
+
+
+def write_matrix_summary(sweep_dir: Path, spec: dict) -> Path:
+    path = sweep_dir / "matrix-summary.json"
+    write_json(path, build_matrix_summary(sweep_dir, spec))
+    return path
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+
+FRAMEWORK_TARGETS = {
+    "modkit": "http://localhost:3001",
+    "nestjs": "http://localhost:3002",
+    "baseline": "http://localhost:3003",
+    "wire": "http://localhost:3004",
+    "fx": "http://localhost:3005",
+    "do": "http://localhost:3006",
+}
+
+FRAMEWORKS = tuple(FRAMEWORK_TARGETS)
+
+
+def resolve_target(framework: str, override: str | None = None) -> str:
+    if framework not in FRAMEWORK_TARGETS:
+        raise SystemExit(f"Unknown framework: {framework}")
+    return override or FRAMEWORK_TARGETS[framework]
+
+
+def parse_framework_list(value: str | None) -> list[str]:
+    if not value:
+        return list(FRAMEWORKS)
+    frameworks = []
+    for item in value.split(","):
+        name = item.strip()
+        if not name:
+            continue
+        resolve_target(name)
+        if name in frameworks:
+            raise SystemExit(f"Duplicate framework: {name}")
+        frameworks.append(name)
+    if not frameworks:
+        raise SystemExit("Framework list must not be empty")
+    return frameworks
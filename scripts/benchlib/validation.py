@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    from jsonschema import Draft202012Validator
+except ImportError:  # pragma: no cover - exercised in environments without dependency
+    Draft202012Validator = None
+
+
+# Below this many files a process pool costs more to start than it saves.
+PARALLEL_MIN_FILES = 16
+MAX_WORKERS = 8
+
+_SCHEMAS: dict[str, CompiledSchema] = {}
+_PAYLOADS: dict[Path, tuple[int, int, dict]] = {}
+
+
+def load_json(path: Path):
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            return json.load(handle)
+    except FileNotFoundError as exc:
+        raise SystemExit(f"File not found: {path}") from exc
+    except json.JSONDecodeError as exc:
+        raise SystemExit(f"Malformed JSON in {path}: {exc.msg} at line {exc.lineno}, column {exc.colno}") from exc
+
+
+class CompiledSchema:
+    def __init__(self, path: Path, schema: dict, label: str):
+        if Draft202012Validator is None:
+            raise SystemExit(
+                "jsonschema dependency is required for schema validation. "
+                "Install with: python3 -m pip install jsonschema"
+            )
+        self.path = path
+        self.schema = schema
+        self.validator = Draft202012Validator(schema)
+        self.version = (schema.get("properties") or {}).get("schema_version", {}).get("const")
+        if not isinstance(self.version, str) or not self.version:
+            raise SystemExit(f"{label} schema file missing properties.schema_version.const: {path}")
+
+
+def compiled_schema(path: Path, label: str) -> CompiledSchema:
+    """Return a validator for the schema file, compiled once per distinct schema content."""
+    try:
+        content = path.read_bytes()
+    except FileNotFoundError as exc:
+        raise SystemExit(f"File not found: {path}") from exc
+    key = hashlib.sha256(content).hexdigest()
+    compiled = _SCHEMAS.get(key)
+    if compiled is None:
+        compiled = _SCHEMAS[key] = CompiledSchema(path, load_json(path), label)
+    return compiled
+
+
+def validate_jsonschema(payload, compiled: CompiledSchema, path, artifact_label: str) -> None:
+    errors = sorted(
+        compiled.validator.iter_errors(payload),
+        key=lambda err: [str(part) for part in err.path],
+    )
+    if not errors:
+        return
+    first = errors[0]
+    path_suffix = ".".join(str(part) for part in first.path)
+    field = f" ({path_suffix})" if path_suffix else ""
+    raise SystemExit(f"{artifact_label} JSON Schema validation failed for {path}{field}: {first.message}")
+
+
+def validate_raw_row(path, payload, schema_version: str) -> None:
+    required = ("schema_version", "framework", "target", "status")
+    for field in required:
+        if field not in payload:
+            raise SystemExit(f"Raw schema validation failed for {path}: missing {field}")
+
+    if payload.get("schema_version") != schema_version:
+        raise SystemExit(
+            f"Raw schema validation failed for {path}: schema_version={payload.get('schema_version')!r}, expected {schema_version!r}"
+        )
+
+    status = payload.get("status")
+    if status not in ("ok", "skipped"):
+        raise SystemExit(f"Raw schema validation failed for {path}: status={status!r} must be 'ok' or 'skipped'")
+
+    if not isinstance(payload.get("framework"), str) or not payload.get("framework"):
+        raise SystemExit(f"Raw schema validation failed for {path}: framework must be non-empty string")
+    if not isinstance(payload.get("target"), str) or not payload.get("target"):
+        raise SystemExit(f"Raw schema validation failed for {path}: target must be non-empty string")
+
+    if status == "skipped":
+        reason = payload.get("reason")
+        if not isinstance(reason, str) or not reason:
+            raise SystemExit(f"Raw schema validation failed for {path}: skipped rows require non-empty reason")
+        return
+
+    for field in ("parity", "engine", "metric_units", "benchmark", "resources_normalized"):
+        if field not in payload:
+            raise SystemExit(f"Raw schema validation failed for {path}: missing {field}")
+
+    benchmark = payload.get("benchmark")
+    if not isinstance(benchmark, dict):
+        raise SystemExit(f"Raw schema validation failed for {path}: benchmark must be object")
+
+    for metric_field in ("run_stats", "median"):
+        if metric_field not in benchmark:
+            raise SystemExit(f"Raw schema validation failed for {path}: benchmark.{metric_field} is required")
+
+
+def _file_key(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _cached_payload(path: Path) -> dict | None:
+    cached = _PAYLOADS.get(path.resolve())
+    if cached is not None and cached[:2] == _file_key(path):
+        return cached[2]
+    return None
+
+
+def _remember(path: Path, payload: dict) -> dict:
+    _PAYLOADS[path.resolve()] = (*_file_key(path), payload)
+    return payload
+
+
+def read_payload(path: Path) -> dict:
+    """Parse a JSON artifact once per process; unchanged files are served from memory afterwards."""
+    cached = _cached_payload(path)
+    if cached is not None:
+        return cached
+    return _remember(path, load_json(path))
+
+
+def raw_files(raw_dir: Path) -> list[Path]:
+    if not raw_dir.exists():
+        raise SystemExit(f"Raw results directory not found: {raw_dir}")
+    files = sorted(raw_dir.glob("*.json"))
+    if not files:
+        raise SystemExit(f"No raw benchmark files found in: {raw_dir}")
+    return files
+
+
+def _check_raw_file(path: Path, schema_path: Path) -> tuple[dict | None, str | None]:
+    """Worker entry point: parse and validate one file, returning the error instead of exiting."""
+    try:
+        compiled = compiled_schema(schema_path, "Raw")
+        payload = load_json(path)
+        validate_jsonschema(payload, compiled, path, "Raw")
+        validate_raw_row(path, payload, compiled.version)
+    except SystemExit as exc:
+        return None, str(exc)
+    return payload, None
+
+
+def validate_raw_files(files: list[Path], schema_path: Path, workers: int | None = None) -> list[tuple[Path, dict]]:
+    """Validate the given raw artifacts and return the parsed (path, payload) pairs in order.
+
+    Validated payloads populate the in-process cache, so later read_payload
+    calls on the same files reuse them instead of re-reading.
+    Large batches are checked in a process pool; the first error in file order is raised.
+    """
+    compiled = compiled_schema(schema_path, "Raw")
+    pending = [path for path in files if _cached_payload(path) is None]
+    if workers is None:
+        workers = min(MAX_WORKERS, os.cpu_count() or 1)
+
+    results: dict[Path, tuple[dict | None, str | None]] = {}
+    if workers > 1 and len(pending) >= PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            checked = pool.map(_check_raw_file, pending, [schema_path] * len(pending), chunksize=8)
+            results.update(zip(pending, checked))
+    else:
+        results.update((path, _check_raw_file(path, schema_path)) for path in pending)
+
+    rows = []
+    for path in files:
+        if path in results:
+            payload, error = results[path]
+            if error is not None:
+                raise SystemExit(error)
+            _remember(path, payload)
+        else:
+            payload = _cached_payload(path)
+            validate_jsonschema(payload, compiled, path, "Raw")
+            validate_raw_row(path, payload, compiled.version)
+        rows.append((path, payload))
+    return rows
+
+
+def validate_raw_dir(raw_dir: Path, schema_path: Path, workers: int | None = None) -> list[tuple[Path, dict]]:
+    compiled_schema(schema_path, "Raw")
+    return validate_raw_files(raw_files(raw_dir), schema_path, workers=workers)
+
+
+def validate_summary_payload(payload: dict, schema_path: Path, summary_file) -> None:
+    compiled = compiled_schema(schema_path, "Summary")
+    validate_jsonschema(payload, compiled, summary_file, "Summary")
+    required = (
+        "schema_version",
+        "generated_at",
+        "total_targets",
+        "successful_targets",
+        "skipped_targets",
+        "targets",
+    )
+    for field in required:
+        if field not in payload:
+            raise SystemExit(f"Summary schema validation failed for {summary_file}: missing {field}")
+
+    if payload.get("schema_version") != compiled.version:
+        raise SystemExit(
+            f"Summary schema validation failed for {summary_file}: schema_version={payload.get('schema_version')!r}, expected {compiled.version!r}"
+        )
+
+    targets = payload.get("targets")
+    if not isinstance(targets, list):
+        raise SystemExit(f"Summary schema validation failed for {summary_file}: targets must be array")
+
+    for idx, target in enumerate(targets):
+        if not isinstance(target, dict):
+            raise SystemExit(f"Summary schema validation failed for {summary_file}: targets[{idx}] must be object")
+        for field in ("framework", "status", "target", "provenance"):
+            if field not in target:
+                raise SystemExit(f"Summary schema validation failed for {summary_file}: targets[{idx}] missing {field}")
+        provenance = target.get("provenance")
+        if not isinstance(provenance, dict) or not provenance.get("raw_source"):
+            raise SystemExit(
+                f"Summary schema validation failed for {summary_file}: targets[{idx}].provenance.raw_source is required"
+            )
+
+        status = target.get("status")
+        if status == "ok" and "uncertainty" not in target:
+            raise SystemExit(
+                f"Summary schema validation failed for {summary_file}: targets[{idx}] missing uncertainty for status=ok"
+            )
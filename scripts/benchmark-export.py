@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+import argparse
+from pathlib import Path
+
+from benchlib.export import EXPORT_FORMATS, export_results
+from benchlib.io_utils import ensure_under_root
+from benchlib.runs import detach_latest
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RESULTS_ROOT = (REPO_ROOT / "results").resolve()
+RAW_DIR = REPO_ROOT / "results" / "latest" / "raw"
+EXPORT_DIR = REPO_ROOT / "results" / "latest" / "export"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Stream raw artifacts, quality summaries, and manifests into flat target/run/gate tables"
+    )
+    parser.add_argument(
+        "--raw-dir",
+        type=Path,
+        action="append",
+        help="Raw results directory; repeatable. Manifest and quality summary are read from its parent. "
+        "Default results/latest/raw",
+    )
+    parser.add_argument("--out-dir", type=Path, default=EXPORT_DIR)
+    parser.add_argument(
+        "--formats",
+        default="jsonl,csv",
+        help=f"Comma-separated subset of {','.join(EXPORT_FORMATS)}; parquet requires pyarrow",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    detach_latest(RESULTS_ROOT, [args.out_dir, *(args.raw_dir or [RAW_DIR])])
+    out_dir = ensure_under_root(args.out_dir, RESULTS_ROOT, "Export directory")
+    formats = [name.strip() for name in args.formats.split(",") if name.strip()]
+    counts = export_results(args.raw_dir or [RAW_DIR], out_dir, formats)
+    totals = ", ".join(f"{count} {table}" for table, count in counts.items())
+    print(f"benchmark-export: wrote {totals} row(s) as {','.join(formats)} to {out_dir}")
+
+
+if __name__ == "__main__":
+    main()
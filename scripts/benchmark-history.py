@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+import argparse
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchlib.changepoint import detect_change_points
+from benchlib.history import HISTORY_METRICS, HistoryStore
+from benchlib.io_utils import ensure_under_root, load_json_policy, write_json
+from benchlib.runs import detach_latest
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = REPO_ROOT / "results"
+RESULTS_ROOT = RESULTS_DIR / "latest"
+HISTORY_DB = REPO_ROOT / "results" / "history" / "benchmark-history.sqlite"
+RAW_DIR = REPO_ROOT / "results" / "latest" / "raw"
+SUMMARY_FILE = REPO_ROOT / "results" / "latest" / "summary.json"
+MANIFEST_FILE = REPO_ROOT / "results" / "latest" / "environment.manifest.json"
+CHANGEPOINTS_FILE = REPO_ROOT / "results" / "latest" / "benchmark-changepoints.json"
+POLICY_FILE = REPO_ROOT / "stats-policy.json"
+
+DEFAULT_CHANGE_POINT_POLICY = {
+    "alpha": 0.05,
+    "permutations": 199,
+    "min_segment": 3,
+    "min_change_percent": 2.0,
+    "seed": 0,
+}
+
+
+def ingest(args):
+    with HistoryStore(args.db) as store:
+        run_id = store.ingest(args.raw_dir, summary_path=args.summary_file, manifest_path=args.manifest_file,
+                              run_id=args.run_id)
+        if args.accept:
+            store.accept(run_id)
+    print(f"benchmark-history: ingested run {run_id} into {args.db}" + (" (accepted)" if args.accept else ""))
+    return run_id
+
+
+def accept(args):
+    with HistoryStore(args.db) as store:
+        run_id = store.accept(args.run_id)
+    print(f"benchmark-history: accepted run {run_id} as regression reference")
+    return run_id
+
+
+def query(args):
+    with HistoryStore(args.db) as store:
+        if args.framework is None:
+            rows = store.runs(limit=args.limit)
+            columns = ["run_id", "git_commit", "git_branch", "recorded_at", "accepted", "targets", "successful"]
+        else:
+            rows = store.series(args.framework, args.metric, limit=args.limit)
+            columns = ["run_id", "git_commit", "recorded_at", "value"]
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return rows
+    print("\t".join(columns))
+    for row in rows:
+        print("\t".join("" if row[column] is None else str(row[column]) for column in columns))
+    return rows
+
+
+def change_point_policy(policy_file):
+    policy = load_json_policy(policy_file, default_on_missing={})
+    configured = (policy.get("quality") or {}).get("change_points") or {}
+    return {**DEFAULT_CHANGE_POINT_POLICY, **configured}
+
+
+def changepoints(args):
+    settings = change_point_policy(args.policy_file)
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "method": "binary-segmentation-cusum-permutation",
+        "policy": settings,
+        "series": [],
+    }
+    metrics = args.metrics.split(",") if args.metrics else list(HISTORY_METRICS)
+    with HistoryStore(args.db) as store:
+        frameworks = args.frameworks.split(",") if args.frameworks else store.frameworks()
+        for framework in frameworks:
+            for metric in metrics:
+                series = store.series(framework, metric, limit=args.limit)
+                if not series:
+                    continue
+                points = detect_change_points(
+                    [row["value"] for row in series],
+                    alpha=settings["alpha"],
+                    permutations=int(settings["permutations"]),
+                    min_segment=int(settings["min_segment"]),
+                    min_change_percent=settings["min_change_percent"],
+                    seed=int(settings["seed"]),
+                )
+                for point in points:
+                    shifted = series[point["index"]]
+                    point.update(
+                        {
+                            "run_id": shifted["run_id"],
+                            "git_commit": shifted["git_commit"],
+                            "recorded_at": shifted["recorded_at"],
+                            "previous_commit": series[point["index"] - 1]["git_commit"],
+                        }
+                    )
+                    change = "" if point["change_percent"] is None else f"{point['change_percent']:+.2f}%, "
+                    print(
+                        f"benchmark-history: {framework} {metric} shifted at {shifted['git_commit'][:12]} "
+                        f"({shifted['recorded_at']}): {point['mean_before']:.3f} -> {point['mean_after']:.3f} "
+                        f"({change}p={point['p_value']:.3f})"
+                    )
+                report["series"].append(
+                    {"framework": framework, "metric": metric, "points": len(series), "change_points": points}
+                )
+
+    # Validate before detaching, then write through the unresolved path: until the detach
+    # it resolves into the archived run that latest points at.
+    ensure_under_root(args.out, RESULTS_ROOT, "Change-point report")
+    detach_latest(RESULTS_DIR, [args.out])
+    write_json(args.out, report)
+    total = sum(len(item["change_points"]) for item in report["series"])
+    print(f"benchmark-history: {total} change point(s) across {len(report['series'])} series; wrote {args.out}")
+    return report
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark history store and change-point detection")
+    parser.add_argument("--db", type=Path, default=HISTORY_DB)
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    ingest_cmd = sub.add_parser("ingest", help="Record the current raw/summary/manifest artifacts")
+    ingest_cmd.add_argument("--raw-dir", type=Path, default=RAW_DIR)
+    ingest_cmd.add_argument("--summary-file", type=Path, default=SUMMARY_FILE)
+    ingest_cmd.add_argument("--manifest-file", type=Path, default=MANIFEST_FILE)
+    ingest_cmd.add_argument("--run-id", help="Override the default <timestamp>-<commit> run id")
+    ingest_cmd.add_argument("--accept", action="store_true", help="Mark the run as an accepted reference")
+
+    accept_cmd = sub.add_parser("accept", help="Mark a run as the accepted regression reference")
+    accept_cmd.add_argument("--run-id", help="Run to accept; default the most recent")
+
+    query_cmd = sub.add_parser("query", help="List runs, or one framework metric over time")
+    query_cmd.add_argument("--framework")
+    query_cmd.add_argument("--metric", default="rps", choices=HISTORY_METRICS)
+    query_cmd.add_argument("--limit", type=int, help="Most recent N rows")
+    query_cmd.add_argument("--json", action="store_true")
+
+    changepoints_cmd = sub.add_parser("changepoints", help="Detect performance shifts across history")
+    changepoints_cmd.add_argument("--frameworks", help="Comma-separated subset; default all recorded")
+    changepoints_cmd.add_argument("--metrics", help="Comma-separated subset; default all history metrics")
+    changepoints_cmd.add_argument("--limit", type=int, help="Analyse only the most recent N runs")
+    changepoints_cmd.add_argument("--policy-file", type=Path, default=POLICY_FILE)
+    changepoints_cmd.add_argument("--out", type=Path, default=CHANGEPOINTS_FILE)
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.cmd == "ingest":
+        ingest(args)
+        return
+    if args.cmd == "accept":
+        accept(args)
+        return
+    if args.cmd == "query":
+        query(args)
+        return
+    if args.cmd == "changepoints":
+        changepoints(args)
+        return
+    raise SystemExit(f"Unknown command: {args.cmd}")
+
+
+if __name__ == "__main__":
+    main()
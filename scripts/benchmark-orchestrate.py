@@ -0,0 +1,669 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import statistics
+from pathlib import Path
+
+from benchlib.dataset import DEFAULT_SEED as DEFAULT_DATASET_SEED, check_dataset_size
+from benchlib.environment import build_fingerprint, build_manifest
+from benchlib.io_utils import ensure_under_root, write_json
+from benchlib.keys import parse_key_distribution
+from benchlib.lifecycle import ContainerLifecycle
+from benchlib.measurement import (
+    build_skip_payload,
+    describe_payload,
+    load_policy,
+    measure_target,
+    write_raw_payload,
+)
+from benchlib.parity import build_parity_binary, check_health, run_parity
+from benchlib.payloads import check_method, parse_payload_size
+from benchlib.result_cache import ResultCache, file_hash, tree_hash
+from benchlib.runs import check_run_id, detach_latest, finish_run, new_run_id, promote_run, run_dir, start_run
+from benchlib.samples import sidecar_matches
+from benchlib.scaling import DEFAULT_CLIENT_SATURATION, analyze_scaling, parse_cpu_set, parse_cpu_steps
+from benchlib.sessions import load_session_script
+from benchlib.soak import run_soak
+from benchlib.sweep import (
+    DEFAULT_LIMITS,
+    cell_artifact_path,
+    is_cell_complete,
+    iter_cells,
+    load_sweep_spec,
+    write_cell_artifact,
+    write_matrix_summary,
+)
+from benchlib.targets import parse_framework_list, resolve_target
+from benchlib.validation import validate_raw_dir
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = REPO_ROOT / "results"
+RESULTS_ROOT = RESULTS_DIR / "latest"
+CACHE_ROOT = REPO_ROOT / "results" / "cache"
+PARITY_CACHE_DIR = CACHE_ROOT / "parity-test"
+RESULT_CACHE_DIR = CACHE_ROOT / "results"
+POLICY_FILE = REPO_ROOT / "stats-policy.json"
+COMPOSE_FILE = REPO_ROOT / "docker-compose.yml"
+RAW_SCHEMA = REPO_ROOT / "schemas" / "benchmark-raw-v1.schema.json"
+SWEEPS_ROOT = (REPO_ROOT / "results" / "sweeps").resolve()
+SCALING_DIR = RESULTS_ROOT / "scaling"
+SCALING_SUMMARY_FILE = RESULTS_ROOT / "scaling.json"
+SOAK_DIR = RESULTS_ROOT / "soak"
+
+
+def env_int(name, default):
+    value = os.environ.get(name)
+    if value is None or value == "":
+        return default
+    try:
+        return int(value)
+    except ValueError as exc:
+        raise SystemExit(f"{name} must be an integer (got: {value})") from exc
+
+
+def env_flag(name):
+    return os.environ.get(name, "0") == "1"
+
+
+def resolve_run_id(value):
+    if not value:
+        return None
+    return new_run_id() if value == "auto" else check_run_id(value)
+
+
+def resolve_paths(args, root=RESULTS_ROOT):
+    """Resolve output paths, all of which must stay under root (results/latest or the run directory)."""
+    raw_dir = ensure_under_root(args.raw_dir or root / "raw", root, "RESULTS_RAW_DIR")
+    results_dir = ensure_under_root(args.results_dir or raw_dir.parent, root, "RESULTS_DIR")
+    fingerprint_file = ensure_under_root(
+        args.fingerprint_file or results_dir / "environment.fingerprint.json",
+        root,
+        "FINGERPRINT_FILE",
+    )
+    manifest_file = ensure_under_root(
+        args.manifest_file or results_dir / "environment.manifest.json",
+        root,
+        "MANIFEST_FILE",
+    )
+    return raw_dir, fingerprint_file, manifest_file
+
+
+class ParityRunner:
+    """Builds the parity binary on first use so all-skipped runs never invoke the Go toolchain."""
+
+    def __init__(self, args):
+        self.args = args
+        self.binary = None
+
+    def __call__(self, target):
+        if self.binary is None:
+            self.binary = build_parity_binary(REPO_ROOT, PARITY_CACHE_DIR)
+        return run_parity(
+            self.binary,
+            REPO_ROOT,
+            target,
+            fixtures=self.args.parity_fixtures,
+            seed_endpoint=self.args.parity_seed_endpoint,
+            timeout=self.args.parity_timeout,
+        )
+
+
+def checked_key_distribution(spec):
+    """Validate a key distribution spec up front so a typo fails before any target is started."""
+    if not spec:
+        return None
+    parse_key_distribution(spec)
+    return spec
+
+
+def checked_session_script(path):
+    """Validate a session script up front; its hash keys the result cache so edits force a re-measure."""
+    if not path:
+        return None, None
+    load_session_script(REPO_ROOT / path)
+    return path, file_hash(REPO_ROOT / path)
+
+
+def workload_params(args):
+    session_script, session_script_sha256 = checked_session_script(args.session_script)
+    return {
+        "endpoint": args.endpoint,
+        "warmup_requests": args.warmup_requests,
+        "benchmark_requests": args.benchmark_requests,
+        "runs": args.runs,
+        "engine": args.engine,
+        "concurrency": args.concurrency,
+        "parity_fixtures": args.parity_fixtures,
+        "parity_fixtures_sha256": tree_hash(REPO_ROOT / args.parity_fixtures),
+        "parity_seed_endpoint": args.parity_seed_endpoint,
+        "dataset_size": check_dataset_size(args.dataset_size) if args.dataset_size else None,
+        "dataset_seed": args.dataset_seed,
+        "key_distribution": checked_key_distribution(args.key_distribution),
+        "key_count": args.key_count or None,
+        "method": check_method(args.method),
+        "payload_size": parse_payload_size(args.payload_size) if args.payload_size else None,
+        "session_script": session_script,
+        "session_script_sha256": session_script_sha256,
+        # docker-compose.yml reads these limits from the environment, falling back to the same defaults.
+        "cpu_limit": os.environ.get("BENCHMARK_CPU_LIMIT") or DEFAULT_LIMITS["cpu_limits"][0],
+        "memory_limit": os.environ.get("BENCHMARK_MEMORY_LIMIT") or DEFAULT_LIMITS["memory_limits"][0],
+    }
+
+
+def benchmark_framework(framework, workload, parity, policy, raw_dir, lifecycle=None, result_cache=None,
+                        samples=False):
+    target = resolve_target(framework)
+    out_file = raw_dir / f"{framework}.json"
+    samples_file = raw_dir / f"{framework}.samples.bin" if samples else None
+
+    cache_key = None
+    if result_cache is not None:
+        cache_key = result_cache.key_for(REPO_ROOT, framework, workload)
+        cached = result_cache.load(cache_key) if cache_key else None
+        if cached is not None:
+            reference = (cached.get("benchmark") or {}).get("samples")
+            if reference and not sidecar_matches(out_file, reference):
+                cached["benchmark"].pop("samples")
+            write_raw_payload(out_file, cached)
+            print(f"{describe_payload(cached)} (cached, measured_at={cached['provenance']['measured_at']})")
+            return cached
+
+    record = None
+    try:
+        if lifecycle is not None:
+            record = lifecycle.start(framework, target)
+            healthy = record["ready"]
+        else:
+            healthy = check_health(target)
+        payload = gate_and_measure(
+            framework, target, healthy, healthy and parity(target), workload, policy, samples_file=samples_file
+        )
+    finally:
+        if record is not None:
+            lifecycle.stop(record)
+
+    if record is not None:
+        payload["lifecycle"] = record
+    if cache_key is not None:
+        result_cache.store(cache_key, payload)
+
+    write_raw_payload(out_file, payload)
+    print(describe_payload(payload))
+    return payload
+
+
+def gate_and_measure(framework, target, healthy, parity_passed, workload, policy, samples_file=None):
+    if not healthy:
+        return build_skip_payload(framework, target, "target health endpoint unavailable")
+    if not parity_passed:
+        return build_skip_payload(framework, target, "parity check failed")
+    return measure_target(
+        REPO_ROOT,
+        framework,
+        target,
+        workload["endpoint"],
+        workload["warmup_requests"],
+        workload["benchmark_requests"],
+        workload["runs"],
+        "passed",
+        workload["engine"],
+        policy=policy,
+        concurrency=workload.get("concurrency", 1),
+        samples_file=samples_file,
+        parity_fixtures=workload.get("parity_fixtures", "test/fixtures/parity"),
+        seed_endpoint=workload.get("parity_seed_endpoint", "/debug/parity/seed"),
+        dataset_size=workload.get("dataset_size"),
+        dataset_seed=workload.get("dataset_seed", DEFAULT_DATASET_SEED),
+        key_distribution=workload.get("key_distribution"),
+        key_count=workload.get("key_count"),
+        method=workload.get("method", "GET"),
+        payload_size=workload.get("payload_size"),
+        session_script=workload.get("session_script"),
+    )
+
+
+def run_config(args, frameworks):
+    return {
+        "entrypoint": "benchmark-orchestrate run",
+        "frameworks": frameworks,
+        **workload_params(args),
+        "manage_containers": args.manage_containers,
+        "cache": args.cache,
+        "samples": args.samples,
+    }
+
+
+def run(args):
+    frameworks = parse_framework_list(args.frameworks)
+    run_id = resolve_run_id(args.run_id)
+    if run_id is None:
+        detach_latest(RESULTS_DIR, [RESULTS_ROOT])
+        measure_all(args, frameworks, RESULTS_ROOT)
+        return
+
+    print(f"Run id: {run_id}")
+    start_run(RESULTS_DIR, run_id, run_config(args, frameworks))
+    try:
+        measure_all(args, frameworks, run_dir(RESULTS_DIR, run_id))
+    except BaseException:
+        finish_run(RESULTS_DIR, run_id, "failed")
+        raise
+    finish_run(RESULTS_DIR, run_id, "complete")
+    if args.promote:
+        print(f"Promoted run {run_id} to {promote_run(RESULTS_DIR, run_id)}")
+
+
+def measure_all(args, frameworks, root):
+    raw_dir, fingerprint_file, manifest_file = resolve_paths(args, root)
+    raw_dir.mkdir(parents=True, exist_ok=True)
+
+    fingerprint = build_fingerprint()
+    write_json(fingerprint_file, fingerprint)
+    print(f"Wrote: {fingerprint_file}")
+
+    parity = ParityRunner(args)
+    policy = load_policy(REPO_ROOT)
+
+    lifecycle = None
+    if args.manage_containers:
+        lifecycle = ContainerLifecycle(
+            REPO_ROOT,
+            COMPOSE_FILE,
+            ready_timeout=args.ready_timeout,
+            drop_caches=args.drop_caches,
+        )
+        lifecycle.stop_all()
+
+    result_cache = None
+    if args.cache:
+        result_cache = ResultCache(RESULT_CACHE_DIR, POLICY_FILE, fingerprint)
+
+    workload = workload_params(args)
+    for framework in frameworks:
+        print(f"=== Benchmarking: {framework} ===")
+        benchmark_framework(
+            framework,
+            workload,
+            parity,
+            policy,
+            raw_dir,
+            lifecycle=lifecycle,
+            result_cache=result_cache,
+            samples=args.samples,
+        )
+
+    validated = validate_raw_dir(raw_dir, RAW_SCHEMA)
+    print(f"benchmark-raw-schema-check: validated {len(validated)} raw artifact(s)")
+    write_json(manifest_file, build_manifest(raw_dir, fingerprint_file))
+    print(f"Wrote: {manifest_file}")
+    print(f"Raw benchmark files generated in: {raw_dir}")
+
+
+def sweep_groups(spec):
+    groups = {}
+    for cell in iter_cells(spec):
+        key = (cell["cpu_limit"], cell["memory_limit"], cell["framework"])
+        groups.setdefault(key, []).append(cell)
+    return groups
+
+
+def run_sweep_group(framework, cells, spec, parity, policy, sweep_dir, args):
+    target = resolve_target(framework)
+    cpu_limit, memory_limit = cells[0]["cpu_limit"], cells[0]["memory_limit"]
+    record = None
+    lifecycle = None
+    try:
+        if args.manage_containers:
+            lifecycle = ContainerLifecycle(
+                REPO_ROOT,
+                COMPOSE_FILE,
+                ready_timeout=args.ready_timeout,
+                drop_caches=args.drop_caches,
+                env={"BENCHMARK_CPU_LIMIT": cpu_limit, "BENCHMARK_MEMORY_LIMIT": memory_limit},
+            )
+            record = lifecycle.start(framework, target)
+            healthy = record["ready"]
+        else:
+            healthy = check_health(target)
+        parity_passed = healthy and parity(target)
+
+        for cell in cells:
+            workload = {
+                **spec["workload"],
+                "endpoint": cell["endpoint"],
+                "concurrency": cell["concurrency"],
+                "dataset_size": cell["dataset_size"],
+                "payload_size": cell["payload_size"],
+                "parity_fixtures": args.parity_fixtures,
+                "parity_seed_endpoint": args.parity_seed_endpoint,
+            }
+            payload = gate_and_measure(framework, target, healthy, parity_passed, workload, policy)
+            if record is not None:
+                payload["lifecycle"] = dict(record)
+            write_cell_artifact(sweep_dir, cell, payload)
+            print(f"{cell['cell_id']}: {describe_payload(payload)}")
+    finally:
+        if record is not None:
+            lifecycle.stop(record)
+
+
+def sweep(args):
+    spec = load_sweep_spec(args.spec)
+    sweep_dir = ensure_under_root(SWEEPS_ROOT / spec["name"], SWEEPS_ROOT, "Sweep directory")
+    varies_limits = len(spec["cpu_limits"]) > 1 or len(spec["memory_limits"]) > 1
+    if varies_limits and not args.manage_containers:
+        raise SystemExit("Sweeps over cpu_limits/memory_limits require --manage-containers")
+
+    write_json(sweep_dir / "spec.json", spec)
+    parity = ParityRunner(args)
+    policy = load_policy(REPO_ROOT)
+
+    if args.manage_containers:
+        ContainerLifecycle(REPO_ROOT, COMPOSE_FILE).stop_all()
+
+    for (_, _, framework), cells in sweep_groups(spec).items():
+        pending = [cell for cell in cells if not is_cell_complete(sweep_dir, cell)]
+        for cell in cells:
+            if cell not in pending:
+                print(f"{cell['cell_id']}: resume, keeping {cell_artifact_path(sweep_dir, cell).name}")
+        if not pending:
+            continue
+        run_sweep_group(
+            framework,
+            pending,
+            spec,
+            parity,
+            policy,
+            sweep_dir,
+            args,
+        )
+        write_matrix_summary(sweep_dir, spec)
+
+    summary_path = write_matrix_summary(sweep_dir, spec)
+    print(f"Wrote: {summary_path}")
+
+
+def scaling(args):
+    frameworks = parse_framework_list(args.frameworks)
+    cpu_steps = parse_cpu_steps(args.cpus)
+    client_cpus = sorted(parse_cpu_set(args.client_cpus)) if args.client_cpus else None
+    if client_cpus:
+        # Request threads are started after this, so they inherit the affinity.
+        os.sched_setaffinity(0, client_cpus)
+    parity = ParityRunner(args)
+    policy = load_policy(REPO_ROOT)
+    detach_latest(RESULTS_DIR, [SCALING_DIR, SCALING_SUMMARY_FILE])
+    ContainerLifecycle(REPO_ROOT, COMPOSE_FILE).stop_all()
+
+    results = {}
+    for framework in frameworks:
+        target = resolve_target(framework)
+        measurements = {}
+        client_utilisation = {}
+        for cpus in cpu_steps:
+            lifecycle = ContainerLifecycle(
+                REPO_ROOT,
+                COMPOSE_FILE,
+                ready_timeout=args.ready_timeout,
+                drop_caches=args.drop_caches,
+                env={"BENCHMARK_CPU_LIMIT": f"{cpus:.2f}"},
+            )
+            workload = {
+                "endpoint": args.endpoint,
+                "warmup_requests": args.warmup_requests,
+                "benchmark_requests": args.benchmark_requests * cpus,
+                "runs": args.runs,
+                "engine": "legacy",
+                "concurrency": args.base_concurrency * cpus,
+            }
+            record = lifecycle.start(framework, target)
+            try:
+                healthy = record["ready"]
+                payload = gate_and_measure(framework, target, healthy, healthy and parity(target), workload, policy)
+            finally:
+                lifecycle.stop(record)
+            payload["lifecycle"] = record
+            payload["scaling_step"] = {"cpus": cpus, "concurrency": workload["concurrency"]}
+            write_raw_payload(SCALING_DIR / f"{framework}__cpu{cpus}.json", payload)
+            print(f"{framework} cpus={cpus}: {describe_payload(payload)}")
+            if payload.get("status") == "ok":
+                measurements[cpus] = payload["benchmark"]["median"]["rps"]
+                client_utilisation[cpus] = statistics.median(
+                    run["client_cpu_utilisation"] for run in payload["benchmark"]["run_stats"]
+                )
+
+        analysis = analyze_scaling(measurements, client_utilisation, args.client_saturation)
+        results[framework] = analysis or {"steps": [], "amdahl": None, "usl": None, "reason": "single-CPU run missing"}
+
+    write_json(
+        SCALING_SUMMARY_FILE,
+        {
+            "cpu_steps": cpu_steps,
+            "base_concurrency": args.base_concurrency,
+            "requests_per_cpu": args.benchmark_requests,
+            "endpoint": args.endpoint,
+            "client_cpus": client_cpus,
+            "client_saturation": args.client_saturation,
+            "frameworks": results,
+        },
+    )
+    print(f"Wrote: {SCALING_SUMMARY_FILE}")
+
+
+def soak(args):
+    frameworks = parse_framework_list(args.frameworks)
+    if args.duration <= 0 or args.window <= 0:
+        raise SystemExit("--duration and --window must be positive")
+    parity = ParityRunner(args)
+    detach_latest(RESULTS_DIR, [SOAK_DIR])
+
+    lifecycle = None
+    if args.manage_containers:
+        lifecycle = ContainerLifecycle(
+            REPO_ROOT,
+            COMPOSE_FILE,
+            ready_timeout=args.ready_timeout,
+            drop_caches=args.drop_caches,
+        )
+        lifecycle.stop_all()
+
+    for framework in frameworks:
+        target = resolve_target(framework)
+        out_file = SOAK_DIR / f"{framework}.jsonl"
+        record = None
+        try:
+            if lifecycle is not None:
+                record = lifecycle.start(framework, target)
+                healthy = record["ready"]
+            else:
+                healthy = check_health(target)
+            if not healthy:
+                print(f"SKIP {framework}: target health endpoint unavailable")
+                continue
+            if not parity(target):
+                print(f"SKIP {framework}: parity check failed")
+                continue
+            print(f"=== Soak: {framework} for {args.duration:.0f}s in {args.window:.0f}s windows ===")
+            windows = run_soak(
+                target.rstrip("/") + args.endpoint,
+                framework,
+                out_file,
+                args.duration,
+                args.window,
+                args.concurrency,
+                header={"endpoint": args.endpoint, "parity": "passed"},
+            )
+            print(f"OK {framework}: wrote {len(windows)} window(s) to {out_file}")
+        finally:
+            if record is not None:
+                lifecycle.stop(record)
+
+
+def add_parity_arguments(parser):
+    parser.add_argument("--parity-fixtures", default=os.environ.get("PARITY_FIXTURES", "test/fixtures/parity"))
+    parser.add_argument("--parity-seed-endpoint", default=os.environ.get("PARITY_SEED_ENDPOINT", "/debug/parity/seed"))
+    parser.add_argument("--parity-timeout", default=os.environ.get("PARITY_TIMEOUT", "5s"))
+
+
+def add_dataset_arguments(parser):
+    parser.add_argument(
+        "--dataset-size",
+        type=int,
+        default=env_int("BENCHMARK_DATASET_SIZE", 0),
+        help="Stream this many synthetic users to the seed endpoint before measuring; 0 keeps the parity seed",
+    )
+    parser.add_argument("--dataset-seed", type=int, default=env_int("BENCHMARK_DATASET_SEED", DEFAULT_DATASET_SEED))
+    parser.add_argument(
+        "--key-distribution",
+        default=os.environ.get("BENCHMARK_KEY_DISTRIBUTION", ""),
+        help="Key popularity for {id} endpoint templates: uniform, zipf[:s=1.0] or hotset[:hot_fraction=0.01,...]",
+    )
+    parser.add_argument(
+        "--key-count",
+        type=int,
+        default=env_int("BENCHMARK_KEY_COUNT", 0),
+        help="Number of ids the template draws from; defaults to the seeded user count",
+    )
+
+
+def add_lifecycle_arguments(parser, manage_flag=True):
+    if manage_flag:
+        parser.add_argument(
+            "--manage-containers",
+            action="store_true",
+            default=env_flag("BENCHMARK_MANAGE_CONTAINERS"),
+            help="Start only the target under test via docker compose and stop it after measurement",
+        )
+    parser.add_argument(
+        "--drop-caches",
+        action="store_true",
+        default=env_flag("BENCHMARK_DROP_CACHES"),
+        help="Drop host page caches after each managed target is stopped",
+    )
+    parser.add_argument("--ready-timeout", type=float, default=float(os.environ.get("BENCHMARK_READY_TIMEOUT", "60")))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Single-process benchmark orchestrator")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    run_cmd = sub.add_parser("run", help="Health check, parity gate, measure, and write manifest for each target")
+    run_cmd.add_argument("--frameworks", default=os.environ.get("BENCHMARK_FRAMEWORKS", ""))
+    run_cmd.add_argument(
+        "--run-id",
+        default=os.environ.get("BENCHMARK_RUN_ID", ""),
+        help="Write under results/runs/<run-id> and record the run in results/runs/index.json; 'auto' generates an id",
+    )
+    run_cmd.add_argument(
+        "--no-promote",
+        dest="promote",
+        action="store_false",
+        default=os.environ.get("BENCHMARK_PROMOTE", "1") == "1",
+        help="Leave results/latest untouched when a run-scoped run completes",
+    )
+    run_cmd.add_argument("--raw-dir", type=Path, default=os.environ.get("RESULTS_RAW_DIR") or None)
+    run_cmd.add_argument("--results-dir", type=Path, default=os.environ.get("RESULTS_DIR") or None)
+    run_cmd.add_argument("--fingerprint-file", type=Path, default=os.environ.get("FINGERPRINT_FILE") or None)
+    run_cmd.add_argument("--manifest-file", type=Path, default=os.environ.get("MANIFEST_FILE") or None)
+    run_cmd.add_argument("--endpoint", default=os.environ.get("BENCHMARK_ENDPOINT", "/health"))
+    run_cmd.add_argument("--warmup-requests", type=int, default=env_int("WARMUP_REQUESTS", 100))
+    run_cmd.add_argument("--benchmark-requests", type=int, default=env_int("BENCHMARK_REQUESTS", 300))
+    run_cmd.add_argument("--runs", type=int, default=env_int("BENCHMARK_RUNS", 3))
+    run_cmd.add_argument("--concurrency", type=int, default=env_int("BENCHMARK_CONCURRENCY", 1))
+    run_cmd.add_argument("--engine", default=os.environ.get("BENCH_ENGINE", "legacy"))
+    run_cmd.add_argument("--method", default=os.environ.get("BENCHMARK_METHOD", "GET"), help="GET, POST or PUT")
+    run_cmd.add_argument(
+        "--payload-size",
+        default=os.environ.get("BENCHMARK_PAYLOAD_SIZE", ""),
+        help="Request body size for POST/PUT, e.g. 100B, 1KB, 16KB, 256KB",
+    )
+    run_cmd.add_argument(
+        "--session-script",
+        default=os.environ.get("BENCHMARK_SESSION_SCRIPT", ""),
+        help="Run scripted stateful sessions (e.g. sessions/crud.json) with --concurrency virtual users",
+    )
+    add_dataset_arguments(run_cmd)
+    add_parity_arguments(run_cmd)
+    add_lifecycle_arguments(run_cmd)
+    run_cmd.add_argument(
+        "--cache",
+        action="store_true",
+        default=env_flag("BENCHMARK_CACHE"),
+        help="Reuse cached raw artifacts for targets whose image, workload, policy, and environment are unchanged",
+    )
+    run_cmd.add_argument(
+        "--samples",
+        action="store_true",
+        default=env_flag("BENCHMARK_SAMPLES"),
+        help="Write a per-request binary sidecar (<framework>.samples.bin) next to each raw artifact",
+    )
+
+    sweep_cmd = sub.add_parser("sweep", help="Run a declarative parameter matrix with resumable cells")
+    sweep_cmd.add_argument("--spec", required=True, type=Path)
+    add_parity_arguments(sweep_cmd)
+    add_lifecycle_arguments(sweep_cmd)
+
+    scaling_cmd = sub.add_parser("scaling", help="Re-run targets at increasing CPU limits and fit Amdahl/USL curves")
+    scaling_cmd.add_argument("--frameworks", default=os.environ.get("BENCHMARK_FRAMEWORKS", ""))
+    scaling_cmd.add_argument("--cpus", default=os.environ.get("BENCHMARK_SCALING_CPUS", "1,2,4,N"))
+    scaling_cmd.add_argument("--endpoint", default=os.environ.get("BENCHMARK_ENDPOINT", "/health"))
+    scaling_cmd.add_argument("--warmup-requests", type=int, default=env_int("WARMUP_REQUESTS", 100))
+    scaling_cmd.add_argument(
+        "--benchmark-requests",
+        type=int,
+        default=env_int("BENCHMARK_REQUESTS", 300),
+        help="Requests per run at 1 CPU; scaled by the CPU count at each step",
+    )
+    scaling_cmd.add_argument("--runs", type=int, default=env_int("BENCHMARK_RUNS", 3))
+    scaling_cmd.add_argument(
+        "--base-concurrency",
+        type=int,
+        default=env_int("BENCHMARK_CONCURRENCY", 4),
+        help="In-flight requests at 1 CPU; scaled by the CPU count at each step",
+    )
+    scaling_cmd.add_argument(
+        "--client-cpus",
+        default=os.environ.get("BENCHMARK_CLIENT_CPUS", ""),
+        help="CPU list (e.g. 0-1) to pin the load generator to",
+    )
+    scaling_cmd.add_argument(
+        "--client-saturation",
+        type=float,
+        default=float(os.environ.get("BENCHMARK_CLIENT_SATURATION", DEFAULT_CLIENT_SATURATION)),
+        help="Load-generator CPU cores at which a step is marked client-bound and left out of the fits",
+    )
+    add_parity_arguments(scaling_cmd)
+    add_lifecycle_arguments(scaling_cmd, manage_flag=False)
+
+    soak_cmd = sub.add_parser("soak", help="Hold steady load for a long duration and stream windowed metrics")
+    soak_cmd.add_argument("--frameworks", default=os.environ.get("BENCHMARK_FRAMEWORKS", ""))
+    soak_cmd.add_argument("--endpoint", default=os.environ.get("BENCHMARK_ENDPOINT", "/health"))
+    soak_cmd.add_argument("--duration", type=float, default=float(os.environ.get("BENCHMARK_SOAK_DURATION", "3600")))
+    soak_cmd.add_argument("--window", type=float, default=float(os.environ.get("BENCHMARK_SOAK_WINDOW", "10")))
+    soak_cmd.add_argument("--concurrency", type=int, default=env_int("BENCHMARK_CONCURRENCY", 4))
+    add_parity_arguments(soak_cmd)
+    add_lifecycle_arguments(soak_cmd)
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.cmd == "run":
+        run(args)
+        return
+    if args.cmd == "sweep":
+        sweep(args)
+        return
+    if args.cmd == "scaling":
+        scaling(args)
+        return
+    if args.cmd == "soak":
+        soak(args)
+        return
+    raise SystemExit(f"Unknown command: {args.cmd}")
+
+
+if __name__ == "__main__":
+    main()
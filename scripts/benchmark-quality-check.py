@@ -7,29 +7,36 @@ import subprocess
 import tempfile
 from pathlib import Path
 
-from benchlib.io_utils import ensure_under_root, load_json_policy
+from benchlib.comparison import COMPARISON_METRICS, compare_samples, metric_samples
+from benchlib.history import HistoryStore
+from benchlib.io_utils import ensure_under_root, load_json_policy, read_json
+from benchlib.raw_index import RawIndex, slim_payload
+from benchlib.runs import detach_latest
+from benchlib.soak import analyze_soak, load_soak_windows
+from benchlib.stats import DEFAULT_CONFIDENCE, minimum_attainable_p
 
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
-RESULTS_ROOT = (REPO_ROOT / "results" / "latest").resolve()
+RESULTS_DIR = REPO_ROOT / "results"
+RESULTS_ROOT = RESULTS_DIR / "latest"
 RAW_DIR = REPO_ROOT / "results" / "latest" / "raw"
+RAW_SCHEMA = REPO_ROOT / "schemas" / "benchmark-raw-v1.schema.json"
 QUALITY_SUMMARY_FILE = REPO_ROOT / "results" / "latest" / "benchmark-quality-summary.json"
 POLICY_FILE = REPO_ROOT / "stats-policy.json"
 TOOLING_DIR = REPO_ROOT / "results" / "latest" / "tooling"
+SOAK_DIR = REPO_ROOT / "results" / "latest" / "soak"
+SOAK_SUMMARY_FILE = REPO_ROOT / "results" / "latest" / "benchmark-soak-summary.json"
+COMPARISON_SUMMARY_FILE = REPO_ROOT / "results" / "latest" / "benchmark-comparison-summary.json"
+REFERENCE_SUMMARY_FILE = REPO_ROOT / "results" / "latest" / "benchmark-reference-summary.json"
 
 
-def load_raw_rows(raw_dir):
-    if not raw_dir.exists():
-        raise SystemExit(f"Raw results directory not found: {raw_dir}")
+def index_extractors():
+    return {"quality_payload": lambda path, payload: slim_payload(payload)}
 
-    rows = []
-    for path in sorted(raw_dir.glob("*.json")):
-        with path.open("r", encoding="utf-8") as handle:
-            rows.append((path, json.load(handle)))
 
-    if not rows:
-        raise SystemExit(f"No raw benchmark files found in: {raw_dir}")
-    return rows
+def load_raw_rows(raw_dir):
+    """Raw artifacts as served by the raw index; only changed files are re-parsed."""
+    return [(path, extracts["quality_payload"]) for path, extracts in RawIndex(raw_dir).refresh(index_extractors())]
 
 
 def ensure_number(value, label):
@@ -89,7 +96,7 @@ def check_stats(args, policy):
     print(f"benchmark-stats-check: validated {checked} successful target(s)")
 
 
-def check_variance(args, policy):
+def check_variance(args, policy, raise_on_failure=True):
     rows = load_raw_rows(args.raw_dir)
     quality_policy = policy.get("quality") or {}
     thresholds = quality_policy.get("variance_thresholds_cv") or {}
@@ -116,6 +123,7 @@ def check_variance(args, policy):
             "framework": framework,
             "source_file": path.name,
             "excluded_samples": excluded_samples,
+            "suspected_outliers": quality.get("suspected_outliers") or [],
             "variance": {
                 "rps_cv": variance.get("rps_cv"),
                 "latency_ms_p95_cv": variance.get("latency_ms_p95_cv"),
@@ -177,7 +185,10 @@ def check_variance(args, policy):
     if summary["status"] == "failed":
         first = summary["failures"][0]["message"]
         print(f"benchmark-variance-check: wrote summary {summary_path}")
-        raise SystemExit(f"benchmark-variance-check failed: {first}")
+        if raise_on_failure:
+            raise SystemExit(f"benchmark-variance-check failed: {first}")
+        print(f"benchmark-variance-check failed: {first}")
+        return summary
 
     print(
         "benchmark-variance-check: "
@@ -204,7 +215,7 @@ def parse_delta_percent(output):
     return float(percent_matches[-1])
 
 
-def check_benchstat(args, policy):
+def check_benchstat(args, policy, required=True, native_summary=None, raise_on_failure=True):
     quality_policy = policy.get("quality") or {}
     benchstat_policy = quality_policy.get("benchstat") or {}
     if not benchstat_policy.get("enabled", False):
@@ -224,7 +235,10 @@ def check_benchstat(args, policy):
             if candidate.exists():
                 benchstat_bin = str(candidate)
     if benchstat_bin is None:
-        raise SystemExit("benchmark-benchstat-check: benchstat not found in PATH")
+        if required:
+            raise SystemExit("benchmark-benchstat-check: benchstat not found in PATH")
+        print("benchmark-benchstat-check: benchstat not found; skipping optional cross-check")
+        return {"status": "skipped", "reason": "benchstat_not_found"}
 
     rows = load_raw_rows(args.raw_dir)
     by_framework = {
@@ -297,6 +311,9 @@ def check_benchstat(args, policy):
                 "output_file": str(out_file.relative_to(REPO_ROOT)),
                 "status": "passed",
             }
+            native_delta = native_ns_per_op_delta(native_summary, framework)
+            if native_delta is not None:
+                comparison["native_delta_percent_ns_per_op"] = native_delta
             if delta is None:
                 comparison["status"] = "failed"
                 comparison["reason"] = "delta_parse_failed"
@@ -314,7 +331,10 @@ def check_benchstat(args, policy):
 
     if summary["failures"]:
         summary["status"] = "failed"
-        raise SystemExit("benchmark-benchstat-check failed: " + summary["failures"][0])
+        if raise_on_failure:
+            raise SystemExit("benchmark-benchstat-check failed: " + summary["failures"][0])
+        print("benchmark-benchstat-check failed: " + summary["failures"][0])
+        return summary
 
     print(
         "benchmark-benchstat-check: "
@@ -323,27 +343,417 @@ def check_benchstat(args, policy):
     return summary
 
 
+def evaluate_gate(metric, comparison, gate, default_alpha):
+    """Apply one policy regression gate to a metric comparison.
+
+    A gate fails only when the regression is significant at the gate's alpha and the
+    Hodges-Lehmann shift is at least the gate's minimum detectable effect. When the run
+    counts cannot reach the alpha at all (e.g. 3 vs 3 runs against alpha 0.05), the gate
+    is underpowered: it does not fail, and ci-check lists it in its summary.
+    """
+    alpha = ensure_number(gate.get("alpha", default_alpha), f"policy.quality.comparison.gates.{metric}.alpha")
+    min_percent = gate.get("min_effect_percent")
+    min_absolute = gate.get("min_effect_absolute")
+    verdict = {
+        "metric": metric,
+        "alpha": alpha,
+        "min_effect_percent": min_percent,
+        "min_effect_absolute": min_absolute,
+        "regression": None,
+        "regression_percent": None,
+        "p_value": None,
+        "verdict": "insufficient_data",
+    }
+    if comparison is None or comparison.get("delta") is None:
+        return verdict
+
+    sign = 1 if comparison["direction"] == "lower_is_better" else -1
+    regression = comparison["delta"] * sign
+    regression_percent = None if comparison["delta_percent"] is None else comparison["delta_percent"] * sign
+    verdict.update(
+        {"regression": regression, "regression_percent": regression_percent, "p_value": comparison["p_value"]}
+    )
+    if minimum_attainable_p(comparison["baseline_samples"], comparison["candidate_samples"]) >= alpha:
+        verdict["verdict"] = "underpowered"
+        return verdict
+
+    significant = comparison["p_value"] is not None and comparison["p_value"] < alpha
+    verdict["verdict"] = "fail" if significant and exceeds_min_effect(regression, regression_percent, gate) else "pass"
+    return verdict
+
+
+def exceeds_min_effect(regression, regression_percent, gate):
+    min_percent = gate.get("min_effect_percent")
+    min_absolute = gate.get("min_effect_absolute")
+    exceeds = regression > 0
+    if min_percent is not None:
+        exceeds = exceeds and regression_percent is not None and regression_percent >= min_percent
+    if min_absolute is not None:
+        exceeds = exceeds and regression >= min_absolute
+    return exceeds
+
+
+def describe_gate_failure(framework, verdict):
+    if verdict["min_effect_percent"] is not None:
+        effect = f"{verdict['regression_percent']:.2f}% >= {verdict['min_effect_percent']:.2f}%"
+    else:
+        effect = f"{verdict['regression']:.4f} >= {verdict['min_effect_absolute']:.4f}"
+    return (
+        f"{framework}: {verdict['metric']} regression {effect} "
+        f"(p={verdict['p_value']:.4f} < alpha={verdict['alpha']:.4f})"
+    )
+
+
+def compare_rows(reference, row, gates, alpha, confidence):
+    """Per-metric comparisons of row against reference, plus the policy gate verdicts."""
+    metrics = {}
+    for metric, direction in COMPARISON_METRICS.items():
+        reference_values = metric_samples(reference, metric)
+        candidate_values = metric_samples(row, metric)
+        if reference_values and candidate_values:
+            metrics[metric] = compare_samples(reference_values, candidate_values, direction, alpha, confidence)
+    verdicts = {metric: evaluate_gate(metric, metrics.get(metric), gate, alpha) for metric, gate in gates.items()}
+    return metrics, verdicts
+
+
+def comparison_settings(policy):
+    comparison_policy = (policy.get("quality") or {}).get("comparison") or {}
+    alpha = ensure_number(comparison_policy.get("alpha", 0.05), "policy.quality.comparison.alpha")
+    confidence = ensure_number(
+        comparison_policy.get("confidence", DEFAULT_CONFIDENCE), "policy.quality.comparison.confidence"
+    )
+    return comparison_policy, alpha, confidence
+
+
+def native_ns_per_op_delta(native_summary, framework):
+    for comparison in (native_summary or {}).get("comparisons") or []:
+        if comparison["framework"] == framework:
+            return (comparison["metrics"].get("ns_per_op") or {}).get("delta_percent")
+    return None
+
+
+def check_comparison(args, policy, raise_on_failure=True):
+    comparison_policy, alpha, confidence = comparison_settings(policy)
+    baseline_framework = comparison_policy.get("baseline_framework", "baseline")
+    # Resource gates such as CPU per request and peak memory differ by runtime, not by regression,
+    # so gates scoped to "reference" only compare a framework with its own accepted run.
+    gates = {
+        metric: gate
+        for metric, gate in (comparison_policy.get("gates") or {}).items()
+        if gate.get("scope") != "reference"
+    }
+
+    rows = load_raw_rows(args.raw_dir)
+    by_framework = {
+        (row.get("framework") or path.stem): row
+        for path, row in rows
+        if row.get("status") == "ok"
+    }
+
+    summary = {
+        "status": "passed",
+        "engine": "mann-whitney-u+hodges-lehmann",
+        "baseline_framework": baseline_framework,
+        "alpha": alpha,
+        "confidence": confidence,
+        "comparisons": [],
+        "failures": [],
+    }
+
+    baseline = by_framework.get(baseline_framework)
+    if baseline is None:
+        summary["status"] = "skipped"
+        summary["reason"] = "baseline_missing"
+    else:
+        for framework, row in sorted(by_framework.items()):
+            if framework == baseline_framework:
+                continue
+            metrics, verdicts = compare_rows(baseline, row, gates, alpha, confidence)
+            comparison = {
+                "framework": framework,
+                "baseline": baseline_framework,
+                "metrics": metrics,
+                "gates": verdicts,
+                "status": "passed",
+            }
+            for verdict in comparison["gates"].values():
+                if verdict["verdict"] == "fail":
+                    comparison["status"] = "failed"
+                    summary["failures"].append(describe_gate_failure(framework, verdict))
+            summary["comparisons"].append(comparison)
+
+    if summary["failures"]:
+        summary["status"] = "failed"
+
+    summary_path = ensure_under_results(args.comparison_summary_file, "Comparison summary file")
+    summary_path.parent.mkdir(parents=True, exist_ok=True)
+    summary_path.write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+    print(f"benchmark-compare-check: wrote summary {summary_path}")
+
+    if summary["status"] == "failed":
+        if raise_on_failure:
+            raise SystemExit("benchmark-compare-check failed: " + summary["failures"][0])
+        print("benchmark-compare-check failed: " + summary["failures"][0])
+        return summary
+    if summary["status"] == "skipped":
+        print("benchmark-compare-check: baseline framework not present in successful targets")
+        return summary
+    print(
+        "benchmark-compare-check: "
+        f"compared {len(summary['comparisons'])} framework(s) against {baseline_framework} "
+        f"on {len(COMPARISON_METRICS)} metric(s)"
+    )
+    return summary
+
+
+def load_reference_targets(args):
+    """Map framework -> (provenance, raw payload) from a pinned directory or the history store."""
+    if args.reference_dir is not None:
+        root = args.reference_dir
+        raw_dir = root / "raw" if (root / "raw").is_dir() else root
+        manifest_path = root / "environment.manifest.json"
+        manifest = read_json(manifest_path) if manifest_path.exists() else {}
+        git = (manifest.get("fingerprint") or {}).get("git") or {}
+        targets = {}
+        for path, row in load_raw_rows(raw_dir):
+            if row.get("status") != "ok":
+                continue
+            framework = row.get("framework") or path.stem
+            targets[framework] = (
+                {
+                    "source": "directory",
+                    "path": str(path),
+                    "git_commit": git.get("commit"),
+                    "git_branch": git.get("branch"),
+                    "recorded_at": manifest.get("generated_at"),
+                },
+                row,
+            )
+        return targets
+
+    if args.history_db is None or not args.history_db.exists():
+        return None
+    targets = {}
+    with HistoryStore(args.history_db) as store:
+        for framework in store.frameworks():
+            found = store.latest_accepted_target(framework)
+            if found is not None:
+                provenance, row = found
+                targets[framework] = ({"source": "history", "db": str(args.history_db), **provenance}, row)
+    return targets
+
+
+def check_reference(args, policy, raise_on_failure=True):
+    comparison_policy, alpha, confidence = comparison_settings(policy)
+    reference_policy = (policy.get("quality") or {}).get("reference") or {}
+    gates = reference_policy.get("gates") or comparison_policy.get("gates") or {}
+
+    summary = {
+        "status": "passed",
+        "mode": "reference",
+        "engine": "mann-whitney-u+hodges-lehmann",
+        "alpha": alpha,
+        "confidence": confidence,
+        "frameworks": [],
+        "failures": [],
+    }
+    references = load_reference_targets(args)
+    if references is None:
+        summary["status"] = "skipped"
+        summary["reason"] = "no_reference_configured"
+        print("benchmark-reference-check: no reference directory or history store configured")
+        return summary
+
+    for path, row in load_raw_rows(args.raw_dir):
+        if row.get("status") != "ok":
+            continue
+        framework = row.get("framework") or path.stem
+        reference = references.get(framework)
+        if reference is None:
+            summary["frameworks"].append({"framework": framework, "status": "skipped", "reason": "no_reference"})
+            continue
+        provenance, reference_row = reference
+        metrics, verdicts = compare_rows(reference_row, row, gates, alpha, confidence)
+        result = {
+            "framework": framework,
+            "reference": provenance,
+            "metrics": metrics,
+            "gates": verdicts,
+            "status": "passed",
+        }
+        for verdict in verdicts.values():
+            if verdict["verdict"] == "fail":
+                result["status"] = "failed"
+                summary["failures"].append(describe_gate_failure(framework, verdict) + " vs reference")
+        summary["frameworks"].append(result)
+
+    if summary["failures"]:
+        summary["status"] = "failed"
+
+    summary_path = ensure_under_results(args.reference_summary_file, "Reference summary file")
+    summary_path.parent.mkdir(parents=True, exist_ok=True)
+    summary_path.write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+    print(f"benchmark-reference-check: wrote summary {summary_path}")
+
+    if summary["status"] == "failed":
+        if raise_on_failure:
+            raise SystemExit("benchmark-reference-check failed: " + summary["failures"][0])
+        print("benchmark-reference-check failed: " + summary["failures"][0])
+        return summary
+    compared = sum(1 for item in summary["frameworks"] if item["status"] != "skipped")
+    print(f"benchmark-reference-check: compared {compared} framework(s) against their accepted reference")
+    return summary
+
+
+SOAK_TREND_CHECKS = [
+    ("memory_growth_mb_per_hour", "max_memory_growth_mb_per_hour", 1),
+    ("latency_ms_p95_drift_percent_per_hour", "max_latency_p95_drift_percent_per_hour", 1),
+    ("latency_ms_p99_drift_percent_per_hour", "max_latency_p99_drift_percent_per_hour", 1),
+    ("rps_drift_percent_per_hour", "max_rps_drop_percent_per_hour", -1),
+    ("error_rate", "max_error_rate", 1),
+]
+
+
+def check_soak(args, policy):
+    soak_policy = (policy.get("quality") or {}).get("soak") or {}
+    min_windows = int(soak_policy.get("min_windows", 2))
+    warmup_windows = int(soak_policy.get("warmup_windows", 0))
+    files = sorted(args.soak_dir.glob("*.jsonl")) if args.soak_dir.exists() else []
+
+    summary = {
+        "status": "passed",
+        "mode": "soak-trend",
+        "policy": soak_policy,
+        "targets_checked": 0,
+        "targets_failed": 0,
+        "failures": [],
+        "targets": [],
+    }
+
+    for path in files:
+        header, windows = load_soak_windows(path)
+        framework = header.get("framework") or path.stem
+        trends = analyze_soak(windows, warmup_windows)
+        target_result = {
+            "framework": framework,
+            "source_file": path.name,
+            # Soak files written before the header named its source sampled `docker stats` usage.
+            "memory_source": header.get("memory_source", "docker_stats_usage"),
+            "trends": trends,
+            "status": "passed",
+            "violations": [],
+        }
+        if trends["windows"] < min_windows:
+            target_result["status"] = "skipped"
+            target_result["reason"] = (
+                f"only {trends['windows']} window(s) after {trends['warmup_windows_excluded']} warmup; "
+                f"policy requires {min_windows}"
+            )
+            summary["targets"].append(target_result)
+            continue
+
+        for trend_key, threshold_key, direction in SOAK_TREND_CHECKS:
+            value = trends.get(trend_key)
+            threshold = soak_policy.get(threshold_key)
+            if value is None or threshold is None:
+                continue
+            threshold_num = ensure_number(threshold, f"policy.quality.soak.{threshold_key}")
+            if value * direction > threshold_num:
+                target_result["violations"].append(
+                    {
+                        "metric": trend_key,
+                        "value": value,
+                        "threshold": threshold_num * direction,
+                        "message": f"{framework}: {trend_key}={value:.4f} exceeded {threshold_key}={threshold_num:.4f}",
+                    }
+                )
+
+        summary["targets_checked"] += 1
+        if target_result["violations"]:
+            target_result["status"] = "failed"
+            summary["targets_failed"] += 1
+            summary["failures"].extend(target_result["violations"])
+        summary["targets"].append(target_result)
+
+    if summary["targets_failed"] > 0:
+        summary["status"] = "failed"
+
+    summary_path = ensure_under_results(args.soak_summary_file, "Soak summary file")
+    summary_path.parent.mkdir(parents=True, exist_ok=True)
+    summary_path.write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+    print(f"benchmark-soak-check: wrote summary {summary_path}")
+
+    if summary["status"] == "failed":
+        raise SystemExit(f"benchmark-soak-check failed: {summary['failures'][0]['message']}")
+    if summary["targets_checked"] == 0:
+        print("benchmark-soak-check: no soak artifacts with enough windows to validate")
+        return summary
+    print(f"benchmark-soak-check: validated {summary['targets_checked']} soak target(s)")
+    return summary
+
+
 def run_ci_check(args, policy):
+    index = RawIndex(args.raw_dir, RAW_SCHEMA)
+    validated = index.refresh(index_extractors(), validate=True)
+    print(
+        f"benchmark-raw-schema-check: validated {len(validated)} raw artifact(s) "
+        f"({index.stats['parsed']} re-parsed, {index.stats['reused']} from {index.path.name})"
+    )
     check_stats(args, policy)
-    variance_summary = check_variance(args, policy)
-    benchstat_summary = check_benchstat(args, policy)
+    # Gate failures are collected rather than raised so the summary, with every per-metric
+    # verdict, is written before ci-check exits non-zero.
+    variance_summary = check_variance(args, policy, raise_on_failure=False)
+    comparison_summary = check_comparison(args, policy, raise_on_failure=False)
+    reference_summary = check_reference(args, policy, raise_on_failure=False)
+    benchstat_summary = check_benchstat(
+        args, policy, required=False, native_summary=comparison_summary, raise_on_failure=False
+    )
     ci_summary = {
         "status": "passed",
         "policy_file": str(args.policy_file),
+        "regression_gates": [
+            {"framework": comparison["framework"], "against": "baseline_framework", **verdict}
+            for comparison in comparison_summary.get("comparisons") or []
+            for verdict in comparison["gates"].values()
+        ]
+        + [
+            {"framework": result["framework"], "against": "reference", "reference": result["reference"], **verdict}
+            for result in reference_summary.get("frameworks") or []
+            for verdict in (result.get("gates") or {}).values()
+        ],
         "checks": {
             "variance": variance_summary,
+            "comparison": comparison_summary,
+            "reference": reference_summary,
             "benchstat": benchstat_summary,
         },
     }
-    if (
-        variance_summary.get("status") == "failed"
-        or benchstat_summary.get("status") == "failed"
-    ):
+    failures = [
+        failure.get("message") if isinstance(failure, dict) else failure
+        for check in ci_summary["checks"].values()
+        if check.get("status") == "failed"
+        for failure in check.get("failures") or []
+    ]
+    underpowered = [
+        f"{gate['framework']}: {gate['metric']} vs {gate['against']} (alpha={gate['alpha']})"
+        for gate in ci_summary["regression_gates"]
+        if gate["verdict"] == "underpowered"
+    ]
+    ci_summary["underpowered_gates"] = underpowered
+    if underpowered:
+        print(
+            f"ci-benchmark-quality-check: {len(underpowered)} gate(s) underpowered at this run count "
+            "and not enforced; raise BENCHMARK_RUNS to reach their alpha"
+        )
+    if failures:
         ci_summary["status"] = "failed"
+        ci_summary["failures"] = failures
     summary_path = ensure_under_results(args.summary_file, "Summary file")
     summary_path.parent.mkdir(parents=True, exist_ok=True)
     summary_path.write_text(json.dumps(ci_summary, indent=2) + "\n", encoding="utf-8")
     print(f"ci-benchmark-quality-check: wrote summary {summary_path}")
+    if failures:
+        raise SystemExit(f"ci-benchmark-quality-check failed: {failures[0]}")
 
 
 def parse_args():
@@ -351,12 +761,22 @@ def parse_args():
     parser.add_argument("--raw-dir", type=Path, default=RAW_DIR)
     parser.add_argument("--summary-file", type=Path, default=QUALITY_SUMMARY_FILE)
     parser.add_argument("--policy-file", type=Path, default=POLICY_FILE)
+    parser.add_argument("--soak-dir", type=Path, default=SOAK_DIR)
+    parser.add_argument("--soak-summary-file", type=Path, default=SOAK_SUMMARY_FILE)
+    parser.add_argument("--comparison-summary-file", type=Path, default=COMPARISON_SUMMARY_FILE)
+    parser.add_argument("--reference-summary-file", type=Path, default=REFERENCE_SUMMARY_FILE)
+    reference = parser.add_mutually_exclusive_group()
+    reference.add_argument("--reference-dir", type=Path, help="Pinned accepted artifact set (raw/ or raw JSON dir)")
+    reference.add_argument("--history-db", type=Path, help="History store; compare against last accepted run")
 
     sub = parser.add_subparsers(dest="cmd", required=True)
     sub.add_parser("stats-check")
     sub.add_parser("variance-check")
+    sub.add_parser("compare-check")
+    sub.add_parser("reference-check")
     sub.add_parser("benchstat-check")
     sub.add_parser("ci-check")
+    sub.add_parser("soak-check")
 
     return parser.parse_args()
 
@@ -364,6 +784,7 @@ def parse_args():
 def main():
     args = parse_args()
     policy = load_json_policy(args.policy_file)
+    detach_latest(RESULTS_DIR, [value for value in vars(args).values() if isinstance(value, Path)])
 
     if args.cmd == "stats-check":
         check_stats(args, policy)
@@ -371,12 +792,21 @@ def main():
     if args.cmd == "variance-check":
         check_variance(args, policy)
         return
+    if args.cmd == "compare-check":
+        check_comparison(args, policy)
+        return
+    if args.cmd == "reference-check":
+        check_reference(args, policy)
+        return
     if args.cmd == "benchstat-check":
         check_benchstat(args, policy)
         return
     if args.cmd == "ci-check":
         run_ci_check(args, policy)
         return
+    if args.cmd == "soak-check":
+        check_soak(args, policy)
+        return
     raise SystemExit(f"Unknown command: {args.cmd}")
 
 
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+import argparse
+from pathlib import Path
+
+from benchlib.runs import (
+    config_from_env,
+    detach_latest,
+    finish_run,
+    new_run_id,
+    promote_run,
+    read_index,
+    start_run,
+)
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = REPO_ROOT / "results"
+
+
+def list_runs():
+    index = read_index(RESULTS_DIR)
+    if not index["runs"]:
+        print("No runs recorded")
+        return
+    for run in index["runs"]:
+        marker = "*" if run["run_id"] == index.get("latest") else " "
+        print(f"{marker} {run['run_id']}  {run['status']:<8}  {run.get('created_at', '')}  {run.get('host', '')}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Manage run-scoped benchmark result directories")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    sub.add_parser("new-id", help="Print a fresh run id")
+
+    start_cmd = sub.add_parser("start", help="Register a run as running in results/runs/index.json")
+    start_cmd.add_argument("--run-id", required=True)
+    start_cmd.add_argument("--entrypoint", default="manual")
+
+    finish_cmd = sub.add_parser("finish", help="Record the final status of a run")
+    finish_cmd.add_argument("--run-id", required=True)
+    finish_cmd.add_argument("--status", required=True, choices=["complete", "failed"])
+
+    promote_cmd = sub.add_parser("promote", help="Atomically point results/latest at a complete run")
+    promote_cmd.add_argument("--run-id", required=True)
+    promote_cmd.add_argument("--force", action="store_true", help="Promote a run that is not marked complete")
+
+    sub.add_parser(
+        "detach-latest", help="Replace a promoted results/latest symlink with a copy before writing to latest"
+    )
+    sub.add_parser("list", help="List recorded runs; * marks the run results/latest points at")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.cmd == "new-id":
+        print(new_run_id())
+        return
+    if args.cmd == "start":
+        start_run(RESULTS_DIR, args.run_id, config_from_env(args.entrypoint))
+        return
+    if args.cmd == "finish":
+        finish_run(RESULTS_DIR, args.run_id, args.status)
+        return
+    if args.cmd == "promote":
+        latest = promote_run(RESULTS_DIR, args.run_id, force=args.force)
+        print(f"Promoted run {args.run_id} to {latest}")
+        return
+    if args.cmd == "detach-latest":
+        detach_latest(RESULTS_DIR)
+        return
+    if args.cmd == "list":
+        list_runs()
+        return
+    raise SystemExit(f"Unknown command: {args.cmd}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,11 @@
 #!/usr/bin/env python3
 import argparse
 import json
-import os
-import platform
-import subprocess
-from datetime import datetime, timezone
 from pathlib import Path
 
+from benchlib.environment import build_fingerprint, build_manifest
 from benchlib.io_utils import ensure_under_root, read_json, write_json
+from benchlib.runs import detach_latest
 
 
 REQUIRED_VERSION_FIELDS = [
@@ -21,7 +19,9 @@ REQUIRED_VERSION_FIELDS = [
 ]
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
-RESULTS_ROOT = (REPO_ROOT / "results" / "latest").resolve()
+RESULTS_DIR = REPO_ROOT / "results"
+RESULTS_ROOT = RESULTS_DIR / "latest"
+RUNS_ROOT = (REPO_ROOT / "results" / "runs").resolve()
 
 
 def parse_service_blocks(compose_text):
@@ -53,61 +53,20 @@ def parse_service_blocks(compose_text):
     return blocks
 
 
-def run_first_line(command):
-    try:
-        completed = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-    except OSError:
-        return "unavailable"
-    output = (completed.stdout or completed.stderr or "").strip()
-    if not output:
-        return "unavailable"
-    return output.splitlines()[0].strip()
-
-
-def git_metadata():
-    return {
-        "commit": run_first_line(["git", "rev-parse", "HEAD"]),
-        "branch": run_first_line(["git", "rev-parse", "--abbrev-ref", "HEAD"]),
-    }
-
-
-def runtime_versions():
-    docker_compose = run_first_line(["docker", "compose", "version", "--short"])
-    if docker_compose == "unavailable":
-        docker_compose = run_first_line(["docker-compose", "version", "--short"])
-
-    return {
-        "go": run_first_line(["go", "version"]),
-        "node": run_first_line(["node", "--version"]),
-        "npm": run_first_line(["npm", "--version"]),
-        "python": run_first_line(["python3", "--version"]),
-        "wrk": run_first_line(["wrk", "--version"]),
-        "docker": run_first_line(["docker", "--version"]),
-        "docker_compose": docker_compose,
-    }
-
-
 def ensure_under_results(path):
-    ensure_under_root(path, RESULTS_ROOT, "Refusing path outside results/latest")
+    root = RUNS_ROOT if RUNS_ROOT in path.resolve().parents else RESULTS_ROOT
+    ensure_under_root(path, root, "Refusing path outside results/latest or results/runs")
 
 
 def write_json_safe(path, payload):
+    # Validate first: a rejected path must not detach latest from the run it points at.
     ensure_under_results(path)
+    detach_latest(RESULTS_DIR, [path])
     write_json(path, payload)
 
 
 def collect_fingerprint(out_path):
-    payload = {
-        "generated_at": datetime.now(timezone.utc).isoformat(),
-        "versions": runtime_versions(),
-        "git": git_metadata(),
-    }
-    write_json_safe(out_path, payload)
+    write_json_safe(out_path, build_fingerprint())
     print(f"Wrote: {out_path}")
 
 
@@ -160,40 +119,7 @@ def check_limits(compose_path):
 
 
 def write_manifest(raw_dir, fingerprint_path, out_path):
-    if not raw_dir.exists():
-        raise SystemExit(f"Raw results directory not found: {raw_dir}")
-    if not fingerprint_path.exists():
-        raise SystemExit(f"Fingerprint file not found: {fingerprint_path}")
-
-    rows = []
-    for path in sorted(raw_dir.glob("*.json")):
-        payload = read_json(path)
-        rows.append(
-            {
-                "file": path.name,
-                "framework": payload.get("framework"),
-                "status": payload.get("status"),
-                "reason": payload.get("reason"),
-            }
-        )
-
-    manifest = {
-        "generated_at": datetime.now(timezone.utc).isoformat(),
-        "runner": {
-            "user": os.environ.get("USER", "unknown"),
-            "hostname": platform.node() or "unknown",
-            "platform": platform.platform(),
-            "machine": platform.machine() or "unknown",
-        },
-        "artifacts": {
-            "raw_dir": str(raw_dir),
-            "fingerprint_file": str(fingerprint_path),
-            "targets": len(rows),
-        },
-        "fingerprint": read_json(fingerprint_path),
-        "targets": rows,
-    }
-    write_json_safe(out_path, manifest)
+    write_json_safe(out_path, build_manifest(raw_dir, fingerprint_path))
     print(f"Wrote: {out_path}")
 
 
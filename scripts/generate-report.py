@@ -1,23 +1,65 @@
 #!/usr/bin/env python3
 import json
-import subprocess
-import sys
+import re
+from html import escape
 from datetime import datetime, timezone
 from pathlib import Path
 
+from benchlib.charts import line_chart, strip_chart
+from benchlib.comparison import baseline_deltas, metric_samples
+from benchlib.histogram import merge_run_histograms, quantile_curve_ms
+from benchlib.io_utils import load_json_policy
+from benchlib.raw_index import RawIndex
+from benchlib.runs import detach_latest
+from benchlib.samples import SampleFile, resolve_sidecar, summarize_samples
+from benchlib.soak import load_soak_windows
+from benchlib.stats import DEFAULT_CONFIDENCE, POOLED_QUANTILES, summarize_confidence_intervals
+from benchlib.validation import validate_summary_payload
+
 
 ROOT = Path(__file__).resolve().parent.parent
 RESULTS_LATEST = ROOT / "results" / "latest"
 RAW_DIR = RESULTS_LATEST / "raw"
 SUMMARY_PATH = RESULTS_LATEST / "summary.json"
 REPORT_PATH = RESULTS_LATEST / "report.md"
+HTML_REPORT_PATH = RESULTS_LATEST / "report.html"
+SOAK_DIR = RESULTS_LATEST / "soak"
+SCALING_PATH = RESULTS_LATEST / "scaling.json"
+RAW_SCHEMA = ROOT / "schemas" / "benchmark-raw-v1.schema.json"
+SUMMARY_SCHEMA = ROOT / "schemas" / "benchmark-summary-v1.schema.json"
+POLICY_PATH = ROOT / "stats-policy.json"
+
+DELTA_METRICS = ["rps", "latency_ms_p50", "latency_ms_p95", "latency_ms_p99", "cpu_ms_per_request", "memory_peak_mb"]
+DELTA_LABELS = {
+    "rps": "RPS",
+    "latency_ms_p50": "P50",
+    "latency_ms_p95": "P95",
+    "latency_ms_p99": "P99",
+    "cpu_ms_per_request": "CPU ms/req",
+    "memory_peak_mb": "Peak MB",
+}
+
 
+def load_indexed_extracts():
+    """Per-artifact summary targets and chart series; only new or changed artifacts are parsed and validated."""
+    index = RawIndex(RAW_DIR, RAW_SCHEMA)
+    entries = index.refresh(
+        {
+            "summary_target": lambda path, payload: build_target(dict(payload, _source_file=path.name)),
+            "chart_series": lambda path, payload: build_chart_series(payload),
+            "run_samples": lambda path, payload: build_run_samples(payload),
+        },
+        validate=True,
+    )
+    print(
+        f"raw index: {index.stats['parsed']} parsed, {index.stats['reused']} reused, "
+        f"{index.stats['removed']} removed ({index.path})"
+    )
+    return [extracts for _, extracts in entries]
 
-def run_schema_check(command):
-    completed = subprocess.run(command, capture_output=True, text=True, check=False)
-    if completed.returncode != 0:
-        message = completed.stderr.strip() or completed.stdout.strip() or "schema validation failed"
-        raise SystemExit(message)
+
+def load_indexed_targets():
+    return [extracts["summary_target"] for extracts in load_indexed_extracts()]
 
 
 def load_raw_files():
@@ -35,56 +77,398 @@ def load_raw_files():
     return rows
 
 
-def build_summary(rows):
-    generated_at = datetime.now(timezone.utc).isoformat()
-    summary = {
-        "schema_version": "summary-v1",
-        "generated_at": generated_at,
-        "total_targets": len(rows),
-        "successful_targets": sum(1 for r in rows if r.get("status") == "ok"),
-        "skipped_targets": sum(1 for r in rows if r.get("status") != "ok"),
-        "targets": [],
+def load_scaling():
+    if not SCALING_PATH.exists():
+        return None
+    try:
+        with SCALING_PATH.open("r", encoding="utf-8") as f:
+            return json.load(f)
+    except json.JSONDecodeError as exc:
+        print(f"Warning: skipping malformed JSON {SCALING_PATH}: {exc}")
+        return None
+
+
+def build_target(row):
+    target = {
+        "framework": row.get("framework"),
+        "status": row.get("status"),
+        "target": row.get("target"),
+        "provenance": {
+            "raw_source": f"results/latest/raw/{row.get('_source_file', 'unknown')}"
+        },
     }
-    for row in rows:
-        target = {
-            "framework": row.get("framework"),
-            "status": row.get("status"),
-            "target": row.get("target"),
-            "reason": row.get("reason"),
-            "provenance": {
-                "raw_source": f"results/latest/raw/{row.get('_source_file', 'unknown')}"
-            },
+    if row.get("reason"):
+        target["reason"] = row["reason"]
+    cache_provenance = row.get("provenance") or {}
+    if cache_provenance.get("cached"):
+        target["provenance"]["cached"] = True
+        target["provenance"]["measured_at"] = cache_provenance.get("measured_at")
+    bench = row.get("benchmark") or {}
+    quality = (bench.get("quality") or {}).get("variance") or {}
+    if quality:
+        target["uncertainty"] = {
+            "rps_cv": quality.get("rps_cv"),
+            "latency_ms_p95_cv": quality.get("latency_ms_p95_cv"),
+            "latency_ms_p99_cv": quality.get("latency_ms_p99_cv"),
+        }
+    median = bench.get("median") or {}
+    if median:
+        target["median"] = {
+            "rps": median.get("rps"),
+            "latency_ms_p50": median.get("latency_ms_p50"),
+            "latency_ms_p95": median.get("latency_ms_p95"),
+            "latency_ms_p99": median.get("latency_ms_p99"),
         }
-        bench = row.get("benchmark") or {}
-        quality = (bench.get("quality") or {}).get("variance") or {}
-        if quality:
-            target["uncertainty"] = {
-                "rps_cv": quality.get("rps_cv"),
-                "latency_ms_p95_cv": quality.get("latency_ms_p95_cv"),
-                "latency_ms_p99_cv": quality.get("latency_ms_p99_cv"),
+        excluded = {
+            sample.get("run_index") for sample in (bench.get("quality") or {}).get("excluded_samples") or []
+        }
+        effective_runs = [
+            run for idx, run in enumerate(bench.get("run_stats") or []) if idx not in excluded
+        ] or bench.get("run_stats") or []
+        if bench.get("payload"):
+            target["payload"] = {
+                **bench["payload"],
+                "request_bytes_per_second": median.get("request_bytes_per_second"),
+                "response_bytes_per_second": median.get("response_bytes_per_second"),
             }
-        median = bench.get("median") or {}
-        if median:
-            target["median"] = {
-                "rps": median.get("rps"),
-                "latency_ms_p50": median.get("latency_ms_p50"),
-                "latency_ms_p95": median.get("latency_ms_p95"),
-                "latency_ms_p99": median.get("latency_ms_p99"),
+        if bench.get("sessions"):
+            target["sessions"] = bench["sessions"]
+        if bench.get("pooled_latency_ms"):
+            target["pooled_latency_ms"] = bench["pooled_latency_ms"]
+        if effective_runs:
+            pooled = merge_run_histograms(effective_runs)
+            target["confidence_intervals"] = summarize_confidence_intervals(
+                effective_runs, sorted_latency_ms=pooled.sorted_ms() if pooled else None
+            )
+        sidecar = resolve_sidecar(RAW_DIR / row.get("_source_file", ""), bench.get("samples"))
+        if sidecar is not None:
+            with SampleFile(sidecar) as samples:
+                target["request_samples"] = summarize_samples(samples)
+    if row.get("resources_normalized"):
+        target["resources_normalized"] = row.get("resources_normalized")
+    if row.get("metric_units"):
+        target["metric_units"] = row.get("metric_units")
+    return target
+
+
+def build_chart_series(row):
+    """Compact per-target series for the HTML report: pooled latency curve and per-run values."""
+    bench = row.get("benchmark") or {}
+    run_stats = bench.get("run_stats") or []
+    excluded = {sample.get("run_index") for sample in (bench.get("quality") or {}).get("excluded_samples") or []}
+    effective = [run for idx, run in enumerate(run_stats) if idx not in excluded] or run_stats
+    return {
+        "framework": row.get("framework"),
+        "latency_curve_ms": quantile_curve_ms(merge_run_histograms(effective)),
+        "runs": [
+            {
+                "excluded": idx in excluded,
+                **{key: run.get(key) for key in ("rps", "memory_peak_mb", "cpu_ms_per_request") if key in run},
             }
-        if row.get("resources_normalized"):
-            target["resources_normalized"] = row.get("resources_normalized")
-        if row.get("metric_units"):
-            target["metric_units"] = row.get("metric_units")
-        summary["targets"].append(target)
+            for idx, run in enumerate(run_stats)
+        ],
+    }
+
+
+def build_run_samples(row):
+    """Per-metric values of the non-excluded runs, which the baseline comparison tests against each other."""
+    if row.get("status") != "ok":
+        return {}
+    return {metric: metric_samples(row, metric) for metric in DELTA_METRICS}
+
+
+def build_baseline_comparison(samples_by_framework):
+    policy = load_json_policy(POLICY_PATH, default_on_missing={})
+    settings = (policy.get("quality") or {}).get("comparison") or {}
+    return baseline_deltas(
+        samples_by_framework,
+        settings.get("baseline_framework", "baseline"),
+        DELTA_METRICS,
+        alpha=settings.get("alpha", 0.05),
+        confidence=settings.get("confidence", DEFAULT_CONFIDENCE),
+    )
+
+
+def assemble_summary(targets, scaling=None, comparison=None):
+    summary = {
+        "schema_version": "summary-v1",
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "total_targets": len(targets),
+        "successful_targets": sum(1 for t in targets if t.get("status") == "ok"),
+        "skipped_targets": sum(1 for t in targets if t.get("status") != "ok"),
+        "targets": targets,
+    }
+    if scaling:
+        summary["scaling"] = scaling
+    if comparison:
+        summary["baseline_comparison"] = comparison
     return summary
 
 
+def build_summary(rows, scaling=None):
+    return assemble_summary([build_target(row) for row in rows], scaling=scaling)
+
+
 def write_summary(summary):
     RESULTS_LATEST.mkdir(parents=True, exist_ok=True)
     with SUMMARY_PATH.open("w", encoding="utf-8") as f:
         json.dump(summary, f, indent=2)
 
 
+DISCLAIMER_LINES = [
+    "",
+    "## Fairness Disclaimer",
+    "",
+    "- Language-vs-framework caveat: cross-language results include runtime and ecosystem effects and must not be treated as framework-only deltas.",
+    "- Cross-language baseline: compare implementations with equivalent API behavior, workload profile, and environment constraints before drawing conclusions.",
+    "",
+    "## Anti-Misinterpretation Guidance",
+    "",
+    "- Do not rank frameworks across languages as absolute winners; use results as scenario-specific signals.",
+    "- Treat large cross-language deltas as prompts for deeper profiling (runtime, I/O, GC, and dependency effects), not as standalone product claims.",
+    "- Parity failures invalidate performance interpretation until correctness is restored.",
+]
+
+ARTIFACT_LINES = [
+    "",
+    "## Raw Artifacts",
+    "",
+    "- Raw JSON: `results/latest/raw/*.json`",
+    "- Summary JSON: `results/latest/summary.json`",
+    "- HTML report: `results/latest/report.html`",
+]
+
+
+def format_optional(value, spec=".2f"):
+    if value is None:
+        return "-"
+    return format(value, spec)
+
+
+def format_with_ci(target, key):
+    median = target.get("median") or {}
+    if key not in median:
+        return "-"
+    cell = f"{median.get(key, 0):.2f}"
+    interval = ((target.get("confidence_intervals") or {}).get("metrics") or {}).get(key) or {}
+    if interval.get("lower") is not None and interval.get("upper") is not None:
+        cell += f" [{interval['lower']:.2f}, {interval['upper']:.2f}]"
+    return cell
+
+
+def pooled_latency_lines(targets):
+    pooled_targets = [t for t in targets if t.get("pooled_latency_ms")]
+    if not pooled_targets:
+        return []
+    names = list(POOLED_QUANTILES)
+    header = " | ".join(name.upper().replace("_", ".") for name in names)
+    lines = [
+        "",
+        "## Pooled Latency (ms)",
+        "",
+        "Percentiles over every request of the non-excluded runs, merged from per-run histograms.",
+        "",
+        f"| Framework | Requests | {header} | Max |",
+        "|---|---:|" + "---:|" * (len(names) + 1),
+    ]
+    for t in pooled_targets:
+        pooled = t["pooled_latency_ms"]
+        intervals = (t.get("confidence_intervals") or {}).get("metrics") or {}
+        cells = []
+        for name in names:
+            cell = format_optional(pooled.get(name), ".3f")
+            interval = intervals.get(f"pooled_latency_ms_{name}") or {}
+            if pooled.get(name) is not None and interval.get("lower") is not None:
+                cell += f" [{interval['lower']:.3f}, {interval['upper']:.3f}]"
+            cells.append(cell)
+        lines.append(
+            f"| {t.get('framework', '-')} | {pooled.get('count', '-')} | {' | '.join(cells)} | "
+            f"{format_optional(pooled.get('max'), '.3f')} |"
+        )
+    return lines
+
+
+def payload_lines(targets):
+    sized = [t for t in targets if t.get("payload")]
+    if not sized:
+        return []
+    lines = [
+        "",
+        "## Payload Throughput",
+        "",
+        "Request bodies are padded user objects of the listed size; byte rates count successful requests only.",
+        "",
+        "| Framework | Method | Body (bytes) | Median RPS | P50 Latency (ms) | P95 Latency (ms) "
+        "| Request MB/s | Response MB/s |",
+        "|---|---|---:|---:|---:|---:|---:|---:|",
+    ]
+    for t in sorted(sized, key=lambda t: (t["payload"]["bytes"], t.get("framework", ""))):
+        payload, median = t["payload"], t.get("median") or {}
+        cells = [
+            format_optional(median.get("rps")),
+            format_optional(median.get("latency_ms_p50"), ".3f"),
+            format_optional(median.get("latency_ms_p95"), ".3f"),
+            *(
+                format_optional(None if rate is None else rate / (1024 * 1024))
+                for rate in (payload.get("request_bytes_per_second"), payload.get("response_bytes_per_second"))
+            ),
+        ]
+        lines.append(f"| {t.get('framework', '-')} | {payload['method']} | {payload['bytes']} | {' | '.join(cells)} |")
+    return lines
+
+
+def session_lines(targets):
+    scripted = [t for t in targets if t.get("sessions")]
+    if not scripted:
+        return []
+    lines = [
+        "",
+        "## Session Latency (ms)",
+        "",
+        "Steps are timed from send to full response; a failed step ends its session and is not timed.",
+        "",
+        "| Framework | Script | Step | Requests | Failures | P50 | P95 | P99 | Max |",
+        "|---|---|---|---:|---:|---:|---:|---:|---:|",
+    ]
+    for t in scripted:
+        sessions = t["sessions"]
+        rows = [
+            (f"{step['method']} {step['path']}", step["requests"], step["failures"], step.get("latency_ms"))
+            for step in sessions["steps"]
+        ]
+        total = sessions["session"]
+        rows.append(("end-to-end session", total["sessions"], total["failures"], total.get("latency_ms")))
+        for label, requests, failures, latency in rows:
+            latency = latency or {}
+            cells = [format_optional(latency.get(key), ".3f") for key in ("p50", "p95", "p99", "max")]
+            lines.append(
+                f"| {t.get('framework', '-')} | {sessions['script']} | {label} | {requests} | {failures} | "
+                f"{' | '.join(cells)} |"
+            )
+    return lines
+
+
+def request_sample_lines(targets):
+    sampled = [t for t in targets if t.get("request_samples")]
+    if not sampled:
+        return []
+    lines = [
+        "",
+        "## Request Samples",
+        "",
+        "Read from the per-request sidecars. The slowest request is located by run and by send time "
+        "(seconds after the first recorded request) for follow-up in the sidecar.",
+        "",
+        "| Framework | Requests | Failed | Response MB | Slowest (ms) | Slowest at |",
+        "|---|---:|---:|---:|---:|---|",
+    ]
+    for t in sampled:
+        samples = t["request_samples"]
+        slowest = samples.get("slowest") or {}
+        located = (
+            f"run {slowest['run_index']}, t+{slowest['send_offset_ms'] / 1000:.3f}s, status {slowest['status']}"
+            if slowest
+            else "-"
+        )
+        lines.append(
+            f"| {t.get('framework', '-')} | {samples['records']} | {samples['failed']} | "
+            f"{samples['bytes'] / (1024 * 1024):.2f} | {format_optional(slowest.get('latency_ms'), '.3f')} | {located} |"
+        )
+    return lines
+
+
+def format_delta(delta):
+    """'+12.3% [+8.1, +16.0] sig' - percent change vs baseline, its CI, and the significance marker."""
+    if delta is None or delta.get("delta_percent") is None:
+        return "-"
+    cell = f"{delta['delta_percent']:+.1f}%"
+    lower, upper = delta.get("delta_percent_ci") or [None, None]
+    if lower is not None and upper is not None:
+        cell += f" [{lower:+.1f}, {upper:+.1f}]"
+    if delta.get("underpowered"):
+        return cell + " underpowered"
+    return cell + (" sig" if delta.get("significant") else " n.s.")
+
+
+def baseline_comparison_lines(comparison):
+    if not comparison:
+        return []
+    baseline = comparison["baseline_framework"]
+    lines = ["", f"## Comparison vs Baseline ({baseline})", ""]
+    if comparison.get("status") != "ok":
+        return lines + [f"Not computed: `{baseline}` has no successful result in this run."]
+    metrics = [m for m in DELTA_METRICS if any(m in c["metrics"] for c in comparison["comparisons"])]
+    if not metrics:
+        return lines + ["No other framework has successful runs to compare."]
+    confidence = comparison["confidence"] * 100
+    lines.extend(
+        [
+            f"Change relative to the `{baseline}` median: Hodges-Lehmann shift over the non-excluded runs with its "
+            f"{confidence:g}% interval in percentage points. `sig` / `n.s.` is a two-sided Mann-Whitney U test at "
+            f"alpha={comparison['alpha']:g}; `underpowered` means the run counts cannot reach that alpha. "
+            "Higher is better for RPS; lower is better for latency and resources.",
+            "",
+            "| Framework | " + " | ".join(DELTA_LABELS[m] for m in metrics) + " |",
+            "|---|" + "---:|" * len(metrics),
+        ]
+    )
+    for c in comparison["comparisons"]:
+        cells = [format_delta(c["metrics"].get(m)) for m in metrics]
+        lines.append(f"| {c['framework']} | " + " | ".join(cells) + " |")
+    return lines
+
+
+def scaling_lines(scaling):
+    if not scaling:
+        return []
+    lines = [
+        "",
+        "## Scaling Efficiency",
+        "",
+        f"Load scaled with CPU count: {scaling.get('base_concurrency')} in-flight and "
+        f"{scaling.get('requests_per_cpu')} requests per run per CPU on `{scaling.get('endpoint')}`.",
+        "",
+        "| Framework | CPUs | Median RPS | Speedup | Efficiency | Client CPU (cores) |",
+        "|---|---:|---:|---:|---:|---:|",
+    ]
+    frameworks = scaling.get("frameworks") or {}
+    client_bound = False
+    for framework, analysis in frameworks.items():
+        for step in analysis.get("steps") or []:
+            client = format_optional(step.get("client_cpu_utilisation"))
+            if step.get("client_bound"):
+                client_bound = True
+                client += " (client-bound)"
+            lines.append(
+                f"| {framework} | {step['cpus']} | {step['rps']:.2f} | {step['speedup']:.2f}x | "
+                f"{step['efficiency'] * 100:.1f}% | {client} |"
+            )
+    if client_bound:
+        lines.extend(
+            [
+                "",
+                "Client-bound steps measured the load generator's limit, not the target's, "
+                "and are left out of the fits below.",
+            ]
+        )
+    lines.extend(
+        [
+            "",
+            "| Framework | Amdahl σ | USL σ (contention) | USL κ (coherency) | USL peak CPUs | USL R² |",
+            "|---|---:|---:|---:|---:|---:|",
+        ]
+    )
+    for framework, analysis in frameworks.items():
+        amdahl = analysis.get("amdahl") or {}
+        usl = analysis.get("usl") or {}
+        lines.append(
+            f"| {framework} | {format_optional(amdahl.get('sigma'), '.4f')} | "
+            f"{format_optional(usl.get('sigma'), '.4f')} | {format_optional(usl.get('kappa'), '.5f')} | "
+            f"{format_optional(usl.get('peak_cpus'), '.1f')} | {format_optional(usl.get('r_squared'), '.3f')} |"
+        )
+    return lines
+
+
 def write_report(summary):
     lines = [
         "# Benchmark Report",
@@ -103,48 +487,231 @@ def write_report(summary):
     ]
 
     for t in summary["targets"]:
-        median = t.get("median") or {}
-        rps = f"{median.get('rps', 0):.2f}" if "rps" in median else "-"
-        p50 = f"{median.get('latency_ms_p50', 0):.2f}" if "latency_ms_p50" in median else "-"
-        p95 = f"{median.get('latency_ms_p95', 0):.2f}" if "latency_ms_p95" in median else "-"
-        p99 = f"{median.get('latency_ms_p99', 0):.2f}" if "latency_ms_p99" in median else "-"
+        rps = format_with_ci(t, "rps")
+        p50 = format_with_ci(t, "latency_ms_p50")
+        p95 = format_with_ci(t, "latency_ms_p95")
+        p99 = format_with_ci(t, "latency_ms_p99")
         notes = t.get("reason") or ""
         lines.append(f"| {t.get('framework','-')} | {t.get('status','-')} | {rps} | {p50} | {p95} | {p99} | {notes} |")
 
-    lines.extend(
-        [
-            "",
-            "## Fairness Disclaimer",
-            "",
-            "- Language-vs-framework caveat: cross-language results include runtime and ecosystem effects and must not be treated as framework-only deltas.",
-            "- Cross-language baseline: compare implementations with equivalent API behavior, workload profile, and environment constraints before drawing conclusions.",
-            "",
-            "## Anti-Misinterpretation Guidance",
-            "",
-            "- Do not rank frameworks across languages as absolute winners; use results as scenario-specific signals.",
-            "- Treat large cross-language deltas as prompts for deeper profiling (runtime, I/O, GC, and dependency effects), not as standalone product claims.",
-            "- Parity failures invalidate performance interpretation until correctness is restored.",
-            "",
-            "## Raw Artifacts",
-            "",
-            "- Raw JSON: `results/latest/raw/*.json`",
-            "- Summary JSON: `results/latest/summary.json`",
-        ]
-    )
+    if any(t.get("confidence_intervals") for t in summary["targets"]):
+        lines.extend(
+            [
+                "",
+                "Bracketed ranges are 95% percentile-bootstrap confidence intervals for each median; "
+                "overlapping ranges mean the gap is not distinguishable from run-to-run noise.",
+            ]
+        )
+
+    lines.extend(baseline_comparison_lines(summary.get("baseline_comparison")))
+    lines.extend(payload_lines(summary["targets"]))
+    lines.extend(session_lines(summary["targets"]))
+    lines.extend(pooled_latency_lines(summary["targets"]))
+    lines.extend(request_sample_lines(summary["targets"]))
+    lines.extend(scaling_lines(summary.get("scaling")))
+
+    lines.extend(DISCLAIMER_LINES)
+    lines.extend(ARTIFACT_LINES)
 
     with REPORT_PATH.open("w", encoding="utf-8") as f:
         f.write("\n".join(lines) + "\n")
 
 
+def inline_markdown(text):
+    return re.sub(r"`([^`]+)`", r"<code>\1</code>", escape(text, quote=False))
+
+
+def markdown_lines_html(lines):
+    """Render the report's own headings, bullet lists, and tables, so both formats share one text."""
+    parts, in_list, in_table = [], False, False
+    for line in lines:
+        if line.startswith("|"):
+            if line.startswith("|---"):
+                continue
+            cells = [inline_markdown(cell.strip()) for cell in line.strip("|").split("|")]
+            tag = "td" if in_table else "th"
+            if not in_table:
+                parts.append("<table>")
+                in_table = True
+            parts.append("<tr>" + "".join(f"<{tag}>{cell}</{tag}>" for cell in cells) + "</tr>")
+            continue
+        if in_table:
+            parts.append("</table>")
+            in_table = False
+        if line.startswith("- "):
+            if not in_list:
+                parts.append("<ul>")
+                in_list = True
+            parts.append(f"<li>{inline_markdown(line[2:])}</li>")
+            continue
+        if in_list:
+            parts.append("</ul>")
+            in_list = False
+        if line.startswith("## "):
+            parts.append(f"<h2>{inline_markdown(line[3:])}</h2>")
+        elif line:
+            parts.append(f"<p>{inline_markdown(line)}</p>")
+    if in_list:
+        parts.append("</ul>")
+    if in_table:
+        parts.append("</table>")
+    return parts
+
+
+def percentile_ticks(max_x):
+    ticks = [(1, "0%"), (2, "50%"), (10, "90%"), (100, "99%"), (1000, "99.9%"), (10000, "99.99%"), (100000, "99.999%")]
+    return [tick for tick in ticks if tick[0] <= max(max_x, 10)]
+
+
+def latency_chart_html(series):
+    curves = [(s["framework"], s["latency_curve_ms"]) for s in series if s.get("latency_curve_ms")]
+    if not curves:
+        return ["<p>No latency histograms were recorded, so distribution plots are unavailable.</p>"]
+    cdf = [(name, [(ms, q * 100) for q, ms in curve]) for name, curve in curves]
+    # HDR-style: x is 1/(1-q) on a log axis, so each decade is one more "nine"; the max sits at the sample-count limit.
+    tail = [
+        (name, [(1 / (1 - q) if q < 1 else 1 / (1 - curve[-2][0]) * 2, ms) for q, ms in curve])
+        for name, curve in curves
+    ]
+    max_x = max(x for _, points in tail for x, _ in points)
+    return [
+        "<h3>Latency CDF</h3>",
+        line_chart("Latency CDF", cdf, "latency (ms)", "requests at or below (%)", step=True),
+        "<h3>Latency by percentile</h3>",
+        line_chart(
+            "Latency by percentile", tail, "percentile", "latency (ms)", x_log=True, x_ticks=percentile_ticks(max_x)
+        ),
+        "<p>Pooled over the non-excluded runs. The rightmost point of each line is the maximum.</p>",
+    ]
+
+
+def run_charts_html(series):
+    groups = [
+        (s["framework"], [(run["rps"], run["excluded"]) for run in s["runs"] if run.get("rps") is not None])
+        for s in series
+    ]
+    groups = [group for group in groups if group[1]]
+    if not groups:
+        return []
+    return [
+        "<h2>Throughput per Run</h2>",
+        strip_chart("Requests per second per run", groups, "requests/s"),
+        "<p>Each point is one measured run; crosses mark runs excluded as outliers by the stats policy.</p>",
+    ]
+
+
+def resource_charts_html(series, soak):
+    parts = []
+    for key, title, unit in (
+        ("memory_peak_mb", "Peak memory per run", "MB"),
+        ("cpu_ms_per_request", "CPU time per request", "ms"),
+    ):
+        lines = [
+            (s["framework"], [(idx, run[key]) for idx, run in enumerate(s["runs"]) if run.get(key) is not None])
+            for s in series
+        ]
+        lines = [line for line in lines if line[1]]
+        if lines:
+            parts.extend([f"<h3>{escape(title)}</h3>", line_chart(title, lines, "run", unit)])
+    for key, title, unit in (("memory_mb", "Soak memory (cgroup)", "MB"), ("rps", "Soak throughput", "requests/s")):
+        lines = [
+            (framework, [(w["elapsed_seconds"] / 60, w[key]) for w in windows if w.get(key) is not None])
+            for framework, windows in soak.items()
+        ]
+        lines = [line for line in lines if line[1]]
+        if lines:
+            parts.extend([f"<h3>{escape(title)}</h3>", line_chart(title, lines, "elapsed (min)", unit)])
+    if not parts:
+        return []
+    return ["<h2>Resources</h2>", *parts]
+
+
+def load_soak_series():
+    if not SOAK_DIR.exists():
+        return {}
+    return {path.stem: load_soak_windows(path)[1] for path in sorted(SOAK_DIR.glob("*.jsonl"))}
+
+
+HTML_STYLE = """
+body { font-family: system-ui, sans-serif; max-width: 60rem; margin: 2rem auto; padding: 0 1rem; color: #222; }
+table { border-collapse: collapse; margin: 1rem 0; }
+th, td { border: 1px solid #ccc; padding: 0.3rem 0.6rem; text-align: right; }
+th:first-child, td:first-child, td:last-child { text-align: left; }
+svg.chart { width: 100%; height: auto; font-size: 11px; }
+svg.chart .axis { stroke: #444; }
+svg.chart .grid { stroke: #e5e5e5; }
+code { background: #f3f3f3; padding: 0 0.2rem; }
+"""
+
+
+def write_html_report(summary, series, soak=None):
+    """Single-file HTML with inline SVG charts; no scripts or external assets."""
+    rows = []
+    for t in summary["targets"]:
+        cells = [escape(format_with_ci(t, key)) for key in ("rps", "latency_ms_p50", "latency_ms_p95", "latency_ms_p99")]
+        rows.append(
+            f"<tr><td>{escape(str(t.get('framework', '-')))}</td><td>{escape(str(t.get('status', '-')))}</td>"
+            + "".join(f"<td>{cell}</td>" for cell in cells)
+            + f"<td>{escape(t.get('reason') or '')}</td></tr>"
+        )
+    measured = [s for s in series if s.get("runs")]
+    parts = [
+        "<!DOCTYPE html>",
+        '<html lang="en">',
+        "<head>",
+        '<meta charset="utf-8">',
+        "<title>Benchmark Report</title>",
+        f"<style>{HTML_STYLE}</style>",
+        "</head>",
+        "<body>",
+        "<h1>Benchmark Report</h1>",
+        f"<p>Generated: <code>{escape(summary['generated_at'])}</code></p>",
+        *markdown_lines_html(
+            [
+                "## Overview",
+                f"- Total targets: {summary['total_targets']}",
+                f"- Successful: {summary['successful_targets']}",
+                f"- Skipped: {summary['skipped_targets']}",
+            ]
+        ),
+        "<h2>Results</h2>",
+        "<table>",
+        "<tr><th>Framework</th><th>Status</th><th>Median RPS</th><th>P50 Latency (ms)</th>"
+        "<th>P95 Latency (ms)</th><th>P99 Latency (ms)</th><th>Notes</th></tr>",
+        *rows,
+        "</table>",
+        *markdown_lines_html(baseline_comparison_lines(summary.get("baseline_comparison"))),
+        *markdown_lines_html(payload_lines(summary["targets"])),
+        *markdown_lines_html(session_lines(summary["targets"])),
+        "<h2>Latency Distribution</h2>",
+        *latency_chart_html(measured),
+        *run_charts_html(measured),
+        *resource_charts_html(measured, soak or {}),
+        *markdown_lines_html(DISCLAIMER_LINES),
+        *markdown_lines_html(ARTIFACT_LINES),
+        "</body>",
+        "</html>",
+    ]
+    with HTML_REPORT_PATH.open("w", encoding="utf-8") as f:
+        f.write("\n".join(part for part in parts if part) + "\n")
+
+
 def main():
-    run_schema_check([sys.executable, "scripts/validate-result-schemas.py", "raw-check"])
-    rows = load_raw_files()
-    summary = build_summary(rows)
+    detach_latest(RESULTS_LATEST.parent, [RESULTS_LATEST])
+    extracts = load_indexed_extracts()
+    samples = {e["summary_target"]["framework"]: e["run_samples"] for e in extracts if e["run_samples"]}
+    summary = assemble_summary(
+        [e["summary_target"] for e in extracts],
+        scaling=load_scaling(),
+        comparison=build_baseline_comparison(samples),
+    )
+    validate_summary_payload(summary, SUMMARY_SCHEMA, SUMMARY_PATH)
     write_summary(summary)
-    run_schema_check([sys.executable, "scripts/validate-result-schemas.py", "summary-check"])
     write_report(summary)
+    write_html_report(summary, [e["chart_series"] for e in extracts], soak=load_soak_series())
     print(f"Wrote: {SUMMARY_PATH}")
     print(f"Wrote: {REPORT_PATH}")
+    print(f"Wrote: {HTML_REPORT_PATH}")
 
 
 if __name__ == "__main__":
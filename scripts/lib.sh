@@ -20,3 +20,30 @@ ensure_path_under_root() {
       ;;
   esac
 }
+
+# Prints the validated run id; "auto" generates a fresh one and empty means no run scope.
+resolve_run_id() {
+  local run_id="$1"
+  if [[ "$run_id" == "auto" ]]; then
+    python3 scripts/benchmark-runs.py new-id
+    return
+  fi
+  if [[ -n "$run_id" && ! "$run_id" =~ ^[A-Za-z0-9][A-Za-z0-9._-]{0,63}$ ]]; then
+    echo "BENCHMARK_RUN_ID must be up to 64 letters, digits, '.', '_' or '-' (got: $run_id)" >&2
+    return 1
+  fi
+  printf '%s\n' "$run_id"
+}
+
+# Prints the results root for a session: results/runs/<id> for a run, otherwise results/latest.
+# A promoted latest symlink is first replaced by a real copy so the session never writes into an archived run.
+results_scope_root() {
+  local repo_root="$1"
+  local run_id="$2"
+  if [[ -n "$run_id" ]]; then
+    printf '%s\n' "$repo_root/results/runs/$run_id"
+  else
+    python3 "$repo_root/scripts/benchmark-runs.py" detach-latest >&2
+    printf '%s\n' "$repo_root/results/latest"
+  fi
+}
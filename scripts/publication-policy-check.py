@@ -5,6 +5,7 @@ from pathlib import Path
 
 ROOT = Path(__file__).resolve().parent.parent
 REPORT = ROOT / "results" / "latest" / "report.md"
+HTML_REPORT = ROOT / "results" / "latest" / "report.html"
 REPORT_GENERATOR = ROOT / "scripts" / "generate-report.py"
 METHODOLOGY = ROOT / "METHODOLOGY.md"
 README = ROOT / "README.md"
@@ -24,6 +25,7 @@ def generator_template_content() -> str:
 
 def disclaimer_check() -> None:
     content = report_content()
+    html = HTML_REPORT.read_text(encoding="utf-8") if HTML_REPORT.exists() else ""
     template = generator_template_content()
     required = [
         "## Fairness Disclaimer",
@@ -36,7 +38,11 @@ def disclaimer_check() -> None:
             raise SystemExit(f"report-disclaimer-check failed: missing '{token}' in scripts/generate-report.py")
         if REPORT.exists() and token not in content:
             raise SystemExit(f"report-disclaimer-check failed: missing '{token}' in results/latest/report.md")
-    source = "report + generator" if REPORT.exists() else "generator template"
+        # The HTML report renders the same headings as <h2> elements.
+        if HTML_REPORT.exists() and token.removeprefix("## ") not in html:
+            raise SystemExit(f"report-disclaimer-check failed: missing '{token}' in results/latest/report.html")
+    reports = [name for name, path in (("report", REPORT), ("HTML report", HTML_REPORT)) if path.exists()]
+    source = " + ".join([*reports, "generator"]) if reports else "generator template"
     print(f"report-disclaimer-check: validated disclaimer sections via {source}")
 
 
@@ -2,16 +2,23 @@
 set -euo pipefail
 
 frameworks=(modkit nestjs baseline wire fx "do")
-raw_dir="${RESULTS_RAW_DIR:-results/latest/raw}"
-results_dir="${RESULTS_DIR:-$(dirname "$raw_dir")}"
-fingerprint_file="${FINGERPRINT_FILE:-$results_dir/environment.fingerprint.json}"
-manifest_file="${MANIFEST_FILE:-$results_dir/environment.manifest.json}"
 
 script_dir="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 repo_root="$(cd "$script_dir/.." && pwd)"
-results_root="$repo_root/results/latest"
 source "$script_dir/lib.sh"
 
+run_id="$(resolve_run_id "${BENCHMARK_RUN_ID:-}")"
+results_root="$(results_scope_root "$repo_root" "$run_id")"
+raw_dir="${RESULTS_RAW_DIR:-$results_root/raw}"
+results_dir="${RESULTS_DIR:-$(dirname "$raw_dir")}"
+fingerprint_file="${FINGERPRINT_FILE:-$results_dir/environment.fingerprint.json}"
+manifest_file="${MANIFEST_FILE:-$results_dir/environment.manifest.json}"
+
+if [[ -n "$run_id" ]]; then
+  mkdir -p "$results_root"
+  ensure_path_under_root "BENCHMARK_RUN_ID" "$(resolve_path "$results_root")" "$(resolve_path "$repo_root/results/runs")"
+fi
+
 results_root_abs="$(resolve_path "$results_root")"
 raw_dir_abs="$(resolve_path "$raw_dir")"
 results_dir_abs="$(resolve_path "$results_dir")"
@@ -30,11 +37,17 @@ manifest_file="$manifest_file_abs"
 
 mkdir -p "$raw_dir"
 
+if [[ -n "$run_id" ]]; then
+  python3 scripts/benchmark-runs.py start --run-id "$run_id" --entrypoint run-all
+  trap 'python3 scripts/benchmark-runs.py finish --run-id "$run_id" --status failed' ERR
+  echo "Run id: $run_id"
+fi
+
 python3 scripts/environment-manifest.py collect-fingerprint --out "$fingerprint_file"
 
 for framework in "${frameworks[@]}"; do
   echo "=== Benchmarking: $framework ==="
-  BENCHMARK_METADATA_MANAGED=1 bash scripts/run-single.sh "$framework"
+  BENCHMARK_RUN_ID="$run_id" BENCHMARK_METADATA_MANAGED=1 bash scripts/run-single.sh "$framework"
 done
 
 python3 scripts/validate-result-schemas.py raw-check --raw-dir "$raw_dir"
@@ -42,3 +55,11 @@ python3 scripts/validate-result-schemas.py raw-check --raw-dir "$raw_dir"
 python3 scripts/environment-manifest.py write-manifest --raw-dir "$raw_dir" --fingerprint "$fingerprint_file" --out "$manifest_file"
 
 echo "Raw benchmark files generated in: $raw_dir"
+
+if [[ -n "$run_id" ]]; then
+  trap - ERR
+  python3 scripts/benchmark-runs.py finish --run-id "$run_id" --status complete
+  if [[ "${BENCHMARK_PROMOTE:-1}" == "1" ]]; then
+    python3 scripts/benchmark-runs.py promote --run-id "$run_id"
+  fi
+fi
@@ -20,17 +20,24 @@ case "$framework" in
     ;;
 esac
 
-raw_dir="${RESULTS_RAW_DIR:-results/latest/raw}"
+script_dir="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+repo_root="$(cd "$script_dir/.." && pwd)"
+source "$script_dir/lib.sh"
+
+run_id="$(resolve_run_id "${BENCHMARK_RUN_ID:-}")"
+results_root="$(results_scope_root "$repo_root" "$run_id")"
+expected_raw_dir="$results_root/raw"
+
+raw_dir="${RESULTS_RAW_DIR:-$expected_raw_dir}"
 metadata_managed="${BENCHMARK_METADATA_MANAGED:-0}"
 results_dir="${RESULTS_DIR:-$(dirname "$raw_dir")}"
 fingerprint_file="${FINGERPRINT_FILE:-$results_dir/environment.fingerprint.json}"
 manifest_file="${MANIFEST_FILE:-$results_dir/environment.manifest.json}"
 
-script_dir="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
-repo_root="$(cd "$script_dir/.." && pwd)"
-results_root="$repo_root/results/latest"
-expected_raw_dir="$results_root/raw"
-source "$script_dir/lib.sh"
+if [[ -n "$run_id" ]]; then
+  mkdir -p "$results_root"
+  ensure_path_under_root "BENCHMARK_RUN_ID" "$(resolve_path "$results_root")" "$(resolve_path "$repo_root/results/runs")"
+fi
 
 raw_dir_abs="$(resolve_path "$raw_dir")"
 results_dir_abs="$(resolve_path "$results_dir")"
@@ -65,9 +72,17 @@ write_manifest() {
     return
   fi
   python3 scripts/environment-manifest.py write-manifest --raw-dir "$raw_dir" --fingerprint "$fingerprint_file" --out "$manifest_file"
+  if [[ -n "$run_id" ]]; then
+    trap - ERR
+    python3 scripts/benchmark-runs.py finish --run-id "$run_id" --status complete
+  fi
 }
 
 if [[ "$metadata_managed" != "1" ]]; then
+  if [[ -n "$run_id" ]]; then
+    python3 scripts/benchmark-runs.py start --run-id "$run_id" --entrypoint "run-single:$framework"
+    trap 'python3 scripts/benchmark-runs.py finish --run-id "$run_id" --status failed' ERR
+  fi
   python3 scripts/environment-manifest.py collect-fingerprint --out "$fingerprint_file"
 fi
 
@@ -115,6 +130,7 @@ warmup_requests="${WARMUP_REQUESTS:-100}"
 benchmark_requests="${BENCHMARK_REQUESTS:-300}"
 runs="${BENCHMARK_RUNS:-3}"
 endpoint="${BENCHMARK_ENDPOINT:-/health}"
+concurrency="${BENCHMARK_CONCURRENCY:-1}"
 
 python3 scripts/benchmark-measure.py \
   --framework "$framework" \
@@ -123,6 +139,7 @@ python3 scripts/benchmark-measure.py \
   --warmup-requests "$warmup_requests" \
   --benchmark-requests "$benchmark_requests" \
   --runs "$runs" \
+  --concurrency "$concurrency" \
   --out-file "$out_file" \
   --parity-result "$parity_result" \
   --engine "${BENCH_ENGINE:-legacy}"
@@ -19,3 +19,8 @@ teardown() {
   run env RESULTS_RAW_DIR="/tmp" bash scripts/run-all.sh
   [ "$status" -ne 0 ]
 }
+
+@test "run-all rejects run id that escapes results/runs" {
+  run env BENCHMARK_RUN_ID="../latest" bash scripts/run-all.sh
+  [ "$status" -ne 0 ]
+}
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import csv
+import json
+import shutil
+
+import pytest
+
+from .script_loader import load_script_module
+
+
+def test_export_streams_target_run_and_gate_rows(repo_root, fixture_root, tmp_path):
+    load_script_module(repo_root, "scripts/benchmark-export.py", "benchmark_export_cli")
+    from benchlib.export import RUN_COLUMNS, TARGET_COLUMNS, export_results
+
+    raw_dir = tmp_path / "latest" / "raw"
+    raw_dir.mkdir(parents=True)
+    shutil.copy(fixture_root / "raw" / "modkit-ok.json", raw_dir / "modkit.json")
+    shutil.copy(fixture_root / "raw" / "nestjs-skipped-health.json", raw_dir / "nestjs.json")
+    (tmp_path / "latest" / "environment.manifest.json").write_text(
+        json.dumps({"generated_at": "2026-01-01T00:00:00+00:00", "fingerprint": {"git": {"commit": "abc"}}}),
+        encoding="utf-8",
+    )
+    (tmp_path / "latest" / "benchmark-quality-summary.json").write_text(
+        json.dumps(
+            {
+                "regression_gates": [
+                    {"framework": "modkit", "against": "baseline_framework", "metric": "latency_ms_p95",
+                     "verdict": "fail", "alpha": 0.05, "min_effect_percent": 20.0, "p_value": 0.01},
+                    {"framework": "modkit", "against": "reference", "reference": {"run_id": "r1"},
+                     "metric": "ns_per_op", "verdict": "underpowered", "alpha": 0.05},
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    out_dir = tmp_path / "export"
+    counts = export_results([raw_dir], out_dir, ["jsonl", "csv"])
+    run_count = len(json.loads((raw_dir / "modkit.json").read_text(encoding="utf-8"))["benchmark"]["run_stats"])
+    assert counts == {"targets": 2, "runs": run_count, "gates": 2}
+
+    targets = [json.loads(line) for line in (out_dir / "targets.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert list(targets[0]) == list(TARGET_COLUMNS)
+    modkit = targets[0]
+    assert modkit["framework"] == "modkit"
+    assert modkit["git_commit"] == "abc"
+    assert modkit["rps"] == 600.0
+    assert modkit["rps_ci_lower"] <= modkit["rps"] <= modkit["rps_ci_upper"]
+    assert (modkit["gates_failed"], modkit["gates_underpowered"]) == (1, 1)
+    assert targets[1]["status"] == "skipped"
+    assert targets[1]["rps"] is None
+
+    with (out_dir / "runs.csv").open(encoding="utf-8", newline="") as handle:
+        runs = list(csv.DictReader(handle))
+    assert list(runs[0]) == list(RUN_COLUMNS)
+    assert runs[0]["framework"] == "modkit"
+    assert runs[0]["excluded"] == "False"
+
+    gates = [json.loads(line) for line in (out_dir / "gates.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert gates[1]["reference_run_id"] == "r1"
+
+    with pytest.raises(SystemExit, match="Unknown export format"):
+        export_results([raw_dir], out_dir, ["xlsx"])
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import argparse
+import json
+
+from .script_loader import load_script_module
+
+
+def write_run(raw_dir, manifest_path, commit, generated_at, rps):
+    raw_dir.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "schema_version": "raw-v1",
+        "framework": "modkit",
+        "status": "ok",
+        "benchmark": {
+            "run_stats": [{"rps": rps, "error_rate": 0.0}],
+            "median": {"rps": rps, "latency_ms_p50": 1.0, "latency_ms_p95": 2.0, "latency_ms_p99": 3.0},
+        },
+    }
+    (raw_dir / "modkit.json").write_text(json.dumps(payload), encoding="utf-8")
+    (raw_dir / "nestjs.json").write_text(
+        json.dumps({"framework": "nestjs", "status": "skipped", "reason": "target health unavailable"}),
+        encoding="utf-8",
+    )
+    manifest = {"generated_at": generated_at, "fingerprint": {"git": {"commit": commit, "branch": "main"}}}
+    manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+
+
+def test_history_ingest_query_and_change_points(repo_root, tmp_path, capsys):
+    mod = load_script_module(repo_root, "scripts/benchmark-history.py", "benchmark_history_cli")
+
+    db = tmp_path / "history.sqlite"
+    raw_dir = tmp_path / "raw"
+    manifest = tmp_path / "manifest.json"
+    series = [1000, 1004, 998, 1002, 1001, 999, 1003, 900, 903, 898, 901, 899, 902]
+    for index, rps in enumerate(series):
+        write_run(raw_dir, manifest, f"{index:040x}", f"2026-01-{index + 1:02d}T00:00:00+00:00", rps)
+        args = argparse.Namespace(
+            db=db, raw_dir=raw_dir, summary_file=None, manifest_file=manifest, run_id=None, accept=False
+        )
+        mod.ingest(args)
+    mod.ingest(args)
+
+    query_args = argparse.Namespace(db=db, framework="modkit", metric="rps", limit=None, json=True)
+    capsys.readouterr()
+    rows = mod.query(query_args)
+    assert [row["value"] for row in rows] == series
+    assert rows[0]["run_id"] == "20260101T000000-000000000000"
+    assert mod.query(argparse.Namespace(db=db, framework=None, metric="rps", limit=1, json=True))[0][
+        "successful"
+    ] == 1
+
+    mod.RESULTS_ROOT = tmp_path
+    report = mod.changepoints(
+        argparse.Namespace(
+            db=db,
+            frameworks=None,
+            metrics="rps,error_rate",
+            limit=None,
+            policy_file=tmp_path / "missing-policy.json",
+            out=tmp_path / "changepoints.json",
+        )
+    )
+    by_metric = {item["metric"]: item["change_points"] for item in report["series"]}
+    assert by_metric["error_rate"] == []
+    [shift] = by_metric["rps"]
+    assert shift["index"] == 7
+    assert shift["git_commit"] == f"{7:040x}"
+    assert shift["change_percent"] < -9
+    assert json.loads((tmp_path / "changepoints.json").read_text(encoding="utf-8"))["series"]
@@ -1,5 +1,14 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
 from .script_loader import load_script_module
 
 
@@ -21,3 +30,591 @@ def test_coefficient_of_variation_and_iqr(repo_root):
     assert outlier_indexes == {3}
     assert lower is not None
     assert upper is not None
+
+
+def test_resource_probe_reads_cgroup_counters(tmp_path):
+    from benchlib.measurement import ResourceProbe, resource_fields
+
+    cgroup = tmp_path / "system.slice" / "docker-abc123.scope"
+    cgroup.mkdir(parents=True)
+    (cgroup / "cpu.stat").write_text("usage_usec 1000000\nuser_usec 800000\n", encoding="utf-8")
+    probe = ResourceProbe("modkit", cgroup_root=tmp_path, container_id="abc123")
+    assert probe.anon_memory_bytes() is None
+
+    (cgroup / "memory.stat").write_text(f"anon {48 * 1024 * 1024}\nfile 81920\n", encoding="utf-8")
+    before = probe.sample()
+    (cgroup / "cpu.stat").write_text("usage_usec 1600000\n", encoding="utf-8")
+    fields = resource_fields(before, probe.sample(), completed_requests=300)
+    assert fields == {"memory_peak_mb": 48.0, "memory_source": "cgroup_anon", "cpu_ms_per_request": 2.0}
+
+    # A writable memory.peak stands in for a 6.12+ kernel: the lifetime peak is reset at
+    # the start of the run, and the run reports only the peak reached after that.
+    (cgroup / "memory.peak").write_text(str(512 * 1024 * 1024) + "\n", encoding="utf-8")
+    before = probe.sample()
+    assert before["memory_source"] == "cgroup_anon"
+    assert (cgroup / "memory.peak").read_text(encoding="utf-8").startswith("reset")
+    (cgroup / "memory.peak").write_text(str(64 * 1024 * 1024) + "\n", encoding="utf-8")
+    (cgroup / "cpu.stat").write_text("usage_usec 2200000\n", encoding="utf-8")
+    fields = resource_fields(before, probe.sample(), completed_requests=300)
+    assert fields == {"memory_peak_mb": 64.0, "memory_source": "cgroup_peak_reset", "cpu_ms_per_request": 2.0}
+
+    assert ResourceProbe("modkit", cgroup_root=tmp_path, container_id="missing").sample() is None
+    assert resource_fields(None, None, 300) == {}
+
+
+def test_soak_windows_sample_anonymous_cgroup_memory_between_windows(tmp_path, monkeypatch):
+    from benchlib import soak
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, *args):
+            pass
+
+    class FakeProbe:
+        def __init__(self, value, delay=0.0):
+            self.value = value
+            self.delay = delay
+
+        def anon_memory_bytes(self):
+            time.sleep(self.delay)
+            return self.value
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/health"
+    try:
+        monkeypatch.setattr(soak, "collect_docker_stats", lambda framework: pytest.fail("cgroup memory is available"))
+        windows = soak.run_soak(url, "modkit", tmp_path / "anon.jsonl", 0.3, 0.1, 2, probe=FakeProbe(96 * 1024 * 1024))
+        slow = soak.run_soak(url, "modkit", tmp_path / "slow.jsonl", 0.4, 0.1, 2, probe=FakeProbe(1024, delay=0.05))
+        monkeypatch.setattr(soak, "collect_docker_stats", lambda framework: {"memory": "128MiB / 1GiB"})
+        fallback = soak.run_soak(url, "modkit", tmp_path / "stats.jsonl", 0.2, 0.1, 1, probe=FakeProbe(None))
+    finally:
+        server.shutdown()
+
+    header, recorded = soak.load_soak_windows(tmp_path / "anon.jsonl")
+    assert header["memory_source"] == "cgroup_anon"
+    assert recorded == windows and len(windows) == 3
+    assert {window["memory_mb"] for window in windows} == {96.0}
+    assert all(window["requests"] > 0 for window in windows)
+    assert soak.load_soak_windows(tmp_path / "stats.jsonl")[0]["memory_source"] == "docker_stats_usage"
+    # Each window opens when the previous one is drained, so time spent reading memory
+    # belongs to the next window and the windows tile the run without gaps.
+    for previous, window in zip(slow, slow[1:]):
+        assert window["elapsed_seconds"] - previous["elapsed_seconds"] == pytest.approx(window["window_seconds"])
+    assert {window["memory_mb"] for window in fallback} == {128.0}
+
+
+def test_outlier_policy_reports_small_sample_outliers_and_reproduces(repo_root, monkeypatch):
+    from benchlib import measurement
+    from benchlib.outliers import resolve_outlier_policy, select_outliers
+
+    monkeypatch.setattr(measurement, "collect_docker_stats", lambda framework: {})
+    run_stats = [
+        {"requests": 300, "rps": 1000.0, "latency_ms_p50": 1.0, "latency_ms_p95": 2.0, "latency_ms_p99": 3.0},
+        {"requests": 300, "rps": 1010.0, "latency_ms_p50": 1.0, "latency_ms_p95": 2.1, "latency_ms_p99": 3.0},
+        {"requests": 300, "rps": 400.0, "latency_ms_p50": 1.0, "latency_ms_p95": 2.0, "latency_ms_p99": 3.0,
+         "hampel_flagged_requests": 45},
+    ]
+    policy = measurement.load_policy(repo_root)
+    payload = measurement.build_result_payload(
+        "modkit", "http://localhost:3001", "/health", 0, 300, 3, run_stats, None, {}, "legacy", policy
+    )
+
+    quality = payload["benchmark"]["quality"]
+    assert quality["policy"]["outlier_method"] == "modified_z_3.5"
+    assert [(item["run_index"], item["reasons"]) for item in quality["excluded_samples"]] == [
+        (2, ["hampel_spike_burst"])
+    ]
+    assert quality["suspected_outliers"] == [{"run_index": 2, "reasons": ["rps_outlier"]}]
+    assert quality["effective_runs"] == 2
+
+    replay = select_outliers(payload["benchmark"]["run_stats"], resolve_outlier_policy(quality["policy"]))
+    assert replay["excluded"] == {2: ["hampel_spike_burst"]}
+    assert replay["suspected"] == {2: ["rps_outlier"]}
+
+    five = [dict(run_stats[0], rps=rps) for rps in (1000.0, 1010.0, 1005.0, 995.0)] + [run_stats[2]]
+    assert select_outliers(five, resolve_outlier_policy(quality["policy"]))["excluded"] == {
+        4: ["rps_outlier", "hampel_spike_burst"]
+    }
+
+
+def test_outlier_policy_never_excludes_pure_noise_at_three_runs():
+    import random
+
+    from benchlib.outliers import resolve_outlier_policy, select_outliers
+
+    rng = random.Random(7)
+    policy = resolve_outlier_policy({})
+    for _ in range(2000):
+        run_stats = [
+            {"requests": 300, "rps": rng.gauss(1000.0, 50.0), "latency_ms_p95": rng.gauss(2.0, 0.1)} for _ in range(3)
+        ]
+        assert select_outliers(run_stats, policy)["excluded"] == {}
+
+
+def test_outlier_methods(repo_root):
+    from benchlib.outliers import hampel_outliers, method_for, modified_z_outliers, resolve_outlier_policy
+
+    indexes, lower, upper = modified_z_outliers([100.0, 101.0, 99.0, 100.0, 200.0])
+    assert indexes == {4}
+    assert lower < 100.0 < upper
+    assert modified_z_outliers([5.0, 5.0, 5.0])[0] == set()
+
+    series = [1.0, 1.1, 0.9, 1.0, 9.0, 1.0, 1.1, 0.9, 1.0, 1.05]
+    assert hampel_outliers(series, half_window=3, threshold=3.0) == [4]
+
+    policy = resolve_outlier_policy({"outliers": {"hampel": {"enabled": False}}})
+    assert policy["hampel"]["half_window"] == 5
+    assert method_for(policy, 3) == "modified_z"
+    assert method_for(policy, 8) == "tukey"
+
+
+def test_measure_legacy_writes_request_sidecar(monkeypatch, tmp_path):
+    from benchlib import measurement
+    from benchlib.samples import SampleFile, SampleWriter
+
+    calls = iter(range(1000))
+
+    def fake_request(url, sampler=None, method="GET", body=None):
+        index = next(calls)
+        return 1_000_000_000 + index * 1_000, 0.001, 503 if index == 5 else 200, 64
+
+    monkeypatch.setattr(measurement, "request_sample", fake_request)
+    writer = SampleWriter(tmp_path / "modkit.samples.bin")
+    run_stats, _ = measurement.measure_legacy("http://x/health", 0, 10, 2, sample_writer=writer)
+    reference = writer.close()
+
+    assert run_stats[0]["errors"] == 1
+    assert reference["records"] == 20
+    with SampleFile(tmp_path / "modkit.samples.bin") as samples:
+        assert samples.record(5)["status"] == 503
+        assert samples.record(15)["run_index"] == 1
+        assert set(samples.latencies_ns()) == {1_000_000}
+
+
+def test_load_parity_matchers_follow_parity_runner(repo_root):
+    from benchlib.load_parity import check_response, compare_value, match_string
+
+    assert match_string("@any_number", 42) and not match_string("@any_number", True)
+    assert match_string("@is_iso8601", "2025-01-01T00:00:00.000Z")
+    assert not match_string("@is_iso8601", "2025-01-01")
+    assert match_string("/users/@any_number", "/users/17")
+    assert not match_string("/users/@any_number", "/users/abc")
+
+    expected = {"id": "@any_number", "tags": ["a"], "createdAt": "@is_iso8601", "active": True}
+    assert compare_value(expected, {"id": 3, "tags": ["a"], "createdAt": "2025-01-01T00:00:00Z", "active": True,
+                                    "extra": 1}) is None
+    assert compare_value(expected, {"id": 3, "tags": ["a", "b"], "createdAt": "x", "active": True}) == (
+        "tags.array length 2 != 1"
+    )
+    response = {"status": 201, "headers": {"Location": "/users/@any_number"}, "body": {"id": "@any_number"}}
+    assert check_response(response, 201, {"Location": "/users/4"}, b'{"id": 4}') is None
+    assert check_response(response, 201, {}, b'{"id": 4}') == "missing header Location"
+    assert check_response(response, 200, {}, b"") == "status 200 != 201"
+
+
+def test_measure_target_skips_when_sampled_responses_break_parity(repo_root, tmp_path):
+    from benchlib import measurement
+
+    scenarios = tmp_path / "fixtures" / "scenarios"
+    scenarios.mkdir(parents=True)
+    scenario = {"name": "Health", "request": {"path": "/health"}, "response": {"status": 200, "body": {"status": "ok"}}}
+    (scenarios / "health.json").write_text(json.dumps([scenario]), encoding="utf-8")
+    served = iter(range(10_000))
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            with lock:
+                index = next(served)
+            body = b'{"status": "degraded"}' if index % 4 == 3 else b'{"status": "ok"}'
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    target = f"http://127.0.0.1:{server.server_address[1]}"
+
+    def measure(fraction, max_rate):
+        policy = {"quality": {"parity_under_load": {"sample_fraction": fraction, "max_mismatch_rate": max_rate}}}
+        return measurement.measure_target(
+            tmp_path, "modkit", target, "/health", 0, 40, 2, "passed", "legacy",
+            policy=policy, concurrency=4, parity_fixtures="fixtures", seed_endpoint="",
+        )
+
+    try:
+        failed = measure(1.0, 0.0)
+        tolerated = measure(0.5, 1.0)
+        unmatched = measurement.measure_target(
+            tmp_path, "modkit", target, "/users", 0, 10, 1, "passed", "legacy",
+            policy={}, parity_fixtures="fixtures", seed_endpoint="",
+        )
+    finally:
+        server.shutdown()
+
+    assert failed["status"] == "skipped"
+    assert failed["reason"] == "parity failed under load"
+    assert failed["parity_under_load"]["checked"] == 80
+    assert failed["parity_under_load"]["mismatches"] == 20
+    assert failed["parity_under_load"]["examples"][0]["problem"] == "body mismatch: status.string mismatch: expected ok"
+
+    assert tolerated["status"] == "ok"
+    assert tolerated["parity_under_load"]["checked"] == 40
+    assert tolerated["parity_under_load"]["sample_fraction"] == 0.5
+    assert "parity_under_load" not in unmatched
+
+
+def test_dataset_seed_streams_deterministic_users_in_chunks(repo_root, tmp_path):
+    from benchlib import measurement
+    from benchlib.dataset import iter_seed_body, seed_dataset, synthetic_user
+
+    fixtures = repo_root / "test" / "fixtures" / "parity"
+    received = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+                if not size:
+                    break
+            received.update(encoding=self.headers["Transfer-Encoding"], chunks=len(chunks), body=b"".join(chunks))
+            self.send_response(204 if self.path == "/debug/parity/seed" else 404)
+            self.end_headers()
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    target = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        record = seed_dataset(target, "/debug/parity/seed", 12_000, 7, fixtures)
+        body = received["body"]
+        rejected = seed_dataset(target, "/missing", 10_000, 7, fixtures)
+        payload = measurement.measure_target(
+            tmp_path, "modkit", target, "/health", 0, 5, 1, "passed", "legacy",
+            policy={}, parity_fixtures=str(fixtures), dataset_size=10_000, dataset_seed=3,
+        )
+    finally:
+        server.shutdown()
+
+    users = json.loads(body)["users"]
+    assert received["encoding"] == "chunked" and received["chunks"] > 2
+    assert len(users) == 12_000
+    assert users[0]["name"] == "Alice Example"
+    assert users[3] == synthetic_user(4, 7) and users[-1]["id"] == 12_000
+    assert record["sha256"] == hashlib.sha256(b"".join(iter_seed_body(12_000, 7, users[:3]))).hexdigest()
+    assert record["bytes"] == len(body)
+    assert (record["users"], record["seed"], record["fixture_users"]) == (12_000, 7, 3)
+    assert synthetic_user(4, 7) != synthetic_user(4, 8)
+
+    assert "404" in rejected["error"]
+    assert payload["status"] == "ok"
+    assert payload["dataset"]["users"] == 10_000 and payload["dataset"]["seed"] == 3
+
+    with pytest.raises(SystemExit, match="between 10000 and 10000000"):
+        seed_dataset(target, "/debug/parity/seed", 500, 7, fixtures)
+
+
+def test_dataset_runs_sample_parity_only_where_the_dataset_keeps_the_fixture_response(repo_root, tmp_path):
+    from benchlib import measurement
+    from benchlib.dataset import dataset_keeps_response, fixture_users, synthetic_user
+
+    fixtures = repo_root / "test" / "fixtures" / "parity"
+    users = fixture_users(fixtures)
+    seeded = users + [synthetic_user(4, 1)]
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                self.rfile.read(size + 2)
+                if not size:
+                    break
+            self.send_response(204)
+            self.end_headers()
+
+        def do_GET(self):
+            body = json.dumps(seeded if self.path == "/users" else seeded[0]).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    target = f"http://127.0.0.1:{server.server_address[1]}"
+    policy = {"quality": {"parity_under_load": {"sample_fraction": 1.0, "max_mismatch_rate": 0.0}}}
+
+    def measure(endpoint):
+        return measurement.measure_target(
+            tmp_path, "modkit", target, endpoint, 0, 10, 1, "passed", "legacy",
+            policy=policy, parity_fixtures=str(fixtures), dataset_size=10_000,
+        )
+
+    try:
+        collection = measure("/users")
+        member = measure("/users/1")
+    finally:
+        server.shutdown()
+
+    assert collection["status"] == "ok"
+    assert "parity_under_load" not in collection
+    assert member["status"] == "ok"
+    assert member["parity_under_load"]["checked"] == 10
+    assert member["parity_under_load"]["mismatches"] == 0
+    assert [dataset_keeps_response(path, users) for path in ("/users/3", "/users/999", "/users/", "/health")] == [
+        True, False, False, True
+    ]
+
+
+def test_key_distributions_are_deterministic_and_skewed():
+    from collections import Counter
+
+    from benchlib.keys import KeyedEndpoint, key_sequence, parse_key_distribution
+
+    zipf = parse_key_distribution("zipf:s=1.0,seed=3")
+    assert zipf == {"name": "zipf", "params": {"seed": 3, "s": 1.0}}
+    keys = key_sequence(zipf, 1_000, 50_000)
+    assert keys.typecode == "L" and keys == key_sequence(zipf, 1_000, 50_000)
+    assert min(keys) >= 1 and max(keys) <= 1_000
+    ranked = [count for _, count in Counter(keys).most_common()]
+    # Zipf with s=1: the hottest key is drawn about twice as often as the second, three times the third.
+    assert 1.7 < ranked[0] / ranked[1] < 2.3
+    assert 2.5 < ranked[0] / ranked[2] < 3.5
+
+    hotset = key_sequence(parse_key_distribution("hotset:hot_fraction=0.1,hot_share=0.8"), 500, 20_000)
+    hot_share = sum(count for _, count in Counter(hotset).most_common(50)) / len(hotset)
+    assert 0.77 < hot_share < 0.83
+
+    uniform = key_sequence(parse_key_distribution("uniform"), 3, 3_000)
+    assert set(uniform) == {1, 2, 3}
+
+    endpoint = KeyedEndpoint("http://x/", "/users/{id}", zipf, 1_000, 4)
+    urls = [endpoint.next_url() for _ in range(5)]
+    assert urls[0].startswith("http://x/users/") and urls[4] == urls[0]
+    assert endpoint.describe()["sequence_length"] == 4
+
+    with pytest.raises(SystemExit, match="Unknown key distribution"):
+        parse_key_distribution("pareto")
+    with pytest.raises(SystemExit, match="no parameter"):
+        parse_key_distribution("uniform:s=2")
+
+
+def test_measure_target_expands_endpoint_template_from_key_sequence(repo_root, tmp_path):
+    from benchlib import measurement
+
+    seen = []
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            with lock:
+                seen.append(self.path)
+            body = b'{"id": 1}'
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        payload = measurement.measure_target(
+            repo_root, "modkit", f"http://127.0.0.1:{server.server_address[1]}", "/users/{id}", 5, 20, 2, "passed",
+            "legacy", policy={}, concurrency=2, key_distribution="hotset:hot_fraction=0.34,hot_share=1,seed=9",
+        )
+    finally:
+        server.shutdown()
+
+    described = payload["benchmark"]["key_distribution"]
+    assert described["key_count"] == 3 and described["sequence_length"] == 45
+    assert described["distribution"] == "hotset" and described["params"]["seed"] == 9
+    assert described["hottest_key_share"] == 1.0
+    assert set(seen) == {f"/users/{described['hottest_key']}"}
+    assert len(seen) == 45
+
+
+def test_payload_sizes_produce_exact_user_bodies():
+    from benchlib.payloads import UserBodies, parse_payload_size, resolve_payload, user_body
+
+    assert [parse_payload_size(value) for value in ("100B", "1KB", "16KB", "256KB", 512)] == [
+        100, 1024, 16 * 1024, 256 * 1024, 512,
+    ]
+    for size in (len(user_body(None)), 100, 1024, 256 * 1024):
+        body = user_body(size)
+        assert len(body) == size and set(json.loads(body)) == {"name", "email"}
+    assert resolve_payload("get", None) == ("GET", None)
+    assert resolve_payload("put", "1KB")[0] == "PUT" and len(resolve_payload("put", "1KB")[1]) == 1024
+
+    bodies = UserBodies(1024)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        generated = list(pool.map(lambda _: bodies.next_body(), range(400)))
+    assert {len(body) for body in generated} == {1024}
+    emails = [json.loads(body)["email"] for body in generated]
+    assert len(set(emails)) == 400 and "payload.user.0000000399@example.com" in emails
+
+    with pytest.raises(SystemExit, match="between"):
+        parse_payload_size("2MB")
+    with pytest.raises(SystemExit, match="size like"):
+        parse_payload_size("1GB")
+    with pytest.raises(SystemExit, match="needs BENCHMARK_METHOD"):
+        resolve_payload("GET", "1KB")
+
+
+def test_measure_target_posts_sized_bodies_and_reports_byte_rates(repo_root, tmp_path):
+    from benchlib import measurement
+
+    received = []
+    emails = []
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            with lock:
+                received.append((self.headers["Content-Type"], len(body)))
+                emails.append(json.loads(body)["email"])
+            reply = b'{"id": 7}'
+            self.send_response(201)
+            self.send_header("Content-Length", str(len(reply)))
+            self.end_headers()
+            self.wfile.write(reply)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        payload = measurement.measure_target(
+            repo_root, "modkit", f"http://127.0.0.1:{server.server_address[1]}", "/users", 2, 10, 2, "passed",
+            "legacy", policy={}, method="POST", payload_size="1KB",
+        )
+    finally:
+        server.shutdown()
+
+    assert payload["status"] == "ok"
+    assert payload["benchmark"]["payload"] == {"method": "POST", "bytes": 1024, "content_type": "application/json"}
+    assert set(received) == {("application/json", 1024)} and len(received) == 22
+    assert len(set(emails)) == 22
+    for run in payload["benchmark"]["run_stats"]:
+        assert run["request_bytes_per_second"] == pytest.approx(run["rps"] * 1024)
+        assert run["response_bytes_per_second"] == pytest.approx(run["rps"] * 9)
+    assert payload["benchmark"]["median"]["request_bytes_per_second"] > 0
+
+
+def test_session_scripts_bind_captures_before_use():
+    from benchlib.sessions import normalize_session_script, render
+
+    script = normalize_session_script({"steps": [
+        {"method": "post", "path": "/users", "expect_status": 201, "capture": {"id": "body.id"}},
+        {"path": "/users/{id}", "expect_status": 200},
+    ]})
+    assert [step["name"] for step in script["steps"]] == ["step1", "step2"]
+    assert script["steps"][0]["method"] == "POST"
+    assert render({"email": ["u{vu}.{iteration}@x"]}, {"vu": 2, "iteration": 7}) == {"email": ["u2.7@x"]}
+
+    with pytest.raises(SystemExit, match="uses id before any step captures it"):
+        normalize_session_script({"steps": [{"path": "/users/{id}", "expect_status": 200}]})
+    with pytest.raises(SystemExit, match="body.<field> or header.<Name>"):
+        normalize_session_script({"steps": [{"path": "/users", "expect_status": 201, "capture": {"id": "json"}}]})
+
+
+def test_measure_target_runs_crud_sessions_with_captured_ids(repo_root):
+    from benchlib import measurement
+
+    users = {}
+    lock = threading.Lock()
+    next_id = iter(range(100, 10_000))
+
+    class Handler(BaseHTTPRequestHandler):
+        def reply(self, status, document=None, headers=()):
+            body = b"" if document is None else json.dumps(document).encode("utf-8")
+            self.send_response(status)
+            for name, value in headers:
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def user_id(self):
+            return int(self.path.rsplit("/", 1)[1])
+
+        def do_POST(self):
+            document = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            with lock:
+                user = {"id": next(next_id), **document}
+                users[user["id"]] = user
+            self.reply(201, user, [("Location", f"/users/{user['id']}")])
+
+        def do_GET(self):
+            with lock:
+                user = users.get(self.user_id())
+            self.reply(200, user) if user else self.reply(404)
+
+        def do_PUT(self):
+            document = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            with lock:
+                found = self.user_id() in users
+                if found:
+                    users[self.user_id()].update(document)
+            self.reply(200, users.get(self.user_id())) if found else self.reply(404)
+
+        def do_DELETE(self):
+            with lock:
+                found = users.pop(self.user_id(), None) is not None
+            self.reply(204 if found else 404)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        payload = measurement.measure_target(
+            repo_root, "modkit", f"http://127.0.0.1:{server.server_address[1]}", "/health", 2, 12, 2, "passed",
+            "legacy", policy={}, concurrency=4, parity_fixtures=None, session_script="sessions/crud.json",
+        )
+    finally:
+        server.shutdown()
+
+    assert payload["status"] == "ok" and users == {}
+    bench = payload["benchmark"]
+    assert bench["endpoint"] == "session:crud"
+    sessions = bench["sessions"]
+    assert sessions["virtual_users"] == 4 and sessions["script_file"] == "sessions/crud.json"
+    assert sessions["session"]["completed"] == 24 and sessions["session"]["failures"] == 0
+    assert [(step["name"], step["requests"], step["failures"]) for step in sessions["steps"]] == [
+        ("create", 24, 0), ("read", 24, 0), ("update", 24, 0), ("delete", 24, 0),
+    ]
+    slowest_step = max(step["latency_ms"]["p50"] for step in sessions["steps"])
+    assert sessions["session"]["latency_ms"]["p50"] >= slowest_step
+    for run in bench["run_stats"]:
+        assert run["requests"] == 48 and run["errors"] == 0 and run["sessions_completed"] == 12
+        assert run["sessions_per_second"] > 0
@@ -0,0 +1,360 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+import pytest
+
+from .script_loader import load_script_module
+
+
+def test_parse_framework_list_defaults_and_rejects_unknown(repo_root):
+    mod = load_script_module(repo_root, "scripts/benchmark-orchestrate.py", "benchmark_orchestrate_frameworks")
+
+    assert mod.parse_framework_list("") == ["modkit", "nestjs", "baseline", "wire", "fx", "do"]
+    assert mod.parse_framework_list("wire, fx") == ["wire", "fx"]
+    with pytest.raises(SystemExit, match="Unknown framework"):
+        mod.parse_framework_list("modkit,unknown")
+
+
+def test_resolve_paths_rejects_raw_dir_outside_results(repo_root, tmp_path):
+    mod = load_script_module(repo_root, "scripts/benchmark-orchestrate.py", "benchmark_orchestrate_paths")
+
+    args = argparse.Namespace(raw_dir=tmp_path, results_dir=None, fingerprint_file=None, manifest_file=None)
+    with pytest.raises(SystemExit, match="must be under"):
+        mod.resolve_paths(args)
+
+
+def test_benchmark_framework_records_health_skip_without_parity(repo_root, tmp_path, monkeypatch):
+    mod = load_script_module(repo_root, "scripts/benchmark-orchestrate.py", "benchmark_orchestrate_skip")
+
+    monkeypatch.setattr(mod, "check_health", lambda target: False)
+
+    def parity_must_not_run(target):
+        raise AssertionError("parity should not run for unhealthy targets")
+
+    payload = mod.benchmark_framework("modkit", {}, parity_must_not_run, {}, tmp_path)
+
+    assert payload["status"] == "skipped"
+    written = json.loads((tmp_path / "modkit.json").read_text(encoding="utf-8"))
+    assert written == {
+        "schema_version": "raw-v1",
+        "framework": "modkit",
+        "target": "http://localhost:3001",
+        "status": "skipped",
+        "reason": "target health endpoint unavailable",
+    }
+
+
+def test_benchmark_framework_records_lifecycle_timestamps(repo_root, tmp_path):
+    mod = load_script_module(repo_root, "scripts/benchmark-orchestrate.py", "benchmark_orchestrate_lifecycle")
+
+    class FakeLifecycle:
+        def __init__(self):
+            self.stopped = []
+
+        def start(self, service, target):
+            return {"managed": True, "service": service, "container_started_at": "t0", "ready": False}
+
+        def stop(self, record):
+            self.stopped.append(record["service"])
+            record["container_stopped_at"] = "t1"
+            return record
+
+    lifecycle = FakeLifecycle()
+    payload = mod.benchmark_framework("wire", {}, None, {}, tmp_path, lifecycle=lifecycle)
+
+    assert lifecycle.stopped == ["wire"]
+    assert payload["reason"] == "target health endpoint unavailable"
+    assert payload["lifecycle"]["container_started_at"] == "t0"
+    assert payload["lifecycle"]["container_stopped_at"] == "t1"
+
+
+def test_wait_for_health_backs_off_until_ready(monkeypatch):
+    from benchlib import lifecycle
+
+    answers = iter([False, False, True])
+    monkeypatch.setattr(lifecycle, "check_health", lambda target: next(answers))
+    delays = []
+
+    ready, attempts = lifecycle.wait_for_health(
+        "http://localhost:3001",
+        timeout_seconds=10,
+        sleep=delays.append,
+        clock=lambda: 0.0,
+    )
+
+    assert ready is True
+    assert attempts == 3
+    assert delays == [0.1, 0.2]
+
+
+def test_result_cache_round_trip_marks_provenance(repo_root, fixture_root, tmp_path):
+    from benchlib.result_cache import ResultCache
+
+    policy_file = tmp_path / "policy.json"
+    policy_file.write_text("{}", encoding="utf-8")
+    fingerprint = {"generated_at": "now", "versions": {"go": "go1.25"}}
+    cache = ResultCache(tmp_path / "cache", policy_file, fingerprint, digest_fn=lambda root, service: "sha256:abc")
+
+    key = cache.key_for(repo_root, "modkit", {"runs": 3})
+    assert cache.load(key) is None
+
+    payload = json.loads((fixture_root / "raw" / "modkit-ok.json").read_text(encoding="utf-8"))
+    cache.store(key, payload)
+    assert payload["provenance"]["cached"] is False
+
+    cached = cache.load(key)
+    assert cached["provenance"]["cached"] is True
+    assert cached["provenance"]["measured_at"] == payload["provenance"]["measured_at"]
+    assert cached["benchmark"]["median"] == payload["benchmark"]["median"]
+
+    assert cache.key_for(repo_root, "modkit", {"runs": 5}) != key
+    missing_digest = ResultCache(tmp_path / "cache", policy_file, fingerprint, digest_fn=lambda root, service: None)
+    assert missing_digest.key_for(repo_root, "modkit", {"runs": 3}) is None
+
+
+def test_result_cache_misses_when_container_limits_change(repo_root, fixture_root, tmp_path, monkeypatch):
+    mod = load_script_module(repo_root, "scripts/benchmark-orchestrate.py", "benchmark_orchestrate_cache_limits")
+    from benchlib.result_cache import ResultCache
+
+    policy_file = tmp_path / "policy.json"
+    policy_file.write_text("{}", encoding="utf-8")
+    cache = ResultCache(tmp_path / "cache", policy_file, {}, digest_fn=lambda root, service: "sha256:abc")
+    monkeypatch.delenv("BENCHMARK_CPU_LIMIT", raising=False)
+    monkeypatch.delenv("BENCHMARK_MEMORY_LIMIT", raising=False)
+    monkeypatch.setattr(sys, "argv", ["benchmark-orchestrate.py", "run"])
+    args = mod.parse_args()
+
+    workload = mod.workload_params(args)
+    assert (workload["cpu_limit"], workload["memory_limit"]) == ("1.00", "1024m")
+    key = cache.key_for(repo_root, "modkit", workload)
+    cache.store(key, json.loads((fixture_root / "raw" / "modkit-ok.json").read_text(encoding="utf-8")))
+
+    monkeypatch.setenv("BENCHMARK_CPU_LIMIT", "2.00")
+    cpu_key = cache.key_for(repo_root, "modkit", mod.workload_params(args))
+    monkeypatch.setenv("BENCHMARK_CPU_LIMIT", "1.00")
+    monkeypatch.setenv("BENCHMARK_MEMORY_LIMIT", "512m")
+    memory_key = cache.key_for(repo_root, "modkit", mod.workload_params(args))
+
+    assert cache.load(key) is not None
+    assert cpu_key != key and cache.load(cpu_key) is None
+    assert memory_key not in (key, cpu_key) and cache.load(memory_key) is None
+
+
+def test_benchmark_framework_reuses_cached_artifact(repo_root, tmp_path, monkeypatch):
+    mod = load_script_module(repo_root, "scripts/benchmark-orchestrate.py", "benchmark_orchestrate_cache")
+
+    monkeypatch.setattr(mod, "check_health", lambda target: pytest.fail("cached targets must not be probed"))
+    cached_payload = {
+        "schema_version": "raw-v1",
+        "framework": "fx",
+        "target": "http://localhost:3005",
+        "status": "skipped",
+        "reason": "cached",
+        "provenance": {"cached": True, "measured_at": "2026-01-01T00:00:00+00:00"},
+    }
+
+    class FakeCache:
+        def key_for(self, root, framework, workload):
+            return "key"
+
+        def load(self, key):
+            return cached_payload
+
+    payload = mod.benchmark_framework("fx", {}, None, {}, tmp_path, result_cache=FakeCache())
+
+    assert payload is cached_payload
+    assert json.loads((tmp_path / "fx.json").read_text(encoding="utf-8"))["provenance"]["cached"] is True
+
+
+def test_sweep_cells_are_keyed_and_resumable(tmp_path):
+    from benchlib import sweep
+
+    spec = sweep.normalize_sweep_spec(
+        {
+            "name": "smoke",
+            "frameworks": ["modkit", "wire"],
+            "endpoints": ["/health", "/users/1"],
+            "concurrency": [1, 4],
+            "cpu_limits": ["1.00"],
+        }
+    )
+    cells = list(sweep.iter_cells(spec))
+    assert len(cells) == 8
+    assert cells[0]["cell_id"] == "modkit__health__c1__cpu1-00__mem1024m"
+    assert len({cell["cell_id"] for cell in cells}) == len(cells)
+
+    done = cells[0]
+    sweep.write_cell_artifact(tmp_path, done, {"status": "ok", "benchmark": {"median": {"rps": 100.0}}})
+    assert sweep.is_cell_complete(tmp_path, done)
+    assert not sweep.is_cell_complete(tmp_path, cells[1])
+
+    summary = sweep.build_matrix_summary(tmp_path, spec)
+    assert summary["total_cells"] == 8
+    assert summary["completed_cells"] == 1
+    assert summary["cells"][0]["rps"] == 100.0
+    assert summary["cells"][1]["status"] == "pending"
+
+    for change in ({"runs": 5}, {"warmup_requests": 10}, {"benchmark_requests": 50}):
+        edited = {**spec, "workload": {**spec["workload"], **change}}
+        stale = next(sweep.iter_cells(edited))
+        assert stale["cell_id"] == done["cell_id"]
+        assert not sweep.is_cell_complete(tmp_path, stale)
+        assert sweep.build_matrix_summary(tmp_path, edited)["cells"][0]["status"] == "pending"
+
+
+def test_dataset_sizes_are_a_sweep_dimension(tmp_path):
+    from benchlib import sweep
+
+    spec = sweep.normalize_sweep_spec({"name": "scale", "frameworks": ["modkit"], "dataset_sizes": [None, 100_000]})
+    cells = list(sweep.iter_cells(spec))
+    assert [cell["cell_id"] for cell in cells] == [
+        "modkit__health__c1__cpu1-00__mem1024m",
+        "modkit__health__c1__n100000__cpu1-00__mem1024m",
+    ]
+    assert sweep.build_matrix_summary(tmp_path, spec)["dimensions"]["dataset_sizes"] == [None, 100_000]
+
+    with pytest.raises(SystemExit, match="Dataset size"):
+        sweep.normalize_sweep_spec({"dataset_sizes": [20_000_000]})
+
+
+def test_payload_sizes_are_a_sweep_dimension(tmp_path):
+    from benchlib import sweep
+
+    spec = sweep.normalize_sweep_spec({
+        "name": "bodies", "frameworks": ["modkit"], "endpoints": ["/users"], "payload_sizes": ["100B", "1KB"],
+        "workload": {"method": "POST"},
+    })
+    assert [cell["cell_id"] for cell in sweep.iter_cells(spec)] == [
+        "modkit__users__c1__p100__cpu1-00__mem1024m",
+        "modkit__users__c1__p1024__cpu1-00__mem1024m",
+    ]
+    assert spec["payload_sizes"] == [100, 1024]
+
+    with pytest.raises(SystemExit, match="workload.method POST or PUT"):
+        sweep.normalize_sweep_spec({"payload_sizes": ["1KB"]})
+
+
+def test_sweep_spec_rejects_invalid_values():
+    from benchlib import sweep
+
+    with pytest.raises(SystemExit, match="absolute paths"):
+        sweep.normalize_sweep_spec({"endpoints": ["health"]})
+    with pytest.raises(SystemExit, match="duplicate"):
+        sweep.normalize_sweep_spec({"concurrency": [2, 2]})
+    with pytest.raises(SystemExit, match="simple path segment"):
+        sweep.normalize_sweep_spec({"name": "../escape"})
+
+
+def test_skipped_sweep_cells_are_retried_on_resume(tmp_path):
+    from benchlib import sweep
+
+    spec = sweep.normalize_sweep_spec({"name": "retry", "frameworks": ["fx"]})
+    (cell,) = list(sweep.iter_cells(spec))
+    sweep.write_cell_artifact(tmp_path, cell, {"status": "skipped", "reason": "target health endpoint unavailable"})
+
+    assert not sweep.is_cell_complete(tmp_path, cell)
+    summary = sweep.build_matrix_summary(tmp_path, spec)
+    assert summary["skipped_cells"] == 1
+    assert summary["cells"][0]["reason"] == "target health endpoint unavailable"
+
+
+def test_scaling_measures_each_cpu_step_and_writes_summary(repo_root, tmp_path, monkeypatch):
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    mod = load_script_module(repo_root, "scripts/benchmark-orchestrate.py", "benchmark_orchestrate_scaling")
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = b'{"status": "ok"}'
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            self.send_response(204)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    class FakeLifecycle:
+        started = []
+
+        def __init__(self, *args, env=None, **kwargs):
+            self.env = env or {}
+
+        def stop_all(self):
+            pass
+
+        def start(self, service, target):
+            FakeLifecycle.started.append(self.env.get("BENCHMARK_CPU_LIMIT"))
+            return {"managed": True, "service": service, "ready": True}
+
+        def stop(self, record):
+            return record
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(mod, "ContainerLifecycle", FakeLifecycle)
+    monkeypatch.setattr(mod, "ParityRunner", lambda args: (lambda target: True))
+    monkeypatch.setattr(mod, "load_policy", lambda root: {})
+    monkeypatch.setattr(mod, "resolve_target", lambda framework: f"http://127.0.0.1:{server.server_address[1]}")
+    monkeypatch.setattr(mod, "SCALING_DIR", tmp_path / "scaling")
+    monkeypatch.setattr(mod, "SCALING_SUMMARY_FILE", tmp_path / "scaling.json")
+    pinned = []
+    monkeypatch.setattr(mod.os, "sched_setaffinity", lambda pid, cpus: pinned.append((pid, cpus)))
+    args = argparse.Namespace(
+        frameworks="modkit", cpus="1,2", endpoint="/health", warmup_requests=1, benchmark_requests=5, runs=2,
+        base_concurrency=1, ready_timeout=1.0, drop_caches=False, client_cpus="0", client_saturation=0.9,
+    )
+    try:
+        mod.scaling(args)
+    finally:
+        server.shutdown()
+
+    assert FakeLifecycle.started == ["1.00", "2.00"]
+    step = json.loads((tmp_path / "scaling" / "modkit__cpu2.json").read_text(encoding="utf-8"))
+    assert step["status"] == "ok" and step["scaling_step"] == {"cpus": 2, "concurrency": 2}
+    assert step["benchmark"]["requests_per_run"] == 10
+    summary = json.loads((tmp_path / "scaling.json").read_text(encoding="utf-8"))
+    steps = summary["frameworks"]["modkit"]["steps"]
+    assert [entry["cpus"] for entry in steps] == [1, 2]
+    assert all(run["client_cpu_utilisation"] >= 0 for run in step["benchmark"]["run_stats"])
+    assert all("client_cpu_utilisation" in entry and "client_bound" in entry for entry in steps)
+    assert pinned == [(0, [0])]
+    assert summary["client_cpus"] == [0] and summary["client_saturation"] == 0.9
+
+
+def test_scaling_analysis_recovers_usl_coefficients():
+    from benchlib import scaling
+
+    assert scaling.parse_cpu_steps("1,2,4,N", cpu_count=8) == [1, 2, 4, 8]
+    with pytest.raises(SystemExit, match="must include 1"):
+        scaling.parse_cpu_steps("2,4")
+
+    measurements = {n: 500.0 * scaling.usl_capacity(n, 0.05, 0.002) for n in (1, 2, 4, 8, 16)}
+    analysis = scaling.analyze_scaling(measurements)
+
+    assert analysis["steps"][0] == {"cpus": 1, "rps": 500.0, "speedup": 1.0, "efficiency": 1.0}
+    assert analysis["steps"][-1]["efficiency"] < 1.0
+    assert analysis["usl"]["sigma"] == pytest.approx(0.05)
+    assert analysis["usl"]["kappa"] == pytest.approx(0.002)
+    assert analysis["amdahl"]["sigma"] > 0
+    assert scaling.analyze_scaling({2: 100.0}) is None
+
+    client = {1: 0.4, 2: 0.7, 4: 0.95, 8: 0.98, 16: 0.99}
+    bound = scaling.analyze_scaling(measurements, client)
+    assert [step["client_bound"] for step in bound["steps"]] == [False, False, True, True, True]
+    assert bound["usl"] is None and bound["amdahl"]["sigma"] == pytest.approx(
+        scaling.fit_amdahl([(1, 1.0), (2, analysis["steps"][1]["speedup"])])["sigma"]
+    )
+    assert scaling.analyze_scaling(measurements, {1: 0.93})["amdahl"] is None
+    assert scaling.parse_cpu_set("0-1, 6") == {0, 1, 6}
+    with pytest.raises(SystemExit, match="Invalid CPU list"):
+        scaling.parse_cpu_set("3-1")
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import argparse
+import json
+
 import pytest
 
 from .script_loader import load_script_module
@@ -18,3 +21,226 @@ def test_ensure_under_results_rejects_outside_path(repo_root, tmp_path):
 
     with pytest.raises(SystemExit, match="must be under"):
         mod.ensure_under_results(tmp_path / "outside.json", "Summary file")
+
+
+def write_soak_artifact(path, memory_step_mb, startup_windows=0):
+    rows = [{"type": "header", "schema_version": "soak-v1", "framework": "modkit", "window_seconds": 600}]
+    for index in range(12):
+        rows.append(
+            {
+                "type": "window",
+                "index": index,
+                "elapsed_seconds": (index + 1) * 600.0,
+                "requests": 6000,
+                "errors": 0,
+                "rps": 10.0,
+                "latency_ms_p95": 2.0,
+                "latency_ms_p99": 3.0,
+                "memory_mb": 100.0 + index * memory_step_mb + 200.0 * min(index, startup_windows),
+            }
+        )
+    path.write_text("\n".join(json.dumps(row) for row in rows) + "\n", encoding="utf-8")
+
+
+def test_check_soak_flags_memory_growth(repo_root, tmp_path, monkeypatch):
+    mod = load_script_module(repo_root, "scripts/benchmark-quality-check.py", "benchmark_quality_soak")
+
+    soak_dir = tmp_path / "soak"
+    soak_dir.mkdir()
+    write_soak_artifact(soak_dir / "modkit.jsonl", memory_step_mb=20.0)
+    summary_file = tmp_path / "soak-summary.json"
+    monkeypatch.setattr(mod, "ensure_under_results", lambda path, label: path)
+    args = argparse.Namespace(soak_dir=soak_dir, soak_summary_file=summary_file)
+    policy = {"quality": {"soak": {"min_windows": 6, "max_memory_growth_mb_per_hour": 50.0}}}
+
+    with pytest.raises(SystemExit, match="memory_growth_mb_per_hour=120.0000"):
+        mod.check_soak(args, policy)
+    summary = json.loads(summary_file.read_text(encoding="utf-8"))
+    assert summary["status"] == "failed"
+    assert summary["targets"][0]["trends"]["latency_ms_p95_drift_percent_per_hour"] == pytest.approx(0.0)
+
+    write_soak_artifact(soak_dir / "modkit.jsonl", memory_step_mb=0.0)
+    assert mod.check_soak(args, policy)["status"] == "passed"
+
+    # Allocator and pool growth over the first three windows is startup, not a leak.
+    write_soak_artifact(soak_dir / "modkit.jsonl", memory_step_mb=0.0, startup_windows=3)
+    with pytest.raises(SystemExit, match="memory_growth_mb_per_hour"):
+        mod.check_soak(args, policy)
+    policy["quality"]["soak"]["warmup_windows"] = 3
+    trends = mod.check_soak(args, policy)["targets"][0]["trends"]
+    assert trends["warmup_windows_excluded"] == 3 and trends["windows"] == 9
+    assert trends["memory_growth_mb_per_hour"] == pytest.approx(0.0)
+    policy["quality"]["soak"]["warmup_windows"] = 7
+    assert mod.check_soak(args, policy)["targets"][0]["status"] == "skipped"
+
+
+def write_raw_runs(raw_dir, framework, rps_values, p99_values):
+    runs = [
+        {"rps": rps, "latency_ms_p50": 1.0, "latency_ms_p95": 2.0, "latency_ms_p99": p99, "latency_ms_max": 5.0}
+        for rps, p99 in zip(rps_values, p99_values)
+    ]
+    payload = {"framework": framework, "status": "ok", "benchmark": {"run_stats": runs}}
+    (raw_dir / f"{framework}.json").write_text(json.dumps(payload), encoding="utf-8")
+
+
+def test_check_comparison_reports_every_metric_and_gates_throughput(repo_root, tmp_path, monkeypatch):
+    mod = load_script_module(repo_root, "scripts/benchmark-quality-check.py", "benchmark_quality_compare")
+
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    write_raw_runs(raw_dir, "baseline", [1000, 1010, 990, 1005, 995], [3.0, 3.1, 2.9, 3.02, 3.05])
+    write_raw_runs(raw_dir, "wire", [1002, 1008, 992, 1001, 996], [3.01, 3.12, 2.95, 3.0, 3.04])
+    summary_file = tmp_path / "comparison.json"
+    monkeypatch.setattr(mod, "ensure_under_results", lambda path, label: path)
+    args = argparse.Namespace(raw_dir=raw_dir, comparison_summary_file=summary_file)
+    policy = {"quality": {"comparison": {"alpha": 0.05, "gates": {"ns_per_op": {"min_effect_percent": 15.0}}}}}
+
+    summary = mod.check_comparison(args, policy)
+    metrics = summary["comparisons"][0]["metrics"]
+    assert set(metrics) == set(mod.COMPARISON_METRICS) - {"cpu_ms_per_request", "memory_peak_mb", "error_rate"}
+    assert metrics["rps"]["change"] == "no_significant_change"
+    assert summary["comparisons"][0]["gates"]["ns_per_op"]["verdict"] == "pass"
+    assert summary["status"] == "passed"
+
+    write_raw_runs(raw_dir, "wire", [500, 505, 495, 502, 498], [3.0, 3.1, 2.9, 3.0, 3.05])
+    with pytest.raises(SystemExit, match="ns_per_op regression"):
+        mod.check_comparison(args, policy)
+    assert json.loads(summary_file.read_text(encoding="utf-8"))["status"] == "failed"
+
+
+def test_check_comparison_gates_tail_latency_when_throughput_is_flat(repo_root, tmp_path, monkeypatch):
+    mod = load_script_module(repo_root, "scripts/benchmark-quality-check.py", "benchmark_quality_gates")
+
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    write_raw_runs(raw_dir, "baseline", [1000, 1010, 990, 1005, 995], [3.0, 3.1, 2.9, 3.02, 3.05])
+    write_raw_runs(raw_dir, "wire", [1002, 1008, 992, 1001, 996], [6.0, 6.2, 5.8, 6.1, 5.9])
+    monkeypatch.setattr(mod, "ensure_under_results", lambda path, label: path)
+    args = argparse.Namespace(raw_dir=raw_dir, comparison_summary_file=tmp_path / "comparison.json")
+    gates = {
+        "ns_per_op": {"alpha": 0.05, "min_effect_percent": 15.0},
+        "latency_ms_p99": {"alpha": 0.01, "min_effect_percent": 30.0},
+        "latency_ms_max": {"alpha": 0.05, "min_effect_absolute": 1.0},
+        "memory_peak_mb": {"alpha": 0.05, "min_effect_percent": 20.0},
+        "cpu_ms_per_request": {"alpha": 0.05, "min_effect_percent": 15.0, "scope": "reference"},
+    }
+
+    with pytest.raises(SystemExit, match=r"latency_ms_p99 regression 99\.\d+% >= 30\.00%"):
+        mod.check_comparison(args, {"quality": {"comparison": {"gates": gates}}})
+    summary = json.loads((tmp_path / "comparison.json").read_text(encoding="utf-8"))
+    verdicts = {metric: gate["verdict"] for metric, gate in summary["comparisons"][0]["gates"].items()}
+    assert verdicts == {
+        "ns_per_op": "pass",
+        "latency_ms_p99": "fail",
+        "latency_ms_max": "pass",
+        "memory_peak_mb": "insufficient_data",
+    }
+    assert summary["comparisons"][0]["metrics"]["latency_ms_p99"]["p_value"] == pytest.approx(2 / 252)
+
+    # At the default three runs per side no p-value can reach alpha, so the gates report underpowered.
+    write_raw_runs(raw_dir, "baseline", [1000, 1010, 990], [3.0, 3.1, 2.9])
+    write_raw_runs(raw_dir, "wire", [1002, 1008, 992], [6.0, 6.2, 5.8])
+    summary = mod.check_comparison(args, {"quality": {"comparison": {"gates": gates}}})
+    assert summary["status"] == "passed"
+    gates_seen = summary["comparisons"][0]["gates"]
+    assert gates_seen["latency_ms_p99"]["verdict"] == "underpowered"
+    assert gates_seen["latency_ms_p99"]["regression_percent"] == pytest.approx(100.0)
+    assert gates_seen["ns_per_op"]["verdict"] == "underpowered"
+
+
+def test_ci_check_writes_gate_verdicts_before_failing(repo_root, tmp_path, monkeypatch):
+    mod = load_script_module(repo_root, "scripts/benchmark-quality-check.py", "benchmark_quality_ci")
+
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    write_raw_runs(raw_dir, "baseline", [1000, 1010, 990], [3.0, 3.1, 2.9])
+    write_raw_runs(raw_dir, "wire", [1002, 1008, 992], [6.0, 6.2, 5.8])
+
+    class UnvalidatedIndex(mod.RawIndex):
+        # The minimal artifacts above are not schema-complete; this test is about the gates.
+        def refresh(self, extractors, validate=False):
+            return super().refresh(extractors)
+
+    monkeypatch.setattr(mod, "RawIndex", UnvalidatedIndex)
+    monkeypatch.setattr(mod, "ensure_under_results", lambda path, label: path)
+    monkeypatch.setattr(mod, "check_variance", lambda args, policy, raise_on_failure=True: {"status": "passed"})
+    args = argparse.Namespace(
+        raw_dir=raw_dir, policy_file=tmp_path / "policy.json", summary_file=tmp_path / "quality.json",
+        comparison_summary_file=tmp_path / "comparison.json", reference_summary_file=tmp_path / "reference.json",
+        reference_dir=None, history_db=None,
+    )
+    policy = {"quality": {"comparison": {"gates": {"latency_ms_p99": {"alpha": 0.01, "min_effect_percent": 30.0}}}}}
+
+    mod.run_ci_check(args, policy)
+    summary = json.loads((tmp_path / "quality.json").read_text(encoding="utf-8"))
+    assert summary["status"] == "passed"
+    assert summary["underpowered_gates"] == ["wire: latency_ms_p99 vs baseline_framework (alpha=0.01)"]
+
+    write_raw_runs(raw_dir, "baseline", [1000, 1010, 990, 1005, 995], [3.0, 3.1, 2.9, 3.02, 3.05])
+    write_raw_runs(raw_dir, "wire", [1002, 1008, 992, 1001, 996], [6.0, 6.2, 5.8, 6.1, 5.9])
+    with pytest.raises(SystemExit, match="ci-benchmark-quality-check failed: wire: latency_ms_p99"):
+        mod.run_ci_check(args, policy)
+    summary = json.loads((tmp_path / "quality.json").read_text(encoding="utf-8"))
+    assert summary["status"] == "failed"
+    assert [(gate["framework"], gate["metric"], gate["verdict"]) for gate in summary["regression_gates"]] == [
+        ("wire", "latency_ms_p99", "fail"),
+    ]
+
+
+def test_check_benchstat_is_optional_when_not_required(repo_root, tmp_path, monkeypatch):
+    mod = load_script_module(repo_root, "scripts/benchmark-quality-check.py", "benchmark_quality_benchstat")
+
+    monkeypatch.setattr(mod.shutil, "which", lambda name: None)
+    monkeypatch.setattr(mod.subprocess, "run", lambda *a, **k: argparse.Namespace(returncode=1, stdout=""))
+    policy = {"quality": {"benchstat": {"enabled": True}}}
+    args = argparse.Namespace(raw_dir=tmp_path)
+
+    assert mod.check_benchstat(args, policy, required=False) == {"status": "skipped", "reason": "benchstat_not_found"}
+    with pytest.raises(SystemExit, match="benchstat not found"):
+        mod.check_benchstat(args, policy)
+
+
+def test_check_reference_compares_against_last_accepted_history_run(repo_root, tmp_path, monkeypatch):
+    mod = load_script_module(repo_root, "scripts/benchmark-quality-check.py", "benchmark_quality_reference")
+    from benchlib.history import HistoryStore
+
+    accepted_dir = tmp_path / "accepted" / "raw"
+    accepted_dir.mkdir(parents=True)
+    write_raw_runs(accepted_dir, "modkit", [1000, 1010, 990, 1005, 995], [3.0, 3.1, 2.9, 3.02, 3.05])
+    manifest = tmp_path / "accepted" / "environment.manifest.json"
+    manifest.write_text(
+        json.dumps({"generated_at": "2026-01-01T00:00:00+00:00", "fingerprint": {"git": {"commit": "a" * 40}}}),
+        encoding="utf-8",
+    )
+    db = tmp_path / "history.sqlite"
+    with HistoryStore(db) as store:
+        accepted_run = store.ingest(accepted_dir, manifest_path=manifest)
+        store.accept(accepted_run)
+
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    write_raw_runs(raw_dir, "modkit", [890, 900, 880, 895, 885], [3.01, 3.12, 2.95, 3.0, 3.04])
+    write_raw_runs(raw_dir, "fx", [1000, 1010, 990, 1005, 995], [3.0, 3.1, 2.9, 3.02, 3.05])
+    monkeypatch.setattr(mod, "ensure_under_results", lambda path, label: path)
+    gates = {"ns_per_op": {"alpha": 0.05, "min_effect_percent": 5.0}}
+    args = argparse.Namespace(
+        raw_dir=raw_dir, reference_dir=None, history_db=db, reference_summary_file=tmp_path / "reference.json"
+    )
+
+    with pytest.raises(SystemExit, match="modkit: ns_per_op regression 12\\.\\d+% >= 5\\.00%.*vs reference"):
+        mod.check_reference(args, {"quality": {"comparison": {"gates": gates}}})
+    summary = json.loads((tmp_path / "reference.json").read_text(encoding="utf-8"))
+    by_framework = {item["framework"]: item for item in summary["frameworks"]}
+    assert by_framework["fx"] == {"framework": "fx", "status": "skipped", "reason": "no_reference"}
+    assert by_framework["modkit"]["reference"]["run_id"] == accepted_run
+    assert by_framework["modkit"]["reference"]["git_commit"] == "a" * 40
+    assert by_framework["modkit"]["gates"]["ns_per_op"]["verdict"] == "fail"
+
+    args.history_db, args.reference_dir = None, tmp_path / "accepted"
+    with pytest.raises(SystemExit, match="vs reference"):
+        mod.check_reference(args, {"quality": {"comparison": {"gates": gates}}})
+    summary = json.loads((tmp_path / "reference.json").read_text(encoding="utf-8"))
+    assert summary["frameworks"][1]["reference"]["source"] == "directory"
+
+    args.reference_dir = None
+    assert mod.check_reference(args, {})["reason"] == "no_reference_configured"
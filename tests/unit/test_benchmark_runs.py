@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import argparse
+import json
+
+import pytest
+
+from .script_loader import load_script_module
+
+
+def test_run_index_tracks_status_and_promotion_swaps_latest(repo_root, tmp_path):
+    load_script_module(repo_root, "scripts/benchmark-runs.py", "benchmark_runs_cli")
+    from benchlib.runs import finish_run, promote_run, read_index, start_run
+
+    results = tmp_path / "results"
+    legacy = results / "latest" / "raw"
+    legacy.mkdir(parents=True)
+    (legacy / "modkit.json").write_text("{}", encoding="utf-8")
+
+    for run_id in ("run-a", "run-b"):
+        start_run(results, run_id, {"entrypoint": "test", "runs": 3})
+        (results / "runs" / run_id / "raw").mkdir()
+        (results / "runs" / run_id / "raw" / f"{run_id}.json").write_text("{}", encoding="utf-8")
+
+    with pytest.raises(SystemExit, match="only complete runs are promoted"):
+        promote_run(results, "run-a")
+
+    finish_run(results, "run-a", "complete")
+    finish_run(results, "run-b", "failed")
+    promote_run(results, "run-a")
+
+    latest = results / "latest"
+    assert latest.is_symlink()
+    assert (latest / "raw" / "run-a.json").exists()
+
+    index = read_index(results)
+    statuses = {run["run_id"]: run["status"] for run in index["runs"]}
+    legacy_id = next(run_id for run_id in statuses if run_id.startswith("legacy-"))
+    assert statuses == {"run-a": "complete", "run-b": "failed", legacy_id: "complete"}
+    assert (results / "runs" / legacy_id / "raw" / "modkit.json").exists()
+    assert index["latest"] == "run-a"
+    assert index["runs"][0]["config"] == {"entrypoint": "test", "runs": 3}
+
+    promote_run(results, "run-b", force=True)
+    assert (latest / "raw" / "run-b.json").exists()
+    assert read_index(results)["latest"] == "run-b"
+    assert not list(results.glob(".latest.*"))
+
+
+def test_run_ids_and_run_scoped_paths_stay_under_their_root(repo_root, tmp_path):
+    mod = load_script_module(repo_root, "scripts/benchmark-orchestrate.py", "benchmark_orchestrate_runs")
+    from benchlib.runs import run_dir, start_run
+
+    for bad in ("../escape", "", ".hidden", "a/b"):
+        with pytest.raises(SystemExit, match="Invalid run id"):
+            run_dir(tmp_path, bad)
+    assert mod.resolve_run_id("") is None
+    assert mod.resolve_run_id("auto") != mod.resolve_run_id("auto")
+
+    root = run_dir(tmp_path, "nightly-1")
+    args = argparse.Namespace(raw_dir=None, results_dir=None, fingerprint_file=None, manifest_file=None)
+    raw_dir, fingerprint_file, manifest_file = mod.resolve_paths(args, root)
+    assert raw_dir == root / "raw"
+    assert manifest_file == root / "environment.manifest.json"
+
+    args.raw_dir = tmp_path / "runs" / "other" / "raw"
+    with pytest.raises(SystemExit, match="must be under"):
+        mod.resolve_paths(args, root)
+
+    start_run(tmp_path, "nightly-1", {})
+    start_run(tmp_path, "nightly-1", {"reopened": True})
+    index = json.loads((tmp_path / "runs" / "index.json").read_text(encoding="utf-8"))
+    assert len(index["runs"]) == 1
+    assert index["runs"][0]["config"] == {"reopened": True}
+
+
+def test_unscoped_sessions_detach_a_promoted_latest_instead_of_writing_into_the_run(repo_root, tmp_path, capsys,
+                                                                                   monkeypatch):
+    mod = load_script_module(repo_root, "scripts/benchmark-orchestrate.py", "benchmark_orchestrate_detach")
+    from benchlib.runs import detach_latest, finish_run, promote_run, read_index, start_run
+
+    results = tmp_path / "results"
+    (results / "latest").mkdir(parents=True)
+    (results / "latest" / "report.md").write_text("old", encoding="utf-8")
+    start_run(results, "run-a", {"runs": 3})
+    (results / "runs" / "run-a" / "raw").mkdir()
+    (results / "runs" / "run-a" / "raw" / "modkit.json").write_text("{}", encoding="utf-8")
+    finish_run(results, "run-a", "complete")
+    promote_run(results, "run-a")
+    assert "Moved the existing results/latest directory to runs/legacy-" in capsys.readouterr().err
+
+    latest = results / "latest"
+    assert detach_latest(results, [tmp_path / "elsewhere"]) is None
+    assert latest.is_symlink()
+
+    seen = {}
+    monkeypatch.setattr(mod, "RESULTS_DIR", results)
+    monkeypatch.setattr(mod, "RESULTS_ROOT", latest)
+    monkeypatch.setattr(mod, "measure_all", lambda args, frameworks, root: seen.update(root=root))
+    mod.run(argparse.Namespace(frameworks="modkit", run_id=None))
+
+    assert seen["root"] == latest
+    assert latest.is_dir() and not latest.is_symlink()
+    assert (latest / "raw" / "modkit.json").exists()
+    assert "replaced it with a copy" in capsys.readouterr().err
+    (latest / "raw" / "nestjs.json").write_text("{}", encoding="utf-8")
+    assert not (results / "runs" / "run-a" / "raw" / "nestjs.json").exists()
+    index = read_index(results)
+    assert index["latest"] is None
+    assert {run["run_id"]: run["status"] for run in index["runs"]}["run-a"] == "complete"
+    assert detach_latest(results) is None
+    assert not list(results.glob(".latest.*"))
@@ -28,3 +28,30 @@ def test_ensure_under_results_rejects_external_path(repo_root, tmp_path):
 
     with pytest.raises(SystemExit, match="Refusing path outside results/latest"):
         mod.ensure_under_results(tmp_path / "bad.json")
+
+
+def test_write_json_safe_validates_before_detaching_latest(repo_root, tmp_path, monkeypatch):
+    mod = load_script_module(repo_root, "scripts/environment-manifest.py", "environment_manifest_detach")
+    from benchlib.runs import finish_run, promote_run, start_run
+
+    results = tmp_path / "results"
+    start_run(results, "run-a", {"runs": 3})
+    (results / "runs" / "run-a" / "raw").mkdir()
+    (tmp_path / "outside").mkdir()
+    (results / "runs" / "run-a" / "escape").symlink_to(tmp_path / "outside")
+    finish_run(results, "run-a", "complete")
+    promote_run(results, "run-a")
+    latest = results / "latest"
+    monkeypatch.setattr(mod, "RESULTS_DIR", results)
+    monkeypatch.setattr(mod, "RESULTS_ROOT", latest)
+    monkeypatch.setattr(mod, "RUNS_ROOT", (results / "runs").resolve())
+
+    with pytest.raises(SystemExit, match="Refusing path outside results/latest"):
+        mod.write_json_safe(latest / "escape" / "manifest.json", {})
+    assert latest.is_symlink()
+    assert not (tmp_path / "outside" / "manifest.json").exists()
+
+    mod.write_json_safe(latest / "manifest.json", {"ok": True})
+    assert latest.is_dir() and not latest.is_symlink()
+    assert (latest / "manifest.json").exists()
+    assert not (results / "runs" / "run-a" / "manifest.json").exists()
@@ -5,6 +5,8 @@ import json
 import shutil
 from contextlib import redirect_stdout
 
+import pytest
+
 from .script_loader import load_script_module
 
 
@@ -53,3 +55,325 @@ def test_write_report_outputs_expected_sections(repo_root, fixture_root, tmp_pat
     assert "## Fairness Disclaimer" in content
     assert "| modkit | ok | 600.00" in content
     assert "Parity failures invalidate performance interpretation" in content
+
+
+def test_write_report_includes_scaling_table(repo_root, fixture_root, tmp_path):
+    mod = load_script_module(repo_root, "scripts/generate-report.py", "generate_report_scaling")
+
+    summary = json.loads((fixture_root / "summary" / "expected-summary.json").read_text(encoding="utf-8"))
+    summary["scaling"] = {
+        "cpu_steps": [1, 2],
+        "base_concurrency": 4,
+        "requests_per_cpu": 300,
+        "endpoint": "/health",
+        "frameworks": {
+            "modkit": {
+                "steps": [
+                    {"cpus": 1, "rps": 500.0, "speedup": 1.0, "efficiency": 1.0},
+                    {"cpus": 2, "rps": 900.0, "speedup": 1.8, "efficiency": 0.9},
+                    {
+                        "cpus": 4, "rps": 1000.0, "speedup": 2.0, "efficiency": 0.5,
+                        "client_cpu_utilisation": 0.97, "client_bound": True,
+                    },
+                ],
+                "amdahl": {"sigma": 0.1111, "r_squared": 1.0},
+                "usl": None,
+            }
+        },
+    }
+    mod.REPORT_PATH = tmp_path / "report.md"
+    mod.write_report(summary)
+
+    content = mod.REPORT_PATH.read_text(encoding="utf-8")
+    assert "## Scaling Efficiency" in content
+    assert "| modkit | 2 | 900.00 | 1.80x | 90.0% | - |" in content
+    assert "| modkit | 4 | 1000.00 | 2.00x | 50.0% | 0.97 (client-bound) |" in content
+    assert "left out of the fits" in content
+    assert "| modkit | 0.1111 | - | - | - | - |" in content
+
+
+def test_build_summary_adds_bootstrap_confidence_intervals(repo_root, fixture_root, tmp_path):
+    mod = load_script_module(repo_root, "scripts/generate-report.py", "generate_report_ci")
+
+    row = json.loads((fixture_root / "raw" / "modkit-ok.json").read_text(encoding="utf-8"))
+    row["_source_file"] = "modkit-ok.json"
+    summary = mod.build_summary([row])
+
+    intervals = summary["targets"][0]["confidence_intervals"]
+    assert intervals["confidence"] == 0.95
+    assert intervals["metrics"]["rps"] == {"lower": 576.9, "upper": 625.0, "basis": "run_medians", "samples": 3}
+
+    mod.REPORT_PATH = tmp_path / "report.md"
+    mod.write_report(summary)
+    content = mod.REPORT_PATH.read_text(encoding="utf-8")
+    assert "| modkit | ok | 600.00 [576.90, 625.00] | 1.50 [1.40, 1.60] |" in content
+
+
+def test_bootstrap_ci_covers_pooled_percentiles_from_histograms():
+    from benchlib.histogram import LatencyHistogram
+    from benchlib.stats import summarize_confidence_intervals
+
+    histogram = LatencyHistogram.from_seconds([value / 1000 for value in range(1, 1001)])
+    run_stats = [{"rps": 100.0, "latency_ms_p50": 500.0, "latency_ms_p95": 950.0, "latency_ms_p99": 990.0}]
+    intervals = summarize_confidence_intervals(run_stats, sorted_latency_ms=histogram.sorted_ms())
+
+    p99 = intervals["metrics"]["pooled_latency_ms_p99"]
+    assert p99["basis"] == "request_samples"
+    assert p99["samples"] == 1000
+    assert p99["lower"] < 990.0 < p99["upper"]
+    assert intervals["metrics"]["rps"] == {"lower": 100.0, "upper": 100.0, "basis": "run_medians", "samples": 1}
+
+
+def test_pooled_latency_merges_non_excluded_run_histograms(repo_root, tmp_path):
+    mod = load_script_module(repo_root, "scripts/generate-report.py", "generate_report_pooled")
+    from benchlib.histogram import LatencyHistogram
+    from benchlib.measurement import build_result_payload
+
+    fast = [0.001] * 990 + [0.010] * 10
+    slow = [0.002] * 1000
+    run_stats = [
+        {"rps": 1000.0, "latency_ms_p50": 1.0, "latency_ms_p95": 1.0, "latency_ms_p99": 10.0,
+         "latency_histogram": LatencyHistogram.from_seconds(fast).to_dict()},
+        {"rps": 1000.0, "latency_ms_p50": 2.0, "latency_ms_p95": 2.0, "latency_ms_p99": 2.0,
+         "latency_histogram": LatencyHistogram.from_seconds(slow).to_dict()},
+    ]
+    payload = build_result_payload(
+        "modkit", "http://localhost:3001", "/health", 0, 1000, 2, run_stats, None, "passed", "legacy", {}
+    )
+    pooled = payload["benchmark"]["pooled_latency_ms"]
+    assert pooled["count"] == 2000
+    assert abs(pooled["p50"] - 2.0) < 0.02
+    assert abs(pooled["p99"] - 2.0) < 0.02
+    assert abs(pooled["p99_9"] - 10.0) < 0.1
+    assert pooled["max"] == 10.0
+
+    payload["_source_file"] = "modkit.json"
+    summary = mod.build_summary([payload])
+    assert summary["targets"][0]["pooled_latency_ms"] == pooled
+    mod.REPORT_PATH = tmp_path / "report.md"
+    mod.write_report(summary)
+    content = mod.REPORT_PATH.read_text(encoding="utf-8")
+    assert "## Pooled Latency (ms)" in content
+    assert "| modkit | 2000 | 2.0" in content
+
+
+def test_payload_targets_get_a_throughput_section(repo_root, tmp_path):
+    mod = load_script_module(repo_root, "scripts/generate-report.py", "generate_report_payload")
+    from benchlib.measurement import build_result_payload
+
+    run_stats = [
+        {"rps": 2000.0, "latency_ms_p50": 1.0, "latency_ms_p95": 2.0, "latency_ms_p99": 3.0,
+         "request_bytes_per_second": 2000.0 * 16384, "response_bytes_per_second": 2000.0 * 64},
+    ]
+    payload = build_result_payload(
+        "modkit", "http://localhost:3001", "/users", 0, 1000, 1, run_stats, None, "passed", "legacy", {}
+    )
+    payload["benchmark"]["payload"] = {"method": "POST", "bytes": 16384, "content_type": "application/json"}
+    payload["_source_file"] = "modkit.json"
+
+    summary = mod.build_summary([payload])
+    assert summary["targets"][0]["payload"]["request_bytes_per_second"] == 2000.0 * 16384
+    mod.REPORT_PATH = tmp_path / "report.md"
+    mod.write_report(summary)
+    content = mod.REPORT_PATH.read_text(encoding="utf-8")
+    assert "## Payload Throughput" in content
+    assert "| modkit | POST | 16384 | 2000.00 | 1.000 | 2.000 | 31.25 | 0.12 |" in content
+
+
+def test_session_targets_get_per_step_latency_rows(repo_root, tmp_path):
+    mod = load_script_module(repo_root, "scripts/generate-report.py", "generate_report_sessions")
+    from benchlib.measurement import build_result_payload
+
+    run_stats = [{"rps": 400.0, "latency_ms_p50": 1.0, "latency_ms_p95": 2.0, "latency_ms_p99": 3.0}]
+    payload = build_result_payload(
+        "modkit", "http://localhost:3001", "session:crud", 0, 100, 1, run_stats, None, "passed", "legacy", {}
+    )
+    latency = {"count": 100, "p50": 1.5, "p90": 2.0, "p95": 2.5, "p99": 3.0, "max": 4.0}
+    payload["benchmark"]["sessions"] = {
+        "script": "crud",
+        "virtual_users": 8,
+        "steps": [{"name": "create", "method": "POST", "path": "/users", "requests": 101, "failures": 1,
+                   "latency_ms": latency}],
+        "session": {"sessions": 101, "completed": 100, "failures": 1, "latency_ms": None},
+    }
+    payload["_source_file"] = "modkit.json"
+
+    summary = mod.build_summary([payload])
+    assert summary["targets"][0]["sessions"]["virtual_users"] == 8
+    mod.REPORT_PATH = tmp_path / "report.md"
+    mod.write_report(summary)
+    content = mod.REPORT_PATH.read_text(encoding="utf-8")
+    assert "## Session Latency (ms)" in content
+    assert "| modkit | crud | POST /users | 101 | 1 | 1.500 | 2.500 | 3.000 | 4.000 |" in content
+    assert "| modkit | crud | end-to-end session | 101 | 1 | - | - | - | - |" in content
+
+
+def test_request_sample_sidecar_is_verified_and_summarized(repo_root, fixture_root, tmp_path):
+    from benchlib.samples import SampleFile, SampleWriter, hampel_flagged_by_run
+
+    mod = load_script_module(repo_root, "scripts/generate-report.py", "generate_report_samples")
+    raw_dir = tmp_path / "raw"
+    base = 1_700_000_000_000_000_000
+    with SampleWriter(raw_dir / "modkit.samples.bin") as writer:
+        for index in range(20):
+            latency = 9_000_000 if index == 12 else 1_000_000 + index
+            writer.append(index // 10, base + index * 2_000_000, latency, 500 if index == 3 else 200, 128)
+        reference = writer.close()
+
+    with SampleFile(raw_dir / "modkit.samples.bin") as samples:
+        assert len(samples) == 20
+        assert samples.latencies_ns()[12] == 9_000_000
+        assert list(samples.send_offsets_ns())[:2] == [0, 2_000_000]
+        assert hampel_flagged_by_run(samples, half_window=3, threshold=3.0) == {0: 0, 1: 1}
+
+    row = json.loads((fixture_root / "raw" / "modkit-ok.json").read_text(encoding="utf-8"))
+    row["benchmark"]["samples"] = reference
+    row["_source_file"] = "modkit.json"
+    mod.RAW_DIR = raw_dir
+    summary = mod.build_summary([row])
+    assert summary["targets"][0]["request_samples"] == {
+        "records": 20,
+        "failed": 1,
+        "bytes": 2560,
+        "slowest": {"run_index": 1, "send_offset_ms": 24.0, "latency_ms": 9.0, "status": 200},
+    }
+    mod.REPORT_PATH = tmp_path / "report.md"
+    mod.write_report(summary)
+    assert "| modkit | 20 | 1 | 0.00 | 9.000 | run 1, t+0.024s, status 200 |" in mod.REPORT_PATH.read_text(
+        encoding="utf-8"
+    )
+
+    with (raw_dir / "modkit.samples.bin").open("ab") as handle:
+        handle.write(b"\0")
+    with pytest.raises(SystemExit, match="does not match the sha256"):
+        mod.build_summary([row])
+
+
+def test_raw_index_reparses_only_changed_artifacts(repo_root, fixture_root, tmp_path):
+    mod = load_script_module(repo_root, "scripts/generate-report.py", "generate_report_index")
+    from benchlib.raw_index import RawIndex
+
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    shutil.copy(fixture_root / "raw" / "modkit-ok.json", raw_dir / "modkit.json")
+    shutil.copy(fixture_root / "raw" / "nestjs-skipped-health.json", raw_dir / "nestjs.json")
+    mod.RAW_DIR = raw_dir
+
+    first = mod.load_indexed_targets()
+    assert [target["framework"] for target in first] == ["modkit", "nestjs"]
+    assert (tmp_path / "raw-index.json").exists()
+
+    payload = json.loads((raw_dir / "modkit.json").read_text(encoding="utf-8"))
+    payload["benchmark"]["median"]["rps"] = 700.0
+    (raw_dir / "modkit.json").write_text(json.dumps(payload), encoding="utf-8")
+    (raw_dir / "nestjs.json").touch()
+    (raw_dir / "nestjs.json").rename(raw_dir / "nestjs-renamed.json")
+
+    index = RawIndex(raw_dir, repo_root / "schemas" / "benchmark-raw-v1.schema.json")
+    entries = index.refresh(
+        {"summary_target": lambda path, raw: mod.build_target(dict(raw, _source_file=path.name))}, validate=True
+    )
+    assert index.stats == {"reused": 0, "parsed": 2, "removed": 1}
+    assert entries[0][1]["summary_target"]["median"]["rps"] == 700.0
+
+    again = RawIndex(raw_dir, repo_root / "schemas" / "benchmark-raw-v1.schema.json")
+    again.refresh({"summary_target": lambda path, raw: pytest.fail("unchanged artifact re-parsed")}, validate=True)
+    assert again.stats == {"reused": 2, "parsed": 0, "removed": 0}
+
+
+def test_write_html_report_renders_inline_charts_and_disclaimers(repo_root, fixture_root, tmp_path):
+    import xml.etree.ElementTree as ET
+
+    from benchlib.histogram import LatencyHistogram
+
+    mod = load_script_module(repo_root, "scripts/generate-report.py", "generate_report_html")
+
+    payload = json.loads((fixture_root / "raw" / "modkit-ok.json").read_text(encoding="utf-8"))
+    for index, run in enumerate(payload["benchmark"]["run_stats"]):
+        run["latency_histogram"] = LatencyHistogram.from_seconds(
+            [0.001 + (i % 100) * 0.00001 + (0.02 if i % 500 == 0 else 0) for i in range(2000)]
+        ).to_dict()
+        run["memory_peak_mb"] = 40.0 + index
+    payload["benchmark"]["quality"]["excluded_samples"] = [{"run_index": 2, "reasons": ["rps_outlier"]}]
+    series = mod.build_chart_series(payload)
+    assert series["runs"][2]["excluded"] is True
+    curve = series["latency_curve_ms"]
+    assert curve[0][0] == 0.0 and curve[-1][0] == 1.0
+    assert [q for q, _ in curve] == sorted(q for q, _ in curve)
+    assert max(q for q, _ in curve[:-1]) >= 0.999
+
+    soak_dir = tmp_path / "soak"
+    soak_dir.mkdir()
+    (soak_dir / "modkit.jsonl").write_text(
+        "\n".join(
+            json.dumps({"type": "window", "index": i, "elapsed_seconds": i * 10.0, "rps": 500.0, "memory_mb": 50.0 + i})
+            for i in range(1, 4)
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    mod.SOAK_DIR = soak_dir
+    mod.HTML_REPORT_PATH = tmp_path / "report.html"
+    expected = json.loads((fixture_root / "summary" / "expected-summary.json").read_text(encoding="utf-8"))
+    mod.write_html_report(expected, [series], soak=mod.load_soak_series())
+
+    content = mod.HTML_REPORT_PATH.read_text(encoding="utf-8")
+    assert "<script" not in content and "<link" not in content
+    for heading in ("Latency CDF", "Latency by percentile", "Throughput per Run", "Peak memory per run", "Soak memory"):
+        assert heading in content
+    assert content.count('class="excluded"') == 1
+    assert "<h2>Fairness Disclaimer</h2>" in content
+    assert "Parity failures invalidate performance interpretation" in content
+    svgs = content.split("<svg")[1:]
+    assert len(svgs) == 6
+    for svg in svgs:
+        ET.fromstring("<svg" + svg.split("</svg>")[0] + "</svg>")
+
+
+def test_baseline_comparison_reports_deltas_with_intervals_and_significance(repo_root, fixture_root, tmp_path):
+    from benchlib.validation import validate_summary_payload
+
+    mod = load_script_module(repo_root, "scripts/generate-report.py", "generate_report_deltas")
+
+    template = json.loads((fixture_root / "raw" / "modkit-ok.json").read_text(encoding="utf-8"))
+
+    def row(framework, rps_values, p95):
+        payload = json.loads(json.dumps(template))
+        payload["framework"] = framework
+        payload["benchmark"]["run_stats"] = [
+            {"requests": 300, "rps": rps, "latency_ms_p50": 1.0, "latency_ms_p95": p95 + i * 0.01, "latency_ms_p99": 3.0}
+            for i, rps in enumerate(rps_values)
+        ]
+        payload["_source_file"] = f"{framework}.json"
+        return payload
+
+    rows = [
+        row("baseline", [1000, 1010, 990, 1005, 995, 1002], 2.0),
+        row("modkit", [1200, 1210, 1190, 1205, 1195, 1202], 2.0),
+        row("fx", [1000, 1020], 2.0),
+    ]
+    samples = {r["framework"]: mod.build_run_samples(r) for r in rows}
+    comparison = mod.build_baseline_comparison(samples)
+    assert comparison["status"] == "ok"
+    modkit, fx = comparison["comparisons"]
+    rps = modkit["metrics"]["rps"]
+    assert rps["delta_percent"] == pytest.approx(20.0, abs=1.0)
+    assert rps["delta_percent_ci"][0] > 0 and rps["significant"] and not rps["underpowered"]
+    assert "cpu_ms_per_request" not in modkit["metrics"]
+    assert fx["metrics"]["rps"]["underpowered"]
+
+    summary = mod.assemble_summary([mod.build_target(r) for r in rows], comparison=comparison)
+    validate_summary_payload(summary, repo_root / "schemas" / "benchmark-summary-v1.schema.json", "summary.json")
+
+    mod.REPORT_PATH = tmp_path / "report.md"
+    mod.write_report(summary)
+    content = mod.REPORT_PATH.read_text(encoding="utf-8")
+    assert "## Comparison vs Baseline (baseline)" in content
+    assert "| Framework | RPS | P50 | P95 | P99 |" in content
+    modkit_line = next(line for line in content.splitlines() if line.startswith("| modkit | +"))
+    assert modkit_line.split(" | ")[1].endswith(" sig")
+    assert "underpowered" in [line for line in content.splitlines() if line.startswith("| fx | ")][-1]
+
+    missing = mod.build_baseline_comparison({"modkit": samples["modkit"]})
+    assert missing == {**missing, "status": "skipped", "reason": "baseline_missing"}
+    assert "Not computed" in "\n".join(mod.baseline_comparison_lines(missing))
@@ -66,3 +66,27 @@ def test_validate_summary_rejects_ok_target_without_uncertainty(repo_root, tmp_p
 
     with pytest.raises(SystemExit, match="required property"):
         mod.validate_summary(summary, repo_root / "schemas" / "benchmark-summary-v1.schema.json")
+
+
+def test_validate_raw_dir_caches_validators_and_payloads(repo_root, fixture_root, tmp_path, monkeypatch):
+    from benchlib import validation
+
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    for index in range(4):
+        shutil.copy(fixture_root / "raw" / "modkit-ok.json", raw_dir / f"modkit-{index}.json")
+    schema = repo_root / "schemas" / "benchmark-raw-v1.schema.json"
+    copied_schema = tmp_path / "raw.schema.json"
+    shutil.copy(schema, copied_schema)
+
+    assert validation.compiled_schema(schema, "Raw") is validation.compiled_schema(copied_schema, "Raw")
+
+    monkeypatch.setattr(validation, "PARALLEL_MIN_FILES", 2)
+    rows = validation.validate_raw_dir(raw_dir, schema, workers=2)
+    assert [path.name for path, _ in rows] == [f"modkit-{index}.json" for index in range(4)]
+    assert validation.read_payload(raw_dir / "modkit-2.json") is rows[2][1]
+
+    shutil.copy(fixture_root / "raw" / "modkit-missing-required.json", raw_dir / "modkit-1.json")
+    shutil.copy(fixture_root / "raw" / "modkit-missing-required.json", raw_dir / "modkit-3.json")
+    with pytest.raises(SystemExit, match="modkit-1.json"):
+        validation.validate_raw_dir(raw_dir, schema, workers=2)